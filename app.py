@@ -1,10 +1,13 @@
 import os
+import gzip
+import hashlib
 import json
 import logging
 import time
 from flask import Flask, jsonify, request, Response, stream_with_context
 from dotenv import load_dotenv
 
+from bigas.json_provider import OrjsonProvider
 from bigas.registry import registry
 
 # Configure logging
@@ -13,6 +16,12 @@ logger = logging.getLogger(__name__)
 
 SSE_KEEPALIVE_INTERVAL = 25
 
+# The manifest only changes on redeploy, so shared caches (Cloud Run ingress, CDNs) may keep it
+# for an hour and serve a stale copy while revalidating against the ETag.
+MANIFEST_CACHE_CONTROL = os.environ.get(
+    "MANIFEST_CACHE_CONTROL", "public, max-age=3600, stale-while-revalidate=86400"
+)
+
 
 def _jsonrpc_result(request_id, result):
     return {"jsonrpc": "2.0", "id": request_id, "result": result}
@@ -77,6 +86,12 @@ def create_app():
         logger.warning("Secrets loader failed (continuing with existing env): %s", e)
 
     app = Flask(__name__)
+    # orjson-backed jsonify / request.get_json (stdlib json when orjson is not installed).
+    app.json = OrjsonProvider(app)
+    # Responses keep handler key order and are always compact; sorting large report payloads
+    # on every jsonify call is wasted work.
+    app.json.sort_keys = False
+    app.json.compact = True
 
     # Check deployment mode
     deployment_mode = os.environ.get("DEPLOYMENT_MODE", "standalone")
@@ -150,7 +165,7 @@ def create_app():
             )
             return jsonify({"detail": "Invalid or missing access key"}), 401
 
-    @app.route('/', methods=['GET'])
+    @app.route('/', methods=['GET'], provide_automatic_options=False)
     def health_check():
         """Health check endpoint for Cloud Run startup probes."""
         return jsonify({"status": "healthy", "service": "bigas-core"})
@@ -160,28 +175,41 @@ def create_app():
         """Return provider discovery status for all domains."""
         return jsonify(registry.status())
 
-    @app.route('/mcp/manifest', methods=['GET'])
-    def combined_manifest():
-        """
-        Dynamically generates a combined manifest from all registered resources.
-        """
+    # The manifests are static for the lifetime of the process, so the combined manifest is
+    # serialized (and gzip-compressed) once and the bytes are reused for every request.
+    manifest_cache = {}
+
+    def _combined_manifest_payload():
+        """Return (manifest, json_bytes, gzip_bytes, etag) for the combined manifest."""
+        if manifest_cache:
+            return (
+                manifest_cache["manifest"],
+                manifest_cache["body"],
+                manifest_cache["gzip"],
+                manifest_cache["etag"],
+            )
+
         marketing_manifest = {}
         product_manifest = {}
         cto_manifest = {}
+        complete = True
 
         try:
             marketing_manifest = get_marketing_manifest() or {}
         except Exception:
+            complete = False
             logger.exception("Failed to build marketing manifest")
 
         try:
             product_manifest = get_product_manifest() or {}
         except Exception:
+            complete = False
             logger.exception("Failed to build product manifest")
 
         try:
             cto_manifest = get_cto_manifest() or {}
         except Exception:
+            complete = False
             logger.exception("Failed to build CTO manifest")
 
         # Combine the tools from all manifests
@@ -198,7 +226,37 @@ def create_app():
             "description": "A multi-resource AI agent for marketing, product, and CTO (code review) analytics.",
             "tools": all_tools
         }
-        return jsonify(manifest)
+        body = (app.json.dumps(manifest) + "\n").encode("utf-8")
+        gz = gzip.compress(body, compresslevel=6)
+        # Don't pin a partial manifest if one of the resources failed to build.
+        etag = hashlib.sha256(body).hexdigest()[:16]
+        if complete:
+            manifest_cache.update(manifest=manifest, body=body, gzip=gz, etag=etag)
+        return manifest, body, gz, etag
+
+    @app.route('/mcp/manifest', methods=['GET'], provide_automatic_options=False, strict_slashes=False)
+    def combined_manifest():
+        """
+        Dynamically generates a combined manifest from all registered resources.
+
+        Repeat pollers can send If-None-Match and get an empty 304 back.
+        """
+        _, body, gz, etag = _combined_manifest_payload()
+        use_gzip = "gzip" in (request.headers.get("Accept-Encoding") or "").lower()
+        if use_gzip:
+            # Each encoding is a distinct representation, so it gets its own validator.
+            etag = f"{etag}-gz"
+        headers = {
+            "ETag": f'"{etag}"',
+            "Vary": "Accept-Encoding",
+            "Cache-Control": MANIFEST_CACHE_CONTROL,
+        }
+        if request.if_none_match.contains(etag):
+            return Response(status=304, headers=headers)
+        if use_gzip:
+            headers["Content-Encoding"] = "gzip"
+            return Response(gz, mimetype="application/json", headers=headers)
+        return Response(body, mimetype="application/json", headers=headers)
 
     @app.route('/mcp', methods=['GET', 'POST'])
     def mcp_endpoint():
@@ -262,7 +320,7 @@ def create_app():
             return "", 204
 
         if method == "tools/list":
-            manifest = combined_manifest().get_json() or {}
+            manifest = _combined_manifest_payload()[0]
             tools = []
             for tool in manifest.get("tools", []):
                 if not isinstance(tool, dict):
@@ -283,7 +341,7 @@ def create_app():
             if not tool_name:
                 return jsonify(_jsonrpc_error(request_id, -32602, "Missing tool name in tools/call"))
 
-            manifest = combined_manifest().get_json() or {}
+            manifest = _combined_manifest_payload()[0]
             manifest_tools = manifest.get("tools", [])
             selected = next((t for t in manifest_tools if isinstance(t, dict) and t.get("name") == tool_name), None)
             if not selected:
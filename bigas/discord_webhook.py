@@ -4,7 +4,7 @@ from __future__ import annotations
 import logging
 import os
 import time
-from typing import Optional
+from typing import Iterable, Optional
 
 import requests
 
@@ -12,6 +12,20 @@ logger = logging.getLogger(__name__)
 
 DISCORD_HTTP_TIMEOUT = int(os.environ.get("DISCORD_HTTP_TIMEOUT", "10"))
 
+# One keep-alive session for all webhook posts, so the parts of a multi-part message
+# reuse the same TLS connection instead of handshaking per part.
+_session = requests.Session()
+
+
+def _rate_limit_wait(response) -> float:
+    """Seconds to wait before the next post when Discord reports the bucket as exhausted."""
+    if response.headers.get("X-RateLimit-Remaining") != "0":
+        return 0.0
+    try:
+        return min(max(float(response.headers.get("X-RateLimit-Reset-After") or "0"), 0.0), 5.0)
+    except ValueError:
+        return 0.5
+
 
 def post_to_discord(webhook_url: Optional[str], message: str) -> bool:
     """
@@ -19,7 +33,8 @@ def post_to_discord(webhook_url: Optional[str], message: str) -> bool:
     Returns True if the request succeeded (HTTP 204), False otherwise.
 
     Retries briefly on HTTP 429 so multi-part posts from post_long_to_discord
-    are less likely to drop continuation chunks.
+    are less likely to drop continuation chunks, and waits out an exhausted
+    rate-limit bucket (X-RateLimit-Remaining: 0) before returning.
 
     NOTE: For longer, multi-part messages use post_long_to_discord instead.
     """
@@ -36,13 +51,16 @@ def post_to_discord(webhook_url: Optional[str], message: str) -> bool:
     data = {"content": message}
     for _attempt in range(4):
         try:
-            response = requests.post(
+            response = _session.post(
                 webhook_url,
                 json=data,
                 timeout=DISCORD_HTTP_TIMEOUT,
             )
             if response.status_code == 204:
                 logger.info("Successfully posted to Discord")
+                wait = _rate_limit_wait(response)
+                if wait:
+                    time.sleep(wait)
                 return True
             if response.status_code == 429:
                 retry_after = 1.0
@@ -67,7 +85,8 @@ def post_long_to_discord(webhook_url: Optional[str], text: str, chunk_size: int
     messages that respect Discord's 2000 character limit.
 
     Splits on newline boundaries where possible to keep sections readable.
-    Paces posts slightly to stay under Discord webhook rate limits.
+    Parts are posted in order over one keep-alive connection; pacing follows
+    Discord's rate-limit headers rather than a fixed delay between parts.
     """
     if not webhook_url or webhook_url.strip() == "" or webhook_url.startswith("placeholder"):
         logger.info("Discord webhook URL not provided or is placeholder, skipping Discord notification")
@@ -92,7 +111,44 @@ def post_long_to_discord(webhook_url: Optional[str], text: str, chunk_size: int
     if current_lines:
         parts.append("\n".join(current_lines))
 
-    for i, part in enumerate(parts):
+    for part in parts:
         post_to_discord(webhook_url, part)
-        if i + 1 < len(parts):
-            time.sleep(0.45)
+
+
+def stream_long_to_discord(
+    webhook_url: Optional[str],
+    chunks: Iterable[str],
+    *,
+    header: str = "",
+    footer: str = "",
+    chunk_size: int = 1800,
+) -> str:
+    """
+    Post text to Discord while it is still being produced (e.g. streamed LLM tokens).
+
+    Whenever the buffered text crosses chunk_size, everything up to the last newline
+    is posted so uploads overlap with generation; the remainder and footer are posted
+    once chunks is exhausted. Returns the concatenated chunk text (without header/footer).
+    """
+    enabled = bool(webhook_url) and webhook_url.strip() != "" and not webhook_url.startswith("placeholder")
+    if not enabled:
+        logger.info("Discord webhook URL not provided or is placeholder, skipping Discord notification")
+
+    pieces = []
+    buffer = header
+    for chunk in chunks:
+        pieces.append(chunk)
+        if not enabled:
+            continue
+        buffer += chunk
+        while len(buffer) > chunk_size:
+            cut = buffer.rfind("\n", 0, chunk_size)
+            if cut <= 0:
+                cut = chunk_size
+            post_to_discord(webhook_url, buffer[:cut])
+            buffer = buffer[cut:].lstrip("\n")
+
+    text = "".join(pieces).strip()
+    if enabled:
+        post_long_to_discord(webhook_url, buffer.rstrip() + footer, chunk_size=chunk_size)
+    return text
@@ -0,0 +1,45 @@
+"""Flask JSON provider that encodes and decodes with orjson when it is installed."""
+from __future__ import annotations
+
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    DefaultJSONProvider with orjson for jsonify / request.get_json.
+
+    Values orjson does not handle natively (Decimal, and dates, which Flask renders as HTTP
+    dates) go through Flask's own `default`, so output matches the stdlib provider apart
+    from non-ASCII text being emitted as UTF-8 rather than \\u escapes. Falls back to the
+    stdlib provider when orjson is missing or stdlib-only keyword arguments are passed.
+    """
+
+    def _orjson_option(self) -> int:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if orjson is None or set(kwargs) - {"separators"}:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._orjson_option()).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        if orjson is None or not self.compact:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self._orjson_option()) + b"\n"
+        return self._app.response_class(body, mimetype=self.mimetype)
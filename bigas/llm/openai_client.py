@@ -1,12 +1,30 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import hashlib
+import threading
+from typing import Any, Dict, Iterator, List, Optional
 
 import openai
 
 from bigas.llm.client import LLMClient
 from bigas.llm.completion import LLMCompletion
 
+# One openai.OpenAI per API key for the life of the process, so its pooled HTTP
+# connections (and TLS sessions) are reused across requests. Keyed by a hash so
+# rotated or per-tenant keys get their own client.
+_OPENAI_CLIENTS: Dict[str, openai.OpenAI] = {}
+_OPENAI_CLIENTS_LOCK = threading.Lock()
+
+
+def _shared_openai_client(api_key: str) -> openai.OpenAI:
+    key = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+    with _OPENAI_CLIENTS_LOCK:
+        client = _OPENAI_CLIENTS.get(key)
+        if client is None:
+            client = openai.OpenAI(api_key=api_key)
+            _OPENAI_CLIENTS[key] = client
+        return client
+
 
 class OpenAILLMClient(LLMClient):
     """
@@ -14,7 +32,7 @@ class OpenAILLMClient(LLMClient):
     """
 
     def __init__(self, *, api_key: str, model: str) -> None:
-        self._client = openai.OpenAI(api_key=api_key)
+        self._client = _shared_openai_client(api_key)
         self._model = model
 
     @property
@@ -57,3 +75,27 @@ class OpenAILLMClient(LLMClient):
             text=(choice.message.content or "").strip(),
             finish_reason=str(finish) if finish is not None else None,
         )
+
+    def complete_stream(
+        self,
+        messages: List[Dict[str, str]],
+        *,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Iterator[str]:
+        """Yield the completion text incrementally as the API streams it."""
+        stream = self._client.chat.completions.create(
+            model=self._model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True,
+            **kwargs,
+        )
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
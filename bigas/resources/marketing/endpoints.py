@@ -1,4 +1,4 @@
-from flask import Blueprint, current_app, jsonify, request, send_file
+from flask import Blueprint, Response, current_app, g, jsonify, request, send_file
 from google.analytics.data_v1beta import BetaAnalyticsDataClient
 from google.analytics.data_v1beta.types import (
     DateRange,
@@ -17,9 +17,16 @@ import time
 import logging
 import json
 import hashlib
+import heapq
+import string
+import sys
 import traceback
 import threading
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, wraps
+from itertools import islice
+from operator import itemgetter
 from decimal import Decimal, InvalidOperation
 from bigas.resources.marketing.service import MarketingAnalyticsService
 from bigas.resources.marketing.google_ads_portfolio_service import (
@@ -28,6 +35,16 @@ from bigas.resources.marketing.google_ads_portfolio_service import (
 from bigas.resources.marketing.meta_ads_portfolio_service import (
     run_meta_campaign_portfolio,
 )
+from bigas.resources.marketing.linkedin_ads_service import LinkedInAdsService
+from bigas.resources.marketing.reddit_ads_service import (
+    RedditAdsService,
+    RedditApiError,
+    RedditAuthError,
+)
+try:
+    from bigas.resources.marketing.storage_service import StorageService
+except ImportError:  # pragma: no cover - google-cloud-storage not installed
+    StorageService = None  # type: ignore
 from bigas.resources.marketing.utils import (
     convert_metric_name,
     convert_dimension_name,
@@ -38,15 +55,77 @@ from bigas.resources.marketing.utils import (
     sanitize_error_message,
     validate_request_data
 )
+from bigas.resources.marketing.ttl_cache import TTLCache
 import requests
 from bs4 import BeautifulSoup
 import re
-from typing import Dict, Any, Optional, List, Sequence, Tuple
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Mapping, NamedTuple, Optional, List, Sequence, Set, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+
+def _json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _canonical_json_bytes(obj: Any, sort_keys: bool = True) -> bytes:
+    """
+    Serialize obj to compact, key-sorted UTF-8 JSON bytes for hashing.
+
+    orjson and the stdlib fallback produce identical bytes for the str/list/bool/None
+    signatures hashed here, so cache keys are stable whichever is installed. Pass
+    sort_keys=False for dicts that are always built with a fixed key order.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else None)
+    return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _json_response(obj: Any, status: int = 200) -> Response:
+    """
+    Build a compact JSON response, encoding with orjson when it is installed.
+
+    Used for the large LinkedIn report payloads, where jsonify's stdlib encode dominates
+    post-processing time.
+    """
+    if orjson is not None:
+        body = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        body = json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return Response(body, status=status, mimetype="application/json")
+
+
+def _dumps_llm_payload(obj: Any) -> str:
+    """
+    Serialize an LLM prompt payload to indented JSON text, using orjson when it is installed.
+
+    Falls back to the stdlib encoder for values orjson rejects (e.g. Decimal).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2)
 
 logger = logging.getLogger(__name__)
 
 
-_ASYNC_JOBS: Dict[str, Dict[str, Any]] = {}
+class _AsyncJob(NamedTuple):
+    job: Dict[str, Any]  # replaced on update, never mutated in place
+    status_body: bytes  # encoded get_job_status response for job
+
+
+# Copy-on-write job store: writers build a new mapping under _ASYNC_JOBS_LOCK and swap it
+# in with a single assignment, so status/result polls read it without taking the lock.
+_ASYNC_JOBS: Mapping[str, _AsyncJob] = MappingProxyType({})
 _ASYNC_JOBS_LOCK = threading.Lock()
 
 
@@ -79,6 +158,66 @@ def _normalize_reddit_spend(spend: Any, row: Optional[Dict[str, Any]] = None) ->
     return round(num, 2)
 
 
+def _norm(value: Optional[str]) -> str:
+    """Strip and upper-case a request token such as a range or pivot name; falsy values become ""."""
+    return value.strip().upper() if value else ""
+
+
+# Only the tail of a traceback (where the exception is) is sanitized and returned to clients;
+# the full traceback is still logged.
+_ERROR_TRACEBACK_MAX_CHARS = 2000
+
+
+def _safe_preview(elements: Any, n: int = 10) -> Optional[List[Any]]:
+    """Return up to the first n items of elements, or None if it is not iterable."""
+    try:
+        return list(islice(elements, n))
+    except TypeError:
+        return None
+
+
+# Dimension columns folded into each Reddit element's "segments" list, in display order.
+_REDDIT_SEG_KEYS = ("campaign_id", "campaign_name", "ad_id", "ad_name", "day", "country", "community")
+
+
+def _reddit_row_to_element(row: Dict[str, Any], default_currency: str) -> Dict[str, Any]:
+    """Normalize one Reddit report row to the Option A element schema."""
+    get = row.get
+    seg_parts = [f"{k}={v}" for k in _REDDIT_SEG_KEYS if (v := get(k)) is not None and str(v).strip()]
+    imp = get("impressions")
+    reach = get("reach")
+    ctr = get("ctr")
+    ecpc = get("ecpc")
+    row_currency = (get("currency") or get("spend_currency") or "").strip().upper() or default_currency
+    frequency = None
+    if imp is not None and reach:
+        try:
+            # Reddit usually returns ints already; skip the conversion for those.
+            imp_i = imp if type(imp) is int else int(imp)
+            reach_i = reach if type(reach) is int else int(reach)
+            if reach_i > 0:
+                frequency = round(imp_i / reach_i, 4)
+        except (TypeError, ValueError):
+            frequency = None
+    return {
+        "segments": seg_parts or [str(row)],
+        "campaign_id": get("campaign_id"),
+        "campaign_name": get("campaign_name"),
+        "metrics": {
+            "impressions": imp,
+            "clicks": get("clicks"),
+            "reach": reach,
+            "spend": _normalize_reddit_spend(get("spend"), row),
+            "spend_currency": row_currency,
+        },
+        "derived": {
+            "ctr_pct": float(ctr) if ctr is not None else None,
+            "avg_cpc": float(ecpc) if ecpc is not None else None,
+            "frequency": frequency,
+        },
+    }
+
+
 def _normalize_audience_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Normalize Reddit audience report rows: spend (micro->EUR) and add ctr_pct, cpc per segment."""
     out = []
@@ -114,6 +253,41 @@ def _normalize_audience_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]
     return out
 
 
+_COMPACT_LINKEDIN_METRICS = ("impressions", "clicks", "costInLocalCurrency")
+_COMPACT_LINKEDIN_DERIVED = ("ctr", "avg_cpc_local")
+
+
+def _compact_linkedin_rows(elements: List[Any], sample_limit: int) -> List[Dict[str, Any]]:
+    """Reduce enriched LinkedIn elements to segment names plus key metrics, for LLM payloads."""
+    return [
+        {
+            "segments": [
+                str(name)
+                for pv in (el.get("pivotValuesResolved") or [])
+                if isinstance(pv, dict) and (name := pv.get("name") or pv.get("urn"))
+            ],
+            "metrics": {k: metrics.get(k) for k in _COMPACT_LINKEDIN_METRICS},
+            "derived": {k: derived.get(k) for k in _COMPACT_LINKEDIN_DERIVED},
+        }
+        for el in elements[:sample_limit]
+        if isinstance(el, dict)
+        for metrics, derived in ((el.get("metrics") or {}, el.get("derived") or {}),)
+    ]
+
+
+def _compact_reddit_rows(elements: List[Any], sample_limit: int) -> List[Dict[str, Any]]:
+    """Reduce enriched Reddit elements to segments, metrics and derived values, for LLM payloads."""
+    return [
+        {
+            "segments": el.get("segments") or [],
+            "metrics": el.get("metrics") or {},
+            "derived": el.get("derived") or {},
+        }
+        for el in elements[:sample_limit]
+        if isinstance(el, dict)
+    ]
+
+
 def _build_linkedin_compact_payload(
     storage: Any,
     enriched_path: str,
@@ -121,7 +295,7 @@ def _build_linkedin_compact_payload(
 ) -> Optional[Dict[str, Any]]:
     """Load enriched LinkedIn report from GCS and return compact payload for cross-platform analysis."""
     try:
-        obj = storage.get_json(enriched_path)
+        obj = storage.get_json_if_exists(enriched_path)
         if not isinstance(obj, dict):
             return None
         payload = obj.get("payload") or {}
@@ -133,32 +307,7 @@ def _build_linkedin_compact_payload(
             return None
         summary = enriched.get("summary") or {}
         context = enriched.get("context") or {}
-        compact_rows = []
-        for el in elements[:sample_limit]:
-            if not isinstance(el, dict):
-                continue
-            pivots_resolved = el.get("pivotValuesResolved") or []
-            seg_names = []
-            for pv in pivots_resolved:
-                if not isinstance(pv, dict):
-                    continue
-                name = pv.get("name") or pv.get("urn")
-                if name:
-                    seg_names.append(str(name))
-            metrics = el.get("metrics") or {}
-            derived = el.get("derived") or {}
-            compact_rows.append({
-                "segments": seg_names,
-                "metrics": {
-                    "impressions": metrics.get("impressions"),
-                    "clicks": metrics.get("clicks"),
-                    "costInLocalCurrency": metrics.get("costInLocalCurrency"),
-                },
-                "derived": {
-                    "ctr": derived.get("ctr"),
-                    "avg_cpc_local": derived.get("avg_cpc_local"),
-                },
-            })
+        compact_rows = _compact_linkedin_rows(elements, sample_limit)
         currency = (
             (context.get("currency") or "local")
             .strip().upper() or "LOCAL"
@@ -183,7 +332,7 @@ def _build_reddit_compact_payload(
 ) -> Optional[Dict[str, Any]]:
     """Load enriched Reddit report from GCS and return compact payload for cross-platform analysis."""
     try:
-        obj = storage.get_json(enriched_path)
+        obj = storage.get_json_if_exists(enriched_path)
         if not obj or not isinstance(obj, dict):
             return None
         payload = obj.get("payload") or {}
@@ -195,15 +344,7 @@ def _build_reddit_compact_payload(
             return None
         summary = enriched.get("summary") or {}
         context = enriched.get("context") or {}
-        compact_rows = []
-        for el in elements[:sample_limit]:
-            if not isinstance(el, dict):
-                continue
-            compact_rows.append({
-                "segments": el.get("segments") or [],
-                "metrics": el.get("metrics") or {},
-                "derived": el.get("derived") or {},
-            })
+        compact_rows = _compact_reddit_rows(elements, sample_limit)
         reddit_currency = context.get("spend_currency") or "EUR"
         reddit_currency = (reddit_currency.strip().upper() if isinstance(reddit_currency, str) else None) or "EUR"
         return {
@@ -231,6 +372,163 @@ OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 # Default timeout (in seconds) for outbound HTTP calls to chat platforms such as Discord.
 DISCORD_HTTP_TIMEOUT = int(os.environ.get("DISCORD_HTTP_TIMEOUT", "10"))
 
+
+# Lazily constructed, process-wide service instances. The services only hold configuration
+# (plus pooled HTTP / GCS clients, which are thread-safe), so one instance can be shared by
+# all request threads. Construction failures (e.g. missing env vars) are not cached.
+@lru_cache(maxsize=1)
+def _get_linkedin_svc():
+    return LinkedInAdsService()
+
+
+@lru_cache(maxsize=1)
+def _get_reddit_svc():
+    return RedditAdsService()
+
+
+@lru_cache(maxsize=1)
+def _get_storage_service():
+    if StorageService is None:
+        raise RuntimeError("google-cloud-storage is required for report storage")
+    return StorageService()
+
+
+@marketing_bp.record_once
+def _prewarm_services(state) -> None:
+    """
+    Optionally build the shared service instances when the blueprint is registered.
+
+    With BIGAS_PREWARM_SERVICES=true (e.g. under gunicorn --preload), GCS client and credential
+    setup happens at startup instead of on the first report request. Best-effort only.
+    """
+    if (os.environ.get("BIGAS_PREWARM_SERVICES") or "").strip().lower() not in ("1", "true", "yes"):
+        return
+    for factory in (_get_storage_service, _get_linkedin_svc, _get_reddit_svc):
+        try:
+            factory()
+        except Exception as e:
+            logger.info("Skipping prewarm of %s: %s", factory.__name__, e)
+
+
+# Shared pool for overlapping independent GCS uploads (raw vs. enriched reports).
+_STORAGE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="bigas-storage")
+
+# Prefetches inside run_linkedin_portfolio_report (the CREATIVE-level report fetched alongside
+# demographics). Kept apart from _STORAGE_POOL, which those fetches submit to and wait on.
+_LINKEDIN_PIPELINE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="bigas-li-pipeline")
+
+class _DaemonJobPool:
+    """
+    Run async report jobs on daemon threads, at most max_workers at a time.
+
+    ThreadPoolExecutor workers are joined at interpreter exit after draining their queue,
+    so a stopping worker process would wait out every running and queued job (up to 900s
+    each). Daemon threads, as async jobs originally used, let the process exit; the
+    semaphore still caps how many jobs run concurrently, and the rest wait for a slot.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str):
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._thread_name_prefix = thread_name_prefix
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> None:
+        def _run() -> None:
+            with self._slots:
+                try:
+                    fn(*args)
+                except Exception:
+                    logger.error("Async job %s failed", getattr(fn, "__name__", fn), exc_info=True)
+
+        threading.Thread(
+            target=_run, name=f"{self._thread_name_prefix}-{uuid.uuid4().hex[:8]}", daemon=True
+        ).start()
+
+
+# Concurrency cap for async report jobs. Jobs run their tool synchronously, so they never
+# submit back to this pool.
+_ASYNC_JOB_POOL = _DaemonJobPool(
+    max_workers=int(os.environ.get("BIGAS_ASYNC_JOB_WORKERS", "8")),
+    thread_name_prefix="bigas-async-job",
+)
+
+# Process-local cache of recent fetch_*_ad_analytics_report responses, keyed by request_hash.
+# Sits in front of the GCS report cache so repeat polls skip both GCS and the ads APIs.
+_PAYLOAD_CACHE = TTLCache(maxsize=256, ttl=120)
+
+# Finished run_*_portfolio_report results, keyed by pipeline + normalized request params.
+# Windows that ended before today are final and kept for a day; rolling ones for a minute.
+_PORTFOLIO_RESULT_CACHE = TTLCache(maxsize=128, ttl=60)
+_PORTFOLIO_RESULT_CLOSED_TTL = 24 * 3600
+# Transport/control keys that do not change a pipeline's result.
+_PORTFOLIO_CACHE_IGNORED_KEYS = frozenset({"async", "timeout_seconds", "force_refresh"})
+
+
+def cache_portfolio_result(pipeline: str):
+    """
+    Decorator serving repeat synchronous portfolio runs from _PORTFOLIO_RESULT_CACHE.
+
+    The key covers the pipeline, today's date (relative ranges move with it) and the request
+    JSON minus _internal_* and _PORTFOLIO_CACHE_IGNORED_KEYS. Async submissions bypass the
+    cache (their worker run is cached instead); force_refresh skips the lookup but still
+    stores the fresh result. An explicit post_to_discord=true also skips the lookup, so a
+    re-run re-posts the report. A hit returns the stored body with from_cache=true and
+    does not post to Discord, so its Discord fields are reset to say so.
+    """
+    def wrap(fn):
+        @wraps(fn)
+        def inner(*args, **kwargs):
+            data = request.json or {}
+            if not isinstance(data, dict) or (
+                bool(data.get("async", False)) and not bool(data.get("_internal_async_worker", False))
+            ):
+                return fn(*args, **kwargs)
+
+            today = datetime.utcnow().date()
+            params = {
+                k: v
+                for k, v in data.items()
+                if not k.startswith("_internal") and k not in _PORTFOLIO_CACHE_IGNORED_KEYS
+            }
+            try:
+                key = hashlib.sha256(
+                    _canonical_json_bytes({"pipeline": pipeline, "today": today.isoformat(), "params": params})
+                ).hexdigest()
+            except TypeError:
+                return fn(*args, **kwargs)
+
+            if not bool(data.get("force_refresh", False)) and not bool(data.get("post_to_discord", False)):
+                cached = _PORTFOLIO_RESULT_CACHE.get(key)
+                if cached is not None:
+                    hit = {k: v for k, v in cached.items() if k != "discord"}
+                    if "discord_posted" in hit:
+                        hit["discord_posted"] = False
+                    hit["from_cache"] = True
+                    return jsonify(hit)
+
+            rv = fn(*args, **kwargs)
+            resp = rv[0] if isinstance(rv, tuple) else rv
+            status = rv[1] if isinstance(rv, tuple) and len(rv) > 1 else getattr(resp, "status_code", 200)
+            body = resp.get_json(silent=True) if isinstance(resp, Response) else None
+            if status == 200 and isinstance(body, dict) and not body.get("error"):
+                date_range = body.get("date_range")
+                end_s = date_range.get("end_date") if isinstance(date_range, dict) else None
+                try:
+                    closed = bool(end_s) and date.fromisoformat(str(end_s)) < today
+                except ValueError:
+                    closed = False
+                _PORTFOLIO_RESULT_CACHE.set(key, body, ttl=_PORTFOLIO_RESULT_CLOSED_TTL if closed else None)
+            return rv
+        return inner
+    return wrap
+
+
+def _reset_services() -> None:
+    """Drop cached service instances (tests, or after rotating credentials in env)."""
+    _get_linkedin_svc.cache_clear()
+    _get_reddit_svc.cache_clear()
+    _get_storage_service.cache_clear()
+
+
 # Default demographic pivots for LinkedIn portfolio report (API allows max 3 per creative).
 # Full set of common options: MEMBER_JOB_TITLE, MEMBER_JOB_FUNCTION, MEMBER_SENIORITY, MEMBER_INDUSTRY, MEMBER_COUNTRY_V2, MEMBER_COMPANY_SIZE
 DEFAULT_LINKEDIN_PORTFOLIO_PIVOTS = ["MEMBER_JOB_TITLE", "MEMBER_JOB_FUNCTION", "MEMBER_SENIORITY"]
@@ -238,9 +536,27 @@ DEFAULT_LINKEDIN_PORTFOLIO_PIVOTS = ["MEMBER_JOB_TITLE", "MEMBER_JOB_FUNCTION",
 # Pivots used by the one-command run_linkedin_portfolio_report (job title, function, country).
 LINKEDIN_PORTFOLIO_REPORT_PIVOTS = ["MEMBER_JOB_TITLE", "MEMBER_JOB_FUNCTION", "MEMBER_COUNTRY_V2"]
 
+def _compile_prompt_template(template: str) -> Callable[..., str]:
+    """
+    Parse a str.format template once and return a renderer taking the same keyword fields.
+
+    Templates using format specs, conversions or attribute/index fields fall back to
+    template.format.
+    """
+    parts = list(string.Formatter().parse(template))
+    if any(spec or conv or (name and not name.isidentifier()) for _, name, spec, conv in parts):
+        return template.format
+
+    def render(**fields: Any) -> str:
+        return "".join(lit if name is None else lit + str(fields[name]) for lit, name, _, _ in parts)
+
+    return render
+
+
 # Simple prompt registry for ad analytics summarization.
-# Keyed by (platform, report_type).
-AD_SUMMARY_PROMPTS: Dict[Tuple[str, str], Dict[str, str]] = {
+# Keyed by (platform, report_type). Each entry also gets a precompiled "render" callable
+# for its user_template (see below).
+AD_SUMMARY_PROMPTS: Dict[Tuple[str, str], Dict[str, Any]] = {
     (
         "linkedin",
         "ad_analytics",
@@ -407,6 +723,8 @@ AD_SUMMARY_PROMPTS: Dict[Tuple[str, str], Dict[str, str]] = {
         ),
     },
 }
+for _prompt_cfg in AD_SUMMARY_PROMPTS.values():
+    _prompt_cfg["render"] = _compile_prompt_template(_prompt_cfg["user_template"])
 
 
 class AdsAnalyticsRequest:
@@ -472,6 +790,79 @@ class AdsAnalyticsRequest:
         }
 
 
+# relative_range name -> (days back from today to the end date, window length in days).
+# All windows are full days ending yesterday.
+_RELATIVE_RANGES: Dict[str, Tuple[int, int]] = {
+    "LAST_DAY": (1, 1),
+    "LAST_7_DAYS": (1, 7),
+    "LAST_30_DAYS": (1, 30),
+    "LAST_90_DAYS": (1, 90),
+}
+_LINKEDIN_RELATIVE_RANGES = ("LAST_DAY", "LAST_7_DAYS", "LAST_30_DAYS")
+_REDDIT_RELATIVE_RANGES = ("LAST_7_DAYS", "LAST_30_DAYS")
+_DISCOVERY_RELATIVE_RANGES = ("LAST_7_DAYS", "LAST_30_DAYS", "LAST_90_DAYS")
+
+
+def _resolve_relative_range(
+    raw: str, today: date, allowed: Sequence[str], param: str = "relative_range"
+) -> Tuple[date, date]:
+    """
+    Resolve a relative_range name to (start, end) dates.
+
+    Raises ValueError naming `param` and the allowed values if raw is not one of them.
+    """
+    window = _RELATIVE_RANGES.get(raw) if raw in allowed else None
+    if window is None:
+        raise ValueError(f"{param} must be one of: {', '.join(allowed)}")
+    offset_end, span = window
+    end = today - timedelta(days=offset_end)
+    return end - timedelta(days=span - 1), end
+
+
+def resolve_dates(allowed: Sequence[str], *, strict: bool = True):
+    """
+    Decorator resolving a report handler's date range from the request JSON.
+
+    Explicit start_date/end_date win, then relative_range (one of `allowed`), then the
+    last 7 days ending today. The validated range is exposed on flask.g as
+    start_date_s/end_date_s (ISO strings) and start_d/end_d (date objects); invalid
+    input returns 400 before the handler runs. With strict=False an unknown
+    relative_range falls back to the default window instead of being rejected.
+    """
+    def wrap(fn):
+        @wraps(fn)
+        def inner(*args, **kwargs):
+            data = request.json or {}
+            today = datetime.utcnow().date()
+            relative_range_raw = _norm(data.get("relative_range"))
+            start_date_s = (data.get("start_date") or "").strip()
+            end_date_s = (data.get("end_date") or "").strip()
+
+            if not start_date_s or not end_date_s:
+                # Only apply relative_range when explicit dates are not both provided.
+                start, end = today - timedelta(days=7), today
+                if relative_range_raw and (strict or relative_range_raw in allowed):
+                    try:
+                        start, end = _resolve_relative_range(relative_range_raw, today, allowed)
+                    except ValueError as e:
+                        return jsonify({"error": str(e)}), 400
+                start_date_s = start_date_s or start.isoformat()
+                end_date_s = end_date_s or end.isoformat()
+
+            is_valid, error_msg = validate_date_range(start_date_s, end_date_s)
+            if not is_valid:
+                return jsonify({"error": error_msg}), 400
+
+            try:
+                g.start_d, g.end_d = date.fromisoformat(start_date_s), date.fromisoformat(end_date_s)
+            except ValueError:
+                return jsonify({"error": "Invalid date format. Use YYYY-MM-DD"}), 400
+            g.start_date_s, g.end_date_s = start_date_s, end_date_s
+            return fn(*args, **kwargs)
+        return inner
+    return wrap
+
+
 def normalize_ids_to_urns(ids: Sequence[Any], urn_prefix: str) -> List[str]:
     """
     Normalize a heterogeneous list of ids (ints, strings, or URNs) into a unique
@@ -480,9 +871,17 @@ def normalize_ids_to_urns(ids: Sequence[Any], urn_prefix: str) -> List[str]:
     Example:
       normalize_ids_to_urns([123, "456", "urn:li:sponsoredCampaign:789"], "sponsoredCampaign")
     """
+    if not ids:
+        return []
+    # Dashboards send the same small id lists on every poll; memoize on their string form.
+    return list(_normalize_ids_to_urns_cached(tuple(str(raw) for raw in ids), urn_prefix))
+
+
+@lru_cache(maxsize=2048)
+def _normalize_ids_to_urns_cached(ids: Tuple[str, ...], urn_prefix: str) -> Tuple[str, ...]:
     out: List[str] = []
-    for raw in ids or []:
-        s = str(raw).strip()
+    for raw in ids:
+        s = raw.strip()
         if not s:
             continue
         if s.startswith("urn:"):
@@ -490,14 +889,32 @@ def normalize_ids_to_urns(ids: Sequence[Any], urn_prefix: str) -> List[str]:
         elif s.isdigit():
             out.append(f"urn:li:{urn_prefix}:{s}")
     # Preserve deterministic ordering while removing duplicates.
-    seen = set()
-    deduped: List[str] = []
-    for v in out:
-        if v in seen:
-            continue
-        seen.add(v)
-        deduped.append(v)
-    return deduped
+    return tuple(dict.fromkeys(out))
+
+
+# Always requested from LinkedIn adAnalytics so results are attributable and carry metrics
+# (LinkedIn returns no elements without metric fields).
+_LINKEDIN_REQUIRED_FIELDS = frozenset({"dateRange", "pivotValues", "impressions", "clicks", "costInLocalCurrency"})
+_LINKEDIN_SORTED_REQUIRED_FIELDS = tuple(sorted(_LINKEDIN_REQUIRED_FIELDS))
+
+
+# Signature entries whose order carries no meaning (filters, requested fields).
+_SIGNATURE_UNORDERED_KEYS = ("account_urns", "campaign_urns", "campaign_group_urns", "creative_urns", "fields")
+# Request-only flags that change what we do with a report, not which report is fetched.
+_SIGNATURE_REQUEST_ONLY_KEYS = frozenset({"include_entity_names"})
+
+
+def _canonical_signature(signature: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Canonicalize a request signature so semantically identical requests hash the same:
+    unordered lists are de-duplicated and sorted, empty lists become None, and
+    request-only flags are dropped.
+    """
+    out = {k: v for k, v in signature.items() if k not in _SIGNATURE_REQUEST_ONLY_KEYS}
+    for key in _SIGNATURE_UNORDERED_KEYS:
+        values = out.get(key)
+        out[key] = sorted({str(v) for v in values}) if values else None
+    return out
 
 
 def build_ads_cache_keys(
@@ -505,21 +922,20 @@ def build_ads_cache_keys(
     primary_account_urn: str,
 ) -> Dict[str, Any]:
     """
-    Build a deterministic cache key (SHA-256) and blob names for raw + enriched
+    Build a deterministic cache key (BLAKE2b, 128-bit) and blob names for raw + enriched
     ads analytics reports.
 
     Returns a dict with:
-      - request_signature: the dict used for hashing
+      - request_signature: the canonicalized dict used for hashing
       - request_hash: hex digest
       - blob_name: storage path for the raw report
       - enriched_blob_name: storage path for the enriched report
       - base_name: logical base for filenames (without date or hash)
     """
-    signature = request.to_signature_dict()
-    signature_json = json.dumps(
-        signature, sort_keys=True, separators=(",", ":"), ensure_ascii=True
-    )
-    request_hash = hashlib.sha256(signature_json.encode("utf-8")).hexdigest()
+    signature = _canonical_signature(request.to_signature_dict())
+    request_hash = hashlib.blake2b(
+        _canonical_json_bytes(signature), digest_size=16
+    ).hexdigest()
 
     safe_account = primary_account_urn.split(":")[-1]
     hash_prefix = request_hash[:12]
@@ -564,8 +980,8 @@ def _post_google_ads_portfolio_to_discord(
         "request_metadata": portfolio_result.get("request_metadata") or {},
         "sample_rows": (portfolio_result.get("rows") or [])[:50],
     }
-    user_prompt = prompt_cfg["user_template"].format(
-        payload=json.dumps(payload, indent=2),
+    user_prompt = prompt_cfg["render"](
+        payload=_dumps_llm_payload(payload),
     )
 
     llm, _ = get_llm_client(feature="marketing", explicit_model=model)
@@ -620,8 +1036,8 @@ def _post_meta_portfolio_to_discord(
         "request_metadata": portfolio_result.get("request_metadata") or {},
         "sample_rows": (portfolio_result.get("rows") or [])[:50],
     }
-    user_prompt = prompt_cfg["user_template"].format(
-        payload=json.dumps(payload, indent=2),
+    user_prompt = prompt_cfg["render"](
+        payload=_dumps_llm_payload(payload),
     )
 
     llm, _ = get_llm_client(feature="marketing", explicit_model=model)
@@ -1006,7 +1422,7 @@ def _create_async_job(payload: Dict[str, Any], timeout_seconds: int) -> str:
     job_id = f"job_{uuid.uuid4().hex[:12]}"
     now = datetime.utcnow().isoformat()
     with _ASYNC_JOBS_LOCK:
-        _ASYNC_JOBS[job_id] = {
+        _publish_async_job({
             "job_id": job_id,
             "status": "queued",
             "created_at": now,
@@ -1022,25 +1438,47 @@ def _create_async_job(payload: Dict[str, Any], timeout_seconds: int) -> str:
                 "discovery_start_date": payload.get("discovery_start_date"),
                 "discovery_end_date": payload.get("discovery_end_date"),
             },
-        }
+        })
     return job_id
 
 
+def _publish_async_job(job: Dict[str, Any]) -> None:
+    """Swap in a new _ASYNC_JOBS snapshot holding job; callers hold _ASYNC_JOBS_LOCK."""
+    global _ASYNC_JOBS
+    jobs = dict(_ASYNC_JOBS)
+    jobs[job["job_id"]] = _AsyncJob(job, _async_job_status_body(job))
+    _ASYNC_JOBS = MappingProxyType(jobs)
+
+
+def _async_job_status_body(job: Dict[str, Any]) -> bytes:
+    """Encode the get_job_status response for job."""
+    return _canonical_json_bytes(
+        {
+            "job_id": job["job_id"],
+            "status": job["status"],
+            "progress_pct": job.get("progress_pct", 0),
+            "stage": job.get("stage", "unknown"),
+            "updated_at": job.get("updated_at"),
+            "error": job.get("error"),
+            "result_available": bool(job.get("result")) and job.get("status") == "succeeded",
+        },
+        sort_keys=False,
+    )
+
+
 def _update_async_job(job_id: str, **fields: Any) -> None:
     with _ASYNC_JOBS_LOCK:
-        job = _ASYNC_JOBS.get(job_id)
-        if not job:
+        entry = _ASYNC_JOBS.get(job_id)
+        if not entry:
             return
-        job.update(fields)
-        job["updated_at"] = datetime.utcnow().isoformat()
+        _publish_async_job({**entry.job, **fields, "updated_at": datetime.utcnow().isoformat()})
 
 
 def _get_async_job(job_id: str) -> Optional[Dict[str, Any]]:
-    with _ASYNC_JOBS_LOCK:
-        job = _ASYNC_JOBS.get(job_id)
-        if not job:
-            return None
-        return dict(job)
+    entry = _ASYNC_JOBS.get(job_id)
+    if not entry:
+        return None
+    return dict(entry.job)
 
 
 def _run_linkedin_portfolio_job(app_obj: Any, job_id: str, payload: Dict[str, Any]) -> None:
@@ -1083,6 +1521,69 @@ def _run_meta_portfolio_job(app_obj: Any, job_id: str, payload: Dict[str, Any])
     )
 
 
+def _run_linkedin_ad_summary_job(app_obj: Any, job_id: str, payload: Dict[str, Any]) -> None:
+    _run_async_tool_job(
+        app_obj=app_obj,
+        job_id=job_id,
+        payload=payload,
+        tool_path="/mcp/tools/summarize_linkedin_ad_analytics",
+        tool_label="LinkedIn ad summary",
+    )
+
+
+def _capture_access_key(data: Dict[str, Any]) -> Any:
+    """
+    Return the real app object for a background job and copy the caller's access key into
+    data["_internal_access_key"], so the job's internal request passes the access check.
+    """
+    app_obj = current_app._get_current_object()
+    header = app_obj.config.get("BIGAS_ACCESS_HEADER", "X-Bigas-Access-Key")
+    request_key = (request.headers.get(header) or "").strip()
+    if request_key:
+        data["_internal_access_key"] = request_key
+    return app_obj
+
+
+def _accept_async_job(data: Dict[str, Any], job_fn: Callable[[Any, str, Dict[str, Any]], None]) -> Dict[str, Any]:
+    """Queue job_fn on _ASYNC_JOB_POOL for this request and return the "accepted" response body."""
+    timeout_seconds = max(10, min(int(data.get("timeout_seconds") or 300), 900))
+    app_obj = _capture_access_key(data)
+    job_id = _create_async_job(data, timeout_seconds=timeout_seconds)
+    _ASYNC_JOB_POOL.submit(job_fn, app_obj, job_id, data)
+    return {
+        "status": "accepted",
+        "job_id": job_id,
+        "poll_after_seconds": 5,
+        "timeout_seconds": timeout_seconds,
+    }
+
+
+def async_dispatch(job_fn: Callable[[Any, str, Dict[str, Any]], None]):
+    """
+    Decorator for report endpoints that accept "async": true.
+
+    An async request (not coming from the job worker itself) is validated and handed to
+    job_fn on _ASYNC_JOB_POOL, and the job metadata is returned immediately; anything else
+    falls through to the wrapped synchronous handler.
+    """
+    def wrap(fn):
+        @wraps(fn)
+        def inner(*args, **kwargs):
+            data = request.json or {}
+            if (
+                isinstance(data, dict)
+                and bool(data.get("async", False))
+                and not bool(data.get("_internal_async_worker", False))
+            ):
+                is_valid, error_msg = validate_request_data(data)
+                if not is_valid:
+                    return jsonify({"error": error_msg}), 400
+                return jsonify(_accept_async_job(data, job_fn))
+            return fn(*args, **kwargs)
+        return inner
+    return wrap
+
+
 def _run_cross_platform_job(app_obj: Any, job_id: str, payload: Dict[str, Any]) -> None:
     _run_async_tool_job(
         app_obj=app_obj,
@@ -1157,7 +1658,7 @@ def _run_async_tool_job(
             error=None,
         )
     except Exception as e:
-        logger.error("Async %s job %s failed: %s", tool_label, job_id, traceback.format_exc())
+        logger.exception("Async %s job %s failed", tool_label, job_id)
         _update_async_job(
             job_id,
             status="failed",
@@ -1201,7 +1702,7 @@ def fetch_analytics_report():
         processed_data = process_ga_response(ga_response)
         return jsonify({"status": "success", "data": processed_data})
     except Exception as e:
-        logger.error(f"Error in fetch_analytics_report: {traceback.format_exc()}")
+        logger.exception("Error in fetch_analytics_report")
         sanitized_error = sanitize_error_message(str(e))
         return jsonify({"error": sanitized_error}), 500
 
@@ -1244,7 +1745,7 @@ def fetch_custom_report():
     except KeyError as e:
         return jsonify({"error": f"Missing required field: {e}"}), 400
     except Exception as e:
-        logger.error(f"Error in fetch_custom_report: {traceback.format_exc()}")
+        logger.exception("Error in fetch_custom_report")
         sanitized_error = sanitize_error_message(str(e))
         return jsonify({"error": sanitized_error}), 500
 
@@ -1274,7 +1775,7 @@ def ask_analytics_question():
         answer = service.answer_question(current_ga4_property_id, question)
         return jsonify({"answer": answer})
     except Exception as e:
-        logger.error(f"Error in ask_analytics_question: {traceback.format_exc()}")
+        logger.exception("Error in ask_analytics_question")
         sanitized_error = sanitize_error_message(str(e))
         return jsonify({"error": sanitized_error}), 500
 
@@ -1407,7 +1908,7 @@ def analyze_trends():
             }
         })
     except Exception as e:
-        logger.error(f"Error in analyze_trends: {traceback.format_exc()}")
+        logger.exception("Error in analyze_trends")
         sanitized_error = sanitize_error_message(str(e))
         return jsonify({"error": sanitized_error}), 500
 
@@ -1449,6 +1950,115 @@ def get_manifest():
         ]
     }
 
+_XFP = "X-Forwarded-Proto"
+_XFH = "X-Forwarded-Host"
+
+
+def _derive_redirect_uri(path_suffix: str) -> str:
+    """
+    Derive this service's callback URL from the incoming request in a proxy-safe way.
+
+    Cloud Run terminates TLS and forwards HTTP to the container; Flask may see http://
+    unless we use forwarded headers. Only the first hop of a comma-separated list is used.
+    """
+    h = request.headers
+    proto = (h.get(_XFP) or request.scheme or "https").partition(",")[0].strip()
+    host = (h.get(_XFH) or request.host).partition(",")[0].strip()
+    return f"{proto}://{host}{path_suffix}"
+
+
+# Short-lived cache of OAuth code exchange results. Authorization codes are single-use,
+# so a client retry with the same code can only fail upstream; answer it from here instead.
+# Keys are derived from a hash of the code so the code itself is never stored or logged.
+_EXCHANGE_CACHE_TTL_SECONDS = 60
+_exchange_cache: Dict[str, Tuple[float, Tuple[Dict[str, Any], int]]] = {}
+_exchange_cache_lock = threading.Lock()
+
+
+def _exchange_cache_key(platform: str, code: str, include_access_token: bool) -> str:
+    digest = hashlib.sha256(code.encode("utf-8")).hexdigest()[:16]
+    return f"{platform}:{digest}:{int(include_access_token)}"
+
+
+def _exchange_cache_get(key: str) -> Optional[Tuple[Dict[str, Any], int]]:
+    now = time.time()
+    with _exchange_cache_lock:
+        entry = _exchange_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= now:
+            _exchange_cache.pop(key, None)
+            return None
+        return entry[1]
+
+
+def _exchange_cache_put(key: str, body: Dict[str, Any], status: int) -> None:
+    now = time.time()
+    with _exchange_cache_lock:
+        for k in [k for k, (exp, _) in _exchange_cache.items() if exp <= now]:
+            _exchange_cache.pop(k, None)
+        _exchange_cache[key] = (now + _EXCHANGE_CACHE_TTL_SECONDS, (body, status))
+
+
+class _ExchangeRequest(NamedTuple):
+    """Validated body of an OAuth code-exchange request."""
+
+    code: str
+    redirect_uri: str
+    include_access_token: bool
+
+
+def _parse_exchange_request() -> Tuple[Optional[_ExchangeRequest], Optional[str]]:
+    """
+    Decode and validate the current request body for the *_exchange_code endpoints.
+
+    Returns (request, None) on success or (None, error_message) for a 400 response.
+    """
+    data = request.get_json(silent=True) or {}
+    is_valid, error_msg = validate_request_data(data, required_fields=["code"])
+    if not is_valid:
+        return None, error_msg
+    code = str(data.get("code") or "").strip()
+    if not code:
+        return None, "code is required"
+    return (
+        _ExchangeRequest(
+            code=code,
+            redirect_uri=str(data.get("redirect_uri") or "").strip(),
+            include_access_token=bool(data.get("include_access_token", False)),
+        ),
+        None,
+    )
+
+
+def _persist_token(platform: str, payload: Dict[str, Any]) -> None:
+    """
+    Best-effort: store a freshly exchanged access token at secrets/{platform}/access_token.json.
+
+    The ads services read this blob to avoid re-minting tokens on every request. Never raises;
+    a storage failure must not fail the exchange itself.
+    """
+    try:
+        access_token = (payload.get("access_token") or "").strip()
+        expires_in = int(payload.get("expires_in") or 0)
+        if not access_token or expires_in <= 0:
+            return
+        now_ts = int(time.time())
+        _get_storage_service().store_json(
+            f"secrets/{platform}/access_token.json",
+            {
+                "access_token": access_token,
+                "obtained_at": now_ts,
+                "expires_in": expires_in,
+                "expires_at": now_ts + expires_in,
+                "scope": payload.get("scope"),
+                "note": f"Stored by /mcp/tools/{platform}_exchange_code",
+            },
+        )
+    except Exception:
+        pass
+
+
 @marketing_bp.route('/mcp/tools/linkedin_exchange_code', methods=['POST'])
 def linkedin_exchange_code():
     """
@@ -1472,24 +2082,22 @@ def linkedin_exchange_code():
       - scope, expires_in
       - access_token (only if include_access_token=true)
     """
-    data = request.json or {}
-    is_valid, error_msg = validate_request_data(data, required_fields=["code"])
-    if not is_valid:
+    req, error_msg = _parse_exchange_request()
+    if req is None:
         return jsonify({"error": error_msg}), 400
 
-    code = (data.get("code") or "").strip()
-    if not code:
-        return jsonify({"error": "code is required"}), 400
+    code = req.code
+    include_access_token = req.include_access_token
 
-    include_access_token = bool(data.get("include_access_token", False))
+    cache_key = _exchange_cache_key("linkedin", code, include_access_token)
+    cached = _exchange_cache_get(cache_key)
+    if cached is not None:
+        body, status = cached
+        return jsonify(body), status
 
-    redirect_uri = (data.get("redirect_uri") or "").strip()
+    redirect_uri = req.redirect_uri
     if not redirect_uri:
-        # Derive from incoming request in a proxy-safe way.
-        # Cloud Run terminates TLS and forwards HTTP to the container; Flask may see http:// unless we use forwarded headers.
-        proto = (request.headers.get("X-Forwarded-Proto") or request.scheme or "https").split(",")[0].strip()
-        host = (request.headers.get("X-Forwarded-Host") or request.host).split(",")[0].strip()
-        redirect_uri = f"{proto}://{host}/linkedin/callback"
+        redirect_uri = _derive_redirect_uri("/linkedin/callback")
 
     client_id = (os.environ.get("LINKEDIN_CLIENT_ID") or "").strip()
     client_secret = (os.environ.get("LINKEDIN_CLIENT_SECRET") or "").strip()
@@ -1539,58 +2147,37 @@ def linkedin_exchange_code():
                     429,
                 )
 
-            return (
-                jsonify(
-                    {
-                        "error": f"LinkedIn token exchange failed ({token_resp.status_code})",
-                        "details_preview": body_preview,
-                    }
-                ),
-                502,
-            )
+            body = {
+                "error": f"LinkedIn token exchange failed ({token_resp.status_code})",
+                "details_preview": body_preview,
+            }
+            if token_resp.status_code < 500:
+                # The code has been consumed or rejected; retries cannot succeed.
+                _exchange_cache_put(cache_key, body, 502)
+            return jsonify(body), 502
 
-        payload = token_resp.json() if token_resp.text else {}
+        payload = _json_loads(token_resp.content) if token_resp.content else {}
 
         # Best-effort: persist access_token to GCS so other endpoints can run without
         # repeatedly calling the refresh-token mint endpoint (helps avoid 429s).
-        try:
-            access_token = (payload.get("access_token") or "").strip()
-            expires_in = int(payload.get("expires_in") or 0)
-            if access_token and expires_in > 0:
-                from bigas.resources.marketing.storage_service import StorageService
-
-                now_ts = int(time.time())
-                storage = StorageService()
-                storage.store_json(
-                    "secrets/linkedin/access_token.json",
-                    {
-                        "access_token": access_token,
-                        "obtained_at": now_ts,
-                        "expires_in": expires_in,
-                        "expires_at": now_ts + expires_in,
-                        "scope": payload.get("scope"),
-                        "note": "Stored by /mcp/tools/linkedin_exchange_code",
-                    },
-                )
-        except Exception:
-            # Don't fail the request if storage fails.
-            pass
+        _persist_token("linkedin", payload)
 
         # Return only the safer fields by default (omit access_token).
-        return jsonify(
-            {
-                "status": "success",
-                "expires_in": payload.get("expires_in"),
-                **({"access_token": payload.get("access_token")} if include_access_token else {}),
-                "refresh_token": payload.get("refresh_token"),
-                "refresh_token_expires_in": payload.get("refresh_token_expires_in"),
-                "scope": payload.get("scope"),
-                "redirect_uri_used": redirect_uri,
-                "note": "Set LINKEDIN_REFRESH_TOKEN to the refresh_token value (not the auth code).",
-            }
-        )
-    except Exception as e:
-        logger.error(f"Error in linkedin_exchange_code: {traceback.format_exc()}")
+        body = {
+            "status": "success",
+            "expires_in": payload.get("expires_in"),
+            "refresh_token": payload.get("refresh_token"),
+            "refresh_token_expires_in": payload.get("refresh_token_expires_in"),
+            "scope": payload.get("scope"),
+            "redirect_uri_used": redirect_uri,
+            "note": "Set LINKEDIN_REFRESH_TOKEN to the refresh_token value (not the auth code).",
+        }
+        if include_access_token:
+            body["access_token"] = payload.get("access_token")
+        _exchange_cache_put(cache_key, body, 200)
+        return jsonify(body)
+    except Exception as e:
+        logger.exception("Error in linkedin_exchange_code")
         sanitized_error = sanitize_error_message(str(e))
         return jsonify({"error": sanitized_error}), 500
 
@@ -1613,22 +2200,22 @@ def reddit_exchange_code():
       - access_token, expires_in, scope
       - access_token only in response if include_access_token=true
     """
-    data = request.json or {}
-    is_valid, error_msg = validate_request_data(data, required_fields=["code"])
-    if not is_valid:
+    req, error_msg = _parse_exchange_request()
+    if req is None:
         return jsonify({"error": error_msg}), 400
 
-    code = (data.get("code") or "").strip()
-    if not code:
-        return jsonify({"error": "code is required"}), 400
+    code = req.code
+    include_access_token = req.include_access_token
 
-    include_access_token = bool(data.get("include_access_token", False))
+    cache_key = _exchange_cache_key("reddit", code, include_access_token)
+    cached = _exchange_cache_get(cache_key)
+    if cached is not None:
+        body, status = cached
+        return jsonify(body), status
 
-    redirect_uri = (data.get("redirect_uri") or "").strip()
+    redirect_uri = req.redirect_uri
     if not redirect_uri:
-        proto = (request.headers.get("X-Forwarded-Proto") or request.scheme or "https").split(",")[0].strip()
-        host = (request.headers.get("X-Forwarded-Host") or request.host).split(",")[0].strip()
-        redirect_uri = f"{proto}://{host}/reddit/callback"
+        redirect_uri = _derive_redirect_uri("/reddit/callback")
 
     client_id = (os.environ.get("REDDIT_CLIENT_ID") or "").strip()
     client_secret = (os.environ.get("REDDIT_CLIENT_SECRET") or "").strip()
@@ -1672,53 +2259,33 @@ def reddit_exchange_code():
                     ),
                     429,
                 )
-            return (
-                jsonify(
-                    {
-                        "error": f"Reddit token exchange failed ({token_resp.status_code})",
-                        "details_preview": body_preview,
-                    }
-                ),
-                502,
-            )
+            body = {
+                "error": f"Reddit token exchange failed ({token_resp.status_code})",
+                "details_preview": body_preview,
+            }
+            if token_resp.status_code < 500:
+                # The code has been consumed or rejected; retries cannot succeed.
+                _exchange_cache_put(cache_key, body, 502)
+            return jsonify(body), 502
 
-        payload = token_resp.json() if token_resp.text else {}
+        payload = _json_loads(token_resp.content) if token_resp.content else {}
 
-        try:
-            access_token = (payload.get("access_token") or "").strip()
-            expires_in = int(payload.get("expires_in") or 0)
-            if access_token and expires_in > 0:
-                from bigas.resources.marketing.storage_service import StorageService
-
-                now_ts = int(time.time())
-                storage = StorageService()
-                storage.store_json(
-                    "secrets/reddit/access_token.json",
-                    {
-                        "access_token": access_token,
-                        "obtained_at": now_ts,
-                        "expires_in": expires_in,
-                        "expires_at": now_ts + expires_in,
-                        "scope": payload.get("scope"),
-                        "note": "Stored by /mcp/tools/reddit_exchange_code",
-                    },
-                )
-        except Exception:
-            pass
+        _persist_token("reddit", payload)
 
-        return jsonify(
-            {
-                "status": "success",
-                "expires_in": payload.get("expires_in"),
-                **({"access_token": payload.get("access_token")} if include_access_token else {}),
-                "refresh_token": payload.get("refresh_token"),
-                "scope": payload.get("scope"),
-                "redirect_uri_used": redirect_uri,
-                "note": "Set REDDIT_REFRESH_TOKEN to the refresh_token value (use duration=permanent when authorizing).",
-            }
-        )
+        body = {
+            "status": "success",
+            "expires_in": payload.get("expires_in"),
+            "refresh_token": payload.get("refresh_token"),
+            "scope": payload.get("scope"),
+            "redirect_uri_used": redirect_uri,
+            "note": "Set REDDIT_REFRESH_TOKEN to the refresh_token value (use duration=permanent when authorizing).",
+        }
+        if include_access_token:
+            body["access_token"] = payload.get("access_token")
+        _exchange_cache_put(cache_key, body, 200)
+        return jsonify(body)
     except Exception as e:
-        logger.error(f"Error in reddit_exchange_code: {traceback.format_exc()}")
+        logger.exception("Error in reddit_exchange_code")
         sanitized_error = sanitize_error_message(str(e))
         return jsonify({"error": sanitized_error}), 500
 
@@ -1731,9 +2298,7 @@ def linkedin_ads_health_check():
     - List ad accounts
     """
     try:
-        from bigas.resources.marketing.linkedin_ads_service import LinkedInAdsService
-
-        svc = LinkedInAdsService()
+        svc = _get_linkedin_svc()
         data = svc.list_ad_accounts(count=10)
         elements = data.get("elements", []) or []
         account_ids = []
@@ -1743,17 +2308,17 @@ def linkedin_ads_health_check():
             raw_id = el.get("id")
             if raw_id is None:
                 raw_id = el.get("account") or el.get("urn")
-
-            if raw_id is None:
-                continue
+                if raw_id is None:
+                    continue
 
             # Normalize to sponsoredAccount URN for reporting usage.
-            if isinstance(raw_id, int) or (isinstance(raw_id, str) and raw_id.isdigit()):
-                account_id = int(raw_id)
+            s = str(raw_id)
+            if s.isdigit():
+                account_id = int(s)
                 account_ids.append(account_id)
                 account_urns.append(f"urn:li:sponsoredAccount:{account_id}")
-            elif isinstance(raw_id, str) and raw_id.startswith("urn:"):
-                account_urns.append(raw_id)
+            elif s.startswith("urn:"):
+                account_urns.append(s)
 
         return jsonify(
             {
@@ -1765,11 +2330,17 @@ def linkedin_ads_health_check():
             }
         )
     except Exception as e:
-        logger.error(f"Error in linkedin_ads_health_check: {traceback.format_exc()}")
+        logger.exception("Error in linkedin_ads_health_check")
         sanitized_error = sanitize_error_message(str(e))
         return jsonify({"error": sanitized_error}), 500
 
 
+# Response keys probed (in order) when normalizing Reddit ad account listings.
+_REDDIT_ACCOUNTS_KEYS = ("data", "ad_accounts", "results")
+_REDDIT_ACCOUNT_ID_KEYS = ("id", "ad_account_id", "account_id")
+_REDDIT_ACCOUNT_NAME_KEYS = ("name", "account_name")
+
+
 @marketing_bp.route('/mcp/tools/reddit_ads_health_check', methods=['GET'])
 def reddit_ads_health_check():
     """
@@ -1777,28 +2348,26 @@ def reddit_ads_health_check():
     Use this to verify REDDIT_AD_ACCOUNT_ID or to discover your ad account IDs.
     """
     try:
-        from bigas.resources.marketing.reddit_ads_service import (
-            RedditAdsService,
-            RedditAuthError,
-            RedditApiError,
-        )
-
-        svc = RedditAdsService()
-        me = svc.get_me()
+        svc = _get_reddit_svc()
+        # get_me and list_ad_accounts are independent upstream calls; issue them concurrently.
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            me_future = ex.submit(svc.get_me)
+            accounts_future = ex.submit(svc.list_ad_accounts)
+            me = me_future.result()
         accounts = []
         account_list = []
         try:
-            data = svc.list_ad_accounts()
-            accounts = data.get("data") or data.get("ad_accounts") or data.get("results") or []
+            data = accounts_future.result()
+            accounts = next((data[k] for k in _REDDIT_ACCOUNTS_KEYS if data.get(k)), [])
             if isinstance(accounts, dict):
-                accounts = list(accounts.values()) if accounts else []
-            if not isinstance(accounts, list):
+                accounts = list(accounts.values())
+            elif not isinstance(accounts, list):
                 accounts = []
             for acc in accounts[:20]:
                 if not isinstance(acc, dict):
                     continue
-                acc_id = acc.get("id") or acc.get("ad_account_id") or acc.get("account_id")
-                name = acc.get("name") or acc.get("account_name") or ""
+                acc_id = next((acc[k] for k in _REDDIT_ACCOUNT_ID_KEYS if acc.get(k)), None)
+                name = next((acc[k] for k in _REDDIT_ACCOUNT_NAME_KEYS if acc.get(k)), "")
                 account_list.append({"id": acc_id, "name": name})
         except RedditApiError as e:
             if e.status_code == 404:
@@ -1831,12 +2400,139 @@ def reddit_ads_health_check():
             response_body["reddit_response_body"] = e.response_body
         return jsonify(response_body), 401
     except Exception as e:
-        logger.error(f"Error in reddit_ads_health_check: {traceback.format_exc()}")
+        logger.exception("Error in reddit_ads_health_check")
         sanitized_error = sanitize_error_message(str(e))
         return jsonify({"error": sanitized_error}), 500
 
 
+class _CallSpacer:
+    """Thread-safe pacing: successive acquire() calls return at least `interval` seconds apart."""
+
+    def __init__(self, interval: float):
+        self.interval = max(0.0, interval)
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def acquire(self) -> None:
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_at)
+            self._next_at = start_at + self.interval
+        if start_at > now:
+            time.sleep(start_at - now)
+
+
+def _preview_blob_name(blob_name: str) -> str:
+    """Sibling blob holding the small cache-hit response for a stored raw report."""
+    base = blob_name[:-5] if blob_name.endswith(".json") else blob_name
+    return f"{base}.preview.json"
+
+
+def _store_cache_preview(storage: Any, blob_name: str, preview: Dict[str, Any]) -> None:
+    """Best-effort write of the cache-hit response next to the raw report."""
+    try:
+        storage.store_json(_preview_blob_name(blob_name), preview)
+    except Exception as e:
+        logger.warning("Failed to store cache preview for %s: %s", blob_name, e)
+
+
+class _PreviewBody(dict):
+    """A parsed cache-hit preview that keeps its stored bytes so routes can serve them verbatim."""
+
+    __slots__ = ("raw",)
+
+    def __init__(self, parsed: Dict[str, Any], raw: bytes):
+        super().__init__(parsed)
+        self.raw = raw
+
+
+def _cached_preview(storage: Any, blob_name: str, cache_key: Any) -> Optional[_PreviewBody]:
+    """
+    Load a stored cache-hit preview, skipping the download of the (possibly multi-MB) raw
+    report, and remember it in _PAYLOAD_CACHE. Returns None when no preview blob exists.
+    """
+    body = storage.get_bytes_if_exists(_preview_blob_name(blob_name))
+    if not body:
+        return None
+    try:
+        parsed = _json_loads(body)
+    except ValueError:
+        return None
+    if not isinstance(parsed, dict):
+        return None
+    preview = _PreviewBody(parsed, body)
+    _PAYLOAD_CACHE.set(cache_key, preview)
+    return preview
+
+
+def _body_response(body: Any) -> Response:
+    """jsonify body, serving a _PreviewBody's stored bytes as-is instead of re-encoding them."""
+    if isinstance(body, _PreviewBody):
+        return Response(body.raw, mimetype="application/json")
+    return jsonify(body)
+
+
+def _store_linkedin_enriched(
+    storage,
+    raw: Dict[str, Any],
+    *,
+    svc,
+    account_urn: str,
+    creative_urns: Optional[List[str]],
+    end_date_s: str,
+    request_hash: str,
+    blob_name: str,
+    enriched_blob_name: str,
+) -> bool:
+    """
+    Resolve entity names for a LinkedIn adAnalytics response and store it next to the raw blob.
+
+    Best-effort only: returns False (and logs) instead of failing the report fetch.
+    """
+    try:
+        safe_account_id = None
+        try:
+            safe_account_id = int(account_urn.split(":")[-1])
+        except Exception:
+            safe_account_id = None
+
+        enriched = _enrich_linkedin_adanalytics_response(
+            raw,
+            account_id=safe_account_id,
+            svc=svc,
+            context={
+                "creative_urns": creative_urns or None,
+            },
+        )
+        storage.store_json(
+            blob_name=enriched_blob_name,
+            data={
+                "metadata": {
+                    "platform": "linkedin",
+                    "report_date": end_date_s,
+                    "report_type": "raw_ads_enriched",
+                    "stored_at": datetime.utcnow().isoformat(),
+                    "version": "1.0",
+                    "request_hash": request_hash,
+                },
+                "payload": {
+                    "request_hash": request_hash,
+                    "source_blob": blob_name,
+                    "enriched_response": enriched,
+                },
+            },
+        )
+        return True
+    except Exception:
+        # Best-effort enrichment only; never fail the report fetch because of it.
+        logger.warning("LinkedIn enrichment failed", exc_info=True)
+        return False
+
+
 @marketing_bp.route('/mcp/tools/fetch_linkedin_ad_analytics_report', methods=['POST'])
+@resolve_dates(_LINKEDIN_RELATIVE_RANGES)
 def fetch_linkedin_ad_analytics_report():
     """
     Fetch LinkedIn adAnalytics for a given ad account URN.
@@ -1866,83 +2562,47 @@ def fetch_linkedin_ad_analytics_report():
       - If the blob already exists in GCS, we return it instead of refetching (unless force_refresh=true).
       - Storage layout: raw_ads/linkedin/{end_date}/ad_analytics_{accountId}_{pivot}_{hashPrefix}.json
     """
-    data = request.json or {}
+    body, status = _fetch_linkedin_ad_analytics_report_impl(
+        request.json or {}, g.start_date_s, g.end_date_s
+    )
+    return _body_response(body), status
+
+
+def _fetch_linkedin_ad_analytics_report_impl(
+    data: Dict[str, Any], start_date_s: str, end_date_s: str
+) -> Tuple[Any, int]:
+    """Body of fetch_linkedin_ad_analytics_report, returning (body, status) so pipelines can call it in-process."""
     is_valid, error_msg = validate_request_data(data)
     if not is_valid:
-        return jsonify({"error": error_msg}), 400
+        return {"error": error_msg}, 400
 
-    # Date handling: explicit dates win, otherwise relative_range, otherwise last 7 days.
-    today = datetime.utcnow().date()
-    default_end = today
-    default_start = default_end - timedelta(days=7)
+    start_d, end_d = date.fromisoformat(start_date_s), date.fromisoformat(end_date_s)
 
     account_urn = (data.get("account_urn") or os.environ.get("LINKEDIN_AD_ACCOUNT_URN") or "").strip()
 
-    relative_range_raw = (data.get("relative_range") or "").strip().upper()
-    start_date_s = (data.get("start_date") or "").strip()
-    end_date_s = (data.get("end_date") or "").strip()
-
-    if not start_date_s or not end_date_s:
-        # Only apply relative_range when explicit dates are not both provided.
-        if relative_range_raw:
-            if relative_range_raw == "LAST_DAY":
-                # Yesterday only.
-                end = today - timedelta(days=1)
-                start = end
-            elif relative_range_raw == "LAST_7_DAYS":
-                end = today - timedelta(days=1)
-                start = end - timedelta(days=6)
-            elif relative_range_raw == "LAST_30_DAYS":
-                end = today - timedelta(days=1)
-                start = end - timedelta(days=29)
-            else:
-                return jsonify({"error": "relative_range must be one of: LAST_DAY, LAST_7_DAYS, LAST_30_DAYS"}), 400
-
-            if not start_date_s:
-                start_date_s = start.isoformat()
-            if not end_date_s:
-                end_date_s = end.isoformat()
-
-    # Final fallback if nothing was provided / resolved.
-    if not start_date_s:
-        start_date_s = default_start.isoformat()
-    if not end_date_s:
-        end_date_s = default_end.isoformat()
-    time_granularity = (data.get("time_granularity") or "DAILY").strip().upper()
-    pivot = (data.get("pivot") or "ACCOUNT").strip().upper()
+    time_granularity = _norm(data.get("time_granularity") or "DAILY")
+    pivot = _norm(data.get("pivot") or "ACCOUNT")
     pivots = data.get("pivots")
     if pivots is not None and not isinstance(pivots, list):
-        return jsonify({"error": "pivots must be a list of pivot names"}), 400
+        return {"error": "pivots must be a list of pivot names"}, 400
     campaign_ids = data.get("campaign_ids") or []
     campaign_group_ids = data.get("campaign_group_ids") or []
     creative_ids = data.get("creative_ids") or []
     fields = data.get("fields")
     if fields is not None and not isinstance(fields, list):
-        return jsonify({"error": "fields must be a list of field names"}), 400
+        return {"error": "fields must be a list of field names"}, 400
     store_raw = data.get("store_raw", True)
     force_refresh = bool(data.get("force_refresh", False))
     include_entity_names = bool(data.get("include_entity_names", False))
 
-    is_valid, error_msg = validate_date_range(start_date_s, end_date_s)
-    if not is_valid:
-        return jsonify({"error": error_msg}), 400
-
     if not account_urn:
-        return jsonify({"error": "account_urn is required (or set LINKEDIN_AD_ACCOUNT_URN)."}), 400
+        return {"error": "account_urn is required (or set LINKEDIN_AD_ACCOUNT_URN)."}, 400
 
     # Accept either a sponsoredAccount URN or a numeric account id.
-    account_urn = account_urn.strip()
     if account_urn.isdigit():
         account_urn = f"urn:li:sponsoredAccount:{account_urn}"
 
     try:
-        from bigas.resources.marketing.linkedin_ads_service import LinkedInAdsService
-        from bigas.resources.marketing.storage_service import StorageService
-
-        svc = LinkedInAdsService()
-        start_d = date.fromisoformat(start_date_s)
-        end_d = date.fromisoformat(end_date_s)
-
         # Build optional filters using shared normalization helpers.
         campaign_urns = normalize_ids_to_urns(
             campaign_ids, urn_prefix="sponsoredCampaign"
@@ -1960,26 +2620,17 @@ def fetch_linkedin_ad_analytics_report():
 
         linkedin_version = os.environ.get("LINKEDIN_VERSION") or "202601"
 
-        # Always request these so results are attributable and include metrics (LinkedIn returns no elements without metric fields).
-        required_fields = {"dateRange", "pivotValues", "impressions", "clicks", "costInLocalCurrency"}
         final_fields = (
-            sorted(set((cleaned_fields or [])) | required_fields)
+            sorted(_LINKEDIN_REQUIRED_FIELDS.union(cleaned_fields))
             if cleaned_fields is not None
-            else sorted(required_fields)
+            else list(_LINKEDIN_SORTED_REQUIRED_FIELDS)
         )
 
         pivots_clean: Optional[List[str]] = None
         if pivots:
-            pivots_clean = [str(p).strip().upper() for p in pivots if str(p).strip()]
+            pivots_clean = [u for p in pivots if (u := _norm(str(p)))]
             if len(pivots_clean) > 3:
-                return (
-                    jsonify(
-                        {
-                            "error": "pivots supports up to 3 elements for LinkedIn adAnalytics statistics"
-                        }
-                    ),
-                    400,
-                )
+                return {"error": "pivots supports up to 3 elements for LinkedIn adAnalytics statistics"}, 400
 
         # Build generic ads analytics request + cache keys for this LinkedIn report.
         analytics_request = AdsAnalyticsRequest(
@@ -2009,11 +2660,35 @@ def fetch_linkedin_ad_analytics_report():
         blob_name = cache_info["blob_name"]
         enriched_blob_name = cache_info["enriched_blob_name"]
 
+        if force_refresh:
+            # Drop process-local copies so they cannot outlive the refetched report.
+            _PAYLOAD_CACHE.pop((request_hash, False), None)
+            _PAYLOAD_CACHE.pop((request_hash, True), None)
+
         # Cache hit: if the exact report already exists, return it.
         if store_raw and not force_refresh:
-            storage = StorageService()
-            if storage.blob_exists(blob_name):
-                cached = storage.get_json(blob_name) or {}
+            # include_entity_names is not part of request_hash, but it changes the response.
+            payload_cache_key = (request_hash, include_entity_names)
+            cached_out = _PAYLOAD_CACHE.get(payload_cache_key)
+            if cached_out is not None:
+                return cached_out, 200
+
+            storage = _get_storage_service()
+            if not include_entity_names:
+                preview = _cached_preview(storage, blob_name, payload_cache_key)
+                if preview is not None:
+                    return preview, 200
+
+            enriched_exists = False
+            if include_entity_names:
+                # Overlap the enriched-blob existence check with the main cache read.
+                with ThreadPoolExecutor(max_workers=1) as ex:
+                    enriched_future = ex.submit(storage.blob_exists, enriched_blob_name)
+                    cached = storage.get_json_if_exists(blob_name)
+                    enriched_exists = enriched_future.result()
+            else:
+                cached = storage.get_json_if_exists(blob_name)
+            if cached is not None:
                 cached_payload = cached.get("payload") if isinstance(cached, dict) else None
                 cached_payload = cached_payload if isinstance(cached_payload, dict) else {}
                 cached_response = cached_payload.get("response") if isinstance(cached_payload, dict) else None
@@ -2026,14 +2701,33 @@ def fetch_linkedin_ad_analytics_report():
                     "account_urn": account_urn,
                     "date_range": {"start_date": start_date_s, "end_date": end_date_s},
                     "elements_count": len(elements) if isinstance(elements, list) else None,
-                    "elements_preview": (elements[:10] if isinstance(elements, list) else None),
+                    "elements_preview": _safe_preview(elements),
                     "stored": True,
                     "storage_path": blob_name,
                 }
-                if include_entity_names and storage.blob_exists(enriched_blob_name):
+                if include_entity_names and not enriched_exists and isinstance(cached_response, dict):
+                    # Raw report was cached without names; enrich it instead of refetching.
+                    enriched_exists = _store_linkedin_enriched(
+                        storage,
+                        cached_response,
+                        svc=_get_linkedin_svc(),
+                        account_urn=account_urn,
+                        creative_urns=creative_urns,
+                        end_date_s=end_date_s,
+                        request_hash=request_hash,
+                        blob_name=blob_name,
+                        enriched_blob_name=enriched_blob_name,
+                    )
+                if enriched_exists:
                     out["enriched_storage_path"] = enriched_blob_name
-                return jsonify(out)
+                else:
+                    # Backfill the preview for reports stored before previews existed.
+                    _STORAGE_POOL.submit(_store_cache_preview, storage, blob_name, out)
+                _PAYLOAD_CACHE.set(payload_cache_key, out)
+                return out, 200
 
+        # Only the live-fetch path needs the API client.
+        svc = _get_linkedin_svc()
         if pivots_clean:
             raw = svc.ad_analytics_statistics(
                 start_date=start_d,
@@ -2062,7 +2756,23 @@ def fetch_linkedin_ad_analytics_report():
         stored = False
         storage_path = None
         if store_raw:
-            storage = StorageService()
+            storage = _get_storage_service()
+            # Enrichment (entity-name lookups + enriched upload) is independent of the raw
+            # upload, so overlap the two.
+            enriched_future = None
+            if include_entity_names:
+                enriched_future = _STORAGE_POOL.submit(
+                    _store_linkedin_enriched,
+                    storage,
+                    raw,
+                    svc=svc,
+                    account_urn=account_urn,
+                    creative_urns=creative_urns,
+                    end_date_s=end_date_s,
+                    request_hash=request_hash,
+                    blob_name=blob_name,
+                    enriched_blob_name=enriched_blob_name,
+                )
             storage_path = storage.store_raw_ads_report_at_blob(
                 platform="linkedin",
                 blob_name=blob_name,
@@ -2088,68 +2798,39 @@ def fetch_linkedin_ad_analytics_report():
                 metadata={"request_hash": request_hash},
             )
             stored = True
-
-            if include_entity_names:
-                try:
-                    safe_account_id = None
-                    try:
-                        safe_account_id = int(account_urn.split(":")[-1])
-                    except Exception:
-                        safe_account_id = None
-
-                    enriched = _enrich_linkedin_adanalytics_response(
-                        raw,
-                        account_id=safe_account_id,
-                        svc=svc,
-                        context={
-                            "creative_urns": creative_urns or None,
-                        },
-                    )
-                    storage.store_json(
-                        blob_name=enriched_blob_name,
-                        data={
-                            "metadata": {
-                                "platform": "linkedin",
-                                "report_date": end_date_s,
-                                "report_type": "raw_ads_enriched",
-                                "stored_at": datetime.utcnow().isoformat(),
-                                "version": "1.0",
-                                "request_hash": request_hash,
-                            },
-                            "payload": {
-                                "request_hash": request_hash,
-                                "source_blob": blob_name,
-                                "enriched_response": enriched,
-                            },
-                        },
-                    )
-                except Exception:
-                    # Best-effort enrichment only; never fail the report fetch because of it.
-                    logger.warning("LinkedIn enrichment failed: %s", traceback.format_exc())
+            if enriched_future is not None:
+                enriched_future.result()
 
         elements = raw.get("elements", []) if isinstance(raw, dict) else []
 
-        return jsonify(
-            {
-                "status": "success",
-                "from_cache": False,
-                "request_hash": request_hash,
-                "account_urn": account_urn,
-                "date_range": {"start_date": start_date_s, "end_date": end_date_s},
-                "elements_count": len(elements) if isinstance(elements, list) else None,
-                "elements_preview": (elements[:10] if isinstance(elements, list) else None),
-                "stored": stored,
-                "storage_path": storage_path,
-                "enriched_storage_path": (enriched_blob_name if (store_raw and include_entity_names) else None),
-            }
-        )
+        out = {
+            "status": "success",
+            "from_cache": False,
+            "request_hash": request_hash,
+            "account_urn": account_urn,
+            "date_range": {"start_date": start_date_s, "end_date": end_date_s},
+            "elements_count": len(elements) if isinstance(elements, list) else None,
+            "elements_preview": _safe_preview(elements),
+            "stored": stored,
+            "storage_path": storage_path,
+            "enriched_storage_path": (enriched_blob_name if (store_raw and include_entity_names) else None),
+        }
+        if stored:
+            cached_out = {**out, "from_cache": True}
+            _PAYLOAD_CACHE.set((request_hash, include_entity_names), cached_out)
+            # The preview mirrors the names-free cache-hit response; build it from a copy so
+            # the cached entry keeps its enriched_storage_path.
+            preview = {k: v for k, v in cached_out.items() if k != "enriched_storage_path"}
+            _STORAGE_POOL.submit(_store_cache_preview, storage, blob_name, preview)
+        return out, 200
     except Exception as e:
-        logger.error(f"Error in fetch_linkedin_ad_analytics_report: {traceback.format_exc()}")
+        logger.error("Error in fetch_linkedin_ad_analytics_report", exc_info=True)
         sanitized_error = sanitize_error_message(str(e))
-        return jsonify({"error": sanitized_error}), 500
+        return {"error": sanitized_error}, 500
 
 
 @marketing_bp.route('/mcp/tools/fetch_reddit_ad_analytics_report', methods=['POST'])
+@resolve_dates(_REDDIT_RELATIVE_RANGES)
 def fetch_reddit_ad_analytics_report():
     """
     Fetch Reddit Ads performance report for an ad account. Stores raw + enriched (normalized) in GCS.
@@ -2163,31 +2844,10 @@ def fetch_reddit_ad_analytics_report():
       - force_refresh: bool (default: false)
     """
     data = request.json or {}
-    today = datetime.utcnow().date()
-    default_end = today
-    default_start = default_end - timedelta(days=7)
+    start_d, end_d = g.start_d, g.end_d
+    start_date_s, end_date_s = g.start_date_s, g.end_date_s
 
     account_id = (data.get("account_id") or os.environ.get("REDDIT_AD_ACCOUNT_ID") or "").strip()
-    relative_range_raw = (data.get("relative_range") or "").strip().upper()
-    start_date_s = (data.get("start_date") or "").strip()
-    end_date_s = (data.get("end_date") or "").strip()
-
-    if not start_date_s or not end_date_s:
-        if relative_range_raw:
-            if relative_range_raw == "LAST_7_DAYS":
-                end = today - timedelta(days=1)
-                start = end - timedelta(days=6)
-            elif relative_range_raw == "LAST_30_DAYS":
-                end = today - timedelta(days=1)
-                start = end - timedelta(days=29)
-            else:
-                return jsonify({"error": "relative_range must be one of: LAST_7_DAYS, LAST_30_DAYS"}), 400
-            start_date_s = start_date_s or start.isoformat()
-            end_date_s = end_date_s or end.isoformat()
-    if not start_date_s:
-        start_date_s = default_start.isoformat()
-    if not end_date_s:
-        end_date_s = default_end.isoformat()
 
     dimensions = data.get("dimensions")
     metrics_list = data.get("metrics")
@@ -2198,20 +2858,10 @@ def fetch_reddit_ad_analytics_report():
     store_raw = data.get("store_raw", True)
     force_refresh = bool(data.get("force_refresh", False))
 
-    is_valid, error_msg = validate_date_range(start_date_s, end_date_s)
-    if not is_valid:
-        return jsonify({"error": error_msg}), 400
     if not account_id:
         return jsonify({"error": "account_id is required (or set REDDIT_AD_ACCOUNT_ID)."}), 400
 
     try:
-        from bigas.resources.marketing.reddit_ads_service import RedditAdsService, RedditApiError
-        from bigas.resources.marketing.storage_service import StorageService
-
-        svc = RedditAdsService()
-        start_d = date.fromisoformat(start_date_s)
-        end_d = date.fromisoformat(end_date_s)
-
         analytics_request = AdsAnalyticsRequest(
             platform="reddit",
             endpoint="ad_performance",
@@ -2232,26 +2882,40 @@ def fetch_reddit_ad_analytics_report():
         blob_name = cache_info["blob_name"]
         enriched_blob_name = cache_info["enriched_blob_name"]
 
+        if force_refresh:
+            _PAYLOAD_CACHE.pop(request_hash, None)
+
         if store_raw and not force_refresh:
-            storage = StorageService()
-            if storage.blob_exists(blob_name):
-                cached = storage.get_json(blob_name) or {}
+            cached_out = _PAYLOAD_CACHE.get(request_hash)
+            if cached_out is not None:
+                return _body_response(cached_out)
+
+            storage = _get_storage_service()
+            preview = _cached_preview(storage, blob_name, request_hash)
+            if preview is not None:
+                return _body_response(preview)
+
+            cached = storage.get_json_if_exists(blob_name)
+            if cached is not None:
                 payload = cached.get("payload") or {}
                 raw_data = payload.get("raw_response") or {}
                 data_rows = raw_data.get("data") if isinstance(raw_data, dict) else []
-                return jsonify(
-                    {
-                        "status": "success",
-                        "from_cache": True,
-                        "request_hash": request_hash,
-                        "account_id": account_id,
-                        "date_range": {"start_date": start_date_s, "end_date": end_date_s},
-                        "elements_count": len(data_rows) if isinstance(data_rows, list) else None,
-                        "storage_path": blob_name,
-                        "enriched_storage_path": enriched_blob_name,
-                    }
-                )
+                out = {
+                    "status": "success",
+                    "from_cache": True,
+                    "request_hash": request_hash,
+                    "account_id": account_id,
+                    "date_range": {"start_date": start_date_s, "end_date": end_date_s},
+                    "elements_count": len(data_rows) if isinstance(data_rows, list) else None,
+                    "storage_path": blob_name,
+                    "enriched_storage_path": enriched_blob_name,
+                }
+                _STORAGE_POOL.submit(_store_cache_preview, storage, blob_name, out)
+                _PAYLOAD_CACHE.set(request_hash, out)
+                return jsonify(out)
 
+        # Only the live-fetch path needs the API client.
+        svc = _get_reddit_svc()
         report_result = svc.get_performance_report(
             account_id=account_id,
             start_date=start_d,
@@ -2269,65 +2933,21 @@ def fetch_reddit_ad_analytics_report():
         # can return different or mixed currencies. We normalize spend to a major unit and
         # track the per-row currency explicitly; the top-level context currency is derived
         # from the set of row currencies below.
-        elements = []
         # Default fallback if no currency information is present in rows.
         default_currency = "EUR"
+        elements: List[Dict[str, Any]] = []
+        # Collected alongside the element build; every row carries a non-empty currency.
+        currency_values: Set[str] = set()
         for row in data_rows:
-            if not isinstance(row, dict):
-                continue
-            seg_parts = []
-            for k in ["campaign_id", "campaign_name", "ad_id", "ad_name", "day", "country", "community"]:
-                v = row.get(k)
-                if v is not None and str(v).strip():
-                    seg_parts.append(f"{k}={v}")
-            segments = seg_parts if seg_parts else [str(row)]
-            imp = row.get("impressions")
-            clk = row.get("clicks")
-            reach = row.get("reach")
-            spend = _normalize_reddit_spend(row.get("spend"), row)
-            ctr = row.get("ctr")
-            ecpc = row.get("ecpc")
-            row_currency = (
-                (row.get("currency") or row.get("spend_currency") or "")
-                .strip()
-                .upper()
-                or default_currency
-            )
-            frequency = None
-            try:
-                imp_i = int(imp) if imp is not None else None
-                reach_i = int(reach) if reach is not None else None
-                if imp_i is not None and reach_i and reach_i > 0:
-                    frequency = round(float(imp_i) / float(reach_i), 4)
-            except Exception:
-                frequency = None
-            elements.append({
-                "segments": segments,
-                "campaign_id": row.get("campaign_id"),
-                "campaign_name": row.get("campaign_name"),
-                "metrics": {
-                    "impressions": imp,
-                    "clicks": clk,
-                    "reach": reach,
-                    "spend": spend,
-                    "spend_currency": row_currency,
-                },
-                "derived": {
-                    "ctr_pct": float(ctr) if ctr is not None else None,
-                    "avg_cpc": float(ecpc) if ecpc is not None else None,
-                    "frequency": frequency,
-                },
-            })
+            if isinstance(row, dict):
+                el = _reddit_row_to_element(row, default_currency)
+                elements.append(el)
+                currency_values.add(el["metrics"]["spend_currency"])
 
         # Derive a stable context currency for the enriched payload:
         # - If all rows share the same currency, use that.
         # - If there are no rows, fall back to the default.
         # - If multiple currencies appear, mark as MIXED and expose the set for downstream tools.
-        currency_values = {
-            (el.get("metrics") or {}).get("spend_currency")
-            for el in elements
-            if isinstance(el, dict) and (el.get("metrics") or {}).get("spend_currency")
-        }
         if not currency_values:
             context_currency = default_currency
             context_currencies = []
@@ -2336,13 +2956,15 @@ def fetch_reddit_ad_analytics_report():
             context_currencies = [context_currency]
         else:
             context_currency = "MIXED"
-            context_currencies = sorted({c for c in currency_values if c})
+            context_currencies = sorted(currency_values)
 
         stored = False
         storage_path = None
         if store_raw:
-            storage = StorageService()
-            storage.store_raw_ads_report_at_blob(
+            storage = _get_storage_service()
+            # The raw and enriched uploads are independent; run them concurrently.
+            raw_future = _STORAGE_POOL.submit(
+                storage.store_raw_ads_report_at_blob,
                 platform="reddit",
                 blob_name=blob_name,
                 report_data={
@@ -2384,8 +3006,19 @@ def fetch_reddit_ad_analytics_report():
                     },
                 },
             )
+            raw_future.result()
             stored = True
             storage_path = blob_name
+            _STORAGE_POOL.submit(_store_cache_preview, storage, blob_name, {
+                "status": "success",
+                "from_cache": True,
+                "request_hash": request_hash,
+                "account_id": account_id,
+                "date_range": {"start_date": start_date_s, "end_date": end_date_s},
+                "elements_count": len(data_rows),
+                "storage_path": blob_name,
+                "enriched_storage_path": enriched_blob_name,
+            })
 
         out = {
             "status": "success",
@@ -2415,6 +3048,8 @@ def fetch_reddit_ad_analytics_report():
                 elif isinstance(m, dict):
                     debug["metrics_keys"] = list(m.keys())
             out["_debug_reddit_response"] = debug
+        if stored:
+            _PAYLOAD_CACHE.set(request_hash, {**out, "from_cache": True})
         return jsonify(out)
     except RedditApiError as e:
         logger.error("Reddit API error in fetch_reddit_ad_analytics_report: %s", e.response_text)
@@ -2423,7 +3058,7 @@ def fetch_reddit_ad_analytics_report():
             out["reddit_response"] = sanitize_error_message(e.response_text[:2000])
         return jsonify(out), 500
     except Exception as e:
-        logger.error(f"Error in fetch_reddit_ad_analytics_report: {traceback.format_exc()}")
+        logger.error("Error in fetch_reddit_ad_analytics_report", exc_info=True)
         sanitized_error = sanitize_error_message(str(e))
         return jsonify({"error": sanitized_error}), 500
 
@@ -2439,6 +3074,7 @@ REDDIT_AUDIENCE_REPORT_TYPES = {
 
 
 @marketing_bp.route('/mcp/tools/fetch_reddit_audience_report', methods=['POST'])
+@resolve_dates(_REDDIT_RELATIVE_RANGES, strict=False)
 def fetch_reddit_audience_report():
     """
     Fetch Reddit Ads audience/demographics report: interests, communities, country, region, or DMA.
@@ -2451,9 +3087,8 @@ def fetch_reddit_audience_report():
       - store_raw: bool (default false) — store raw response in GCS under raw_ads/reddit/audience/
     """
     data = request.json or {}
-    today = datetime.utcnow().date()
-    default_end = today
-    default_start = default_end - timedelta(days=7)
+    start_d, end_d = g.start_d, g.end_d
+    start_date_s, end_date_s = g.start_date_s, g.end_date_s
 
     account_id = (data.get("account_id") or os.environ.get("REDDIT_AD_ACCOUNT_ID") or "").strip()
     if not account_id:
@@ -2466,39 +3101,8 @@ def fetch_reddit_audience_report():
             "allowed": list(REDDIT_AUDIENCE_REPORT_TYPES.keys()),
         }), 400
 
-    relative_range_raw = (data.get("relative_range") or "").strip().upper()
-    start_date_s = (data.get("start_date") or "").strip()
-    end_date_s = (data.get("end_date") or "").strip()
-    if not start_date_s or not end_date_s:
-        if relative_range_raw == "LAST_7_DAYS":
-            end = today - timedelta(days=1)
-            start = end - timedelta(days=6)
-            start_date_s = start_date_s or start.isoformat()
-            end_date_s = end_date_s or end.isoformat()
-        elif relative_range_raw == "LAST_30_DAYS":
-            end = today - timedelta(days=1)
-            start = end - timedelta(days=29)
-            start_date_s = start_date_s or start.isoformat()
-            end_date_s = end_date_s or end.isoformat()
-        else:
-            start_date_s = start_date_s or default_start.isoformat()
-            end_date_s = end_date_s or default_end.isoformat()
-    if not start_date_s:
-        start_date_s = default_start.isoformat()
-    if not end_date_s:
-        end_date_s = default_end.isoformat()
-
-    is_valid, error_msg = validate_date_range(start_date_s, end_date_s)
-    if not is_valid:
-        return jsonify({"error": error_msg}), 400
-
     try:
-        from bigas.resources.marketing.reddit_ads_service import RedditAdsService, RedditApiError
-        from bigas.resources.marketing.storage_service import StorageService
-
-        svc = RedditAdsService()
-        start_d = date.fromisoformat(start_date_s)
-        end_d = date.fromisoformat(end_date_s)
+        svc = _get_reddit_svc()
         cfg = REDDIT_AUDIENCE_REPORT_TYPES[report_type]
         campaign_id = (data.get("campaign_id") or "").strip() or None
         result = svc.get_audience_report(
@@ -2517,7 +3121,7 @@ def fetch_reddit_audience_report():
         store_raw = bool(data.get("store_raw", False))
         storage_path = None
         if store_raw and data_rows:
-            storage = StorageService()
+            storage = _get_storage_service()
             blob_name = f"raw_ads/reddit/audience/{end_date_s}/{report_type}_{account_id.replace(' ', '_')}.json"
             storage.store_json(blob_name, {
                 "request": {"account_id": account_id, "report_type": report_type, "start_date": start_date_s, "end_date": end_date_s},
@@ -2546,7 +3150,7 @@ def fetch_reddit_audience_report():
             out["reddit_response"] = sanitize_error_message(e.response_text[:2000])
         return jsonify(out), 500
     except Exception as e:
-        logger.error(f"Error in fetch_reddit_audience_report: {traceback.format_exc()}")
+        logger.error("Error in fetch_reddit_audience_report", exc_info=True)
         return jsonify({"error": sanitize_error_message(str(e))}), 500
 
 
@@ -2577,75 +3181,57 @@ def list_linkedin_creatives_for_period():
       - date_range
       - creatives: list of { creative_id, creative_urn, impressions, clicks, costInLocalCurrency }
     """
-    data = request.json or {}
+    body, status = _list_linkedin_creatives_for_period_impl(request.json or {})
+    return _json_response(body, status)
+
+
+def _list_linkedin_creatives_for_period_impl(data: Dict[str, Any]) -> Tuple[Any, int]:
+    """Body of list_linkedin_creatives_for_period, returning (body, status) so pipelines can call it in-process."""
     is_valid, error_msg = validate_request_data(data)
     if not is_valid:
-        return jsonify({"error": error_msg}), 400
+        return {"error": error_msg}, 400
 
     today = datetime.utcnow().date()
 
     account_urn = (data.get("account_urn") or os.environ.get("LINKEDIN_AD_ACCOUNT_URN") or "").strip()
     if not account_urn:
-        return jsonify({"error": "account_urn is required (or set LINKEDIN_AD_ACCOUNT_URN)."}), 400
-    account_urn = account_urn.strip()
+        return {"error": "account_urn is required (or set LINKEDIN_AD_ACCOUNT_URN)."}, 400
     if account_urn.isdigit():
         account_urn = f"urn:li:sponsoredAccount:{account_urn}"
 
     # Discovery period: explicit dates win, otherwise discovery_relative_range.
     disc_start_s = (data.get("discovery_start_date") or "").strip()
     disc_end_s = (data.get("discovery_end_date") or "").strip()
-    disc_rel = (data.get("discovery_relative_range") or "").strip().upper()
+    disc_rel = _norm(data.get("discovery_relative_range"))
 
     if not disc_start_s or not disc_end_s:
-        if disc_rel:
-            if disc_rel == "LAST_7_DAYS":
-                end = today - timedelta(days=1)
-                start = end - timedelta(days=6)
-            elif disc_rel == "LAST_30_DAYS":
-                end = today - timedelta(days=1)
-                start = end - timedelta(days=29)
-            elif disc_rel == "LAST_90_DAYS":
-                end = today - timedelta(days=1)
-                start = end - timedelta(days=89)
-            else:
-                return jsonify(
-                    {"error": "discovery_relative_range must be one of: LAST_7_DAYS, LAST_30_DAYS, LAST_90_DAYS"}
-                ), 400
-
-            if not disc_start_s:
-                disc_start_s = start.isoformat()
-            if not disc_end_s:
-                disc_end_s = end.isoformat()
-        else:
-            # Default discovery window: last 30 days ending yesterday
-            end = today - timedelta(days=1)
-            start = end - timedelta(days=29)
-            if not disc_start_s:
-                disc_start_s = start.isoformat()
-            if not disc_end_s:
-                disc_end_s = end.isoformat()
+        # Default discovery window: last 30 days ending yesterday
+        try:
+            start, end = _resolve_relative_range(
+                disc_rel or "LAST_30_DAYS", today, _DISCOVERY_RELATIVE_RANGES, "discovery_relative_range"
+            )
+        except ValueError as e:
+            return {"error": str(e)}, 400
+        disc_start_s = disc_start_s or start.isoformat()
+        disc_end_s = disc_end_s or end.isoformat()
 
     is_valid, error_msg = validate_date_range(disc_start_s, disc_end_s)
     if not is_valid:
-        return jsonify({"error": error_msg}), 400
+        return {"error": error_msg}, 400
 
     min_impr = int(data.get("min_impressions") or 1)
     store_raw = data.get("store_raw", True)
     force_refresh = bool(data.get("force_refresh", False))
 
     try:
-        from bigas.resources.marketing.linkedin_ads_service import LinkedInAdsService
-        from bigas.resources.marketing.storage_service import StorageService
-
-        svc = LinkedInAdsService()
-        storage = StorageService()
+        svc = _get_linkedin_svc()
+        storage = _get_storage_service()
 
         start_d = date.fromisoformat(disc_start_s)
         end_d = date.fromisoformat(disc_end_s)
 
         # Fields for creative rollup (fixed set)
-        required_fields = {"dateRange", "pivotValues", "impressions", "clicks", "costInLocalCurrency"}
-        final_fields = sorted(required_fields)
+        final_fields = list(_LINKEDIN_SORTED_REQUIRED_FIELDS)
 
         linkedin_version = os.environ.get("LINKEDIN_VERSION") or "202601"
         safe_account = account_urn.split(":")[-1]
@@ -2667,17 +3253,22 @@ def list_linkedin_creatives_for_period():
             "version": linkedin_version,
             "include_entity_names": False,
         }
-        signature_json = json.dumps(request_signature, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
-        request_hash = hashlib.sha256(signature_json.encode("utf-8")).hexdigest()
-        hash_prefix = request_hash[:12]
-        base_name = f"creative_rollup_{safe_account}"
+        # The signature literal has a fixed key order, so no key sort is needed; the "v2"
+        # base name keeps these unsorted hashes apart from older sorted-key blobs. Only a
+        # short key is needed, so a 64-bit BLAKE2b digest is used whole.
+        request_hash = hashlib.blake2b(
+            _canonical_json_bytes(request_signature, sort_keys=False), digest_size=8
+        ).hexdigest()
+        hash_prefix = request_hash
+        base_name = f"creative_rollup_v2_{safe_account}"
         blob_name = f"raw_ads/linkedin/{disc_end_s}/{base_name}_{hash_prefix}.json"
 
         raw = None
         from_cache = False
 
-        if store_raw and not force_refresh and storage.blob_exists(blob_name):
-            cached = storage.get_json(blob_name) or {}
+        # One GCS read serves as both the existence check and the cache load.
+        cached = storage.get_json_if_exists(blob_name) if (store_raw and not force_refresh) else None
+        if cached is not None:
             payload = cached.get("payload") if isinstance(cached, dict) else {}
             raw = payload.get("response") if isinstance(payload, dict) else {}
             from_cache = True
@@ -2707,73 +3298,105 @@ def list_linkedin_creatives_for_period():
 
         elements = raw.get("elements", []) if isinstance(raw, dict) else []
 
-        creatives_out = []
+        creative_prefix = "urn:li:sponsoredCreative:"
+        prefix_len = len(creative_prefix)
+        creatives_out: List[Dict[str, Any]] = []
+        append = creatives_out.append
         for el in elements:
             if not isinstance(el, dict):
                 continue
-            pivot_vals = el.get("pivotValues") or []
+            pivot_vals = el.get("pivotValues")
             if not pivot_vals:
                 continue
             creative_urn = str(pivot_vals[0])
-            if not creative_urn.startswith("urn:li:sponsoredCreative:"):
+            if not creative_urn.startswith(creative_prefix):
                 continue
 
-            metrics = el
-            impr = metrics.get("impressions") or 0
-            clicks = metrics.get("clicks") or 0
-            cost = metrics.get("costInLocalCurrency")
             try:
-                impr_i = int(impr)
+                impr_i = int(el.get("impressions") or 0)
             except Exception:
                 impr_i = 0
-
             if impr_i < min_impr:
                 continue
 
             try:
-                clicks_i = int(clicks)
+                clicks_i = int(el.get("clicks") or 0)
             except Exception:
                 clicks_i = 0
+            cost = el.get("costInLocalCurrency")
             try:
-                cost_d = Decimal(str(cost)) if cost is not None else Decimal("0")
-            except Exception:
-                cost_d = Decimal("0")
-
-            creative_id = creative_urn.split(":")[-1]
+                cost_f = float(cost) if cost is not None else 0.0
+            except (TypeError, ValueError):
+                cost_f = 0.0
 
-            creatives_out.append(
+            append(
                 {
-                    "creative_id": creative_id,
+                    "creative_id": creative_urn[prefix_len:],
                     "creative_urn": creative_urn,
                     "impressions": impr_i,
                     "clicks": clicks_i,
-                    "costInLocalCurrency": float(cost_d),
+                    "costInLocalCurrency": cost_f,
                 }
             )
 
         # Sort creatives by impressions descending for convenience
-        creatives_out.sort(key=lambda c: c["impressions"], reverse=True)
+        creatives_out.sort(key=itemgetter("impressions"), reverse=True)
 
-        return jsonify(
+        return (
             {
                 "status": "success",
                 "account_urn": account_urn,
                 "date_range": {"start_date": disc_start_s, "end_date": disc_end_s},
                 "from_cache": from_cache,
                 "creatives": creatives_out,
-            }
+            },
+            200,
         )
     except Exception:
-        logger.error("Error in list_linkedin_creatives_for_period: %s", traceback.format_exc())
-        sanitized_error = sanitize_error_message(str(traceback.format_exc()))
-        return jsonify({"error": sanitized_error}), 500
+        tb = traceback.format_exc()
+        logger.error("Error in list_linkedin_creatives_for_period: %s", tb)
+        sanitized_error = sanitize_error_message(tb[-_ERROR_TRACEBACK_MAX_CHARS:])
+        return {"error": sanitized_error}, 500
+
+
+# LinkedIn accepts up to this many creatives in one List(...) filter for the portfolio batch fetch.
+_LINKEDIN_CREATIVE_BATCH_MAX = 50
+
+
+def _split_linkedin_creative_rows(
+    raw: Any, pivot_name: str, creative_ids: Sequence[str]
+) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """
+    Split a statistics response pivoted by (CREATIVE, pivot_name) into one analytics-shaped
+    response per creative, dropping the creative from each row's pivotValues so the rows
+    match what a single-creative analytics call with pivot=pivot_name returns.
+
+    Every requested creative gets an entry (empty elements when LinkedIn returned no rows).
+    """
+    by_creative: Dict[str, List[Dict[str, Any]]] = {str(c): [] for c in creative_ids}
+    elements = raw.get("elements") if isinstance(raw, dict) else None
+    for el in elements if isinstance(elements, list) else []:
+        if not isinstance(el, dict):
+            continue
+        pivot_values = el.get("pivotValues")
+        if not isinstance(pivot_values, list):
+            continue
+        creative_urn = next(
+            (v for v in pivot_values if str(v).startswith("urn:li:sponsoredCreative:")), None
+        )
+        rows = by_creative.get(str(creative_urn).rsplit(":", 1)[-1]) if creative_urn else None
+        if rows is None:
+            continue
+        rows.append({**el, "pivotValues": [v for v in pivot_values if v != creative_urn]})
+    return {(cid, pivot_name): {"elements": rows} for cid, rows in by_creative.items()}
 
 
 @marketing_bp.route('/mcp/tools/fetch_linkedin_creative_demographics_portfolio', methods=['POST'])
+@resolve_dates(_LINKEDIN_RELATIVE_RANGES)
 def fetch_linkedin_creative_demographics_portfolio():
     """
     Fetch LinkedIn demographic adAnalytics per creative and per dimension (pivot),
-    with rate-limit-friendly sequencing and strong caching in GCS.
+    with rate-limited concurrent fetches and strong caching in GCS.
 
     This is intended for scheduled runs (e.g. Cloud Scheduler) to prepare
     per-ad, per-dimension data that can later be summarized into a portfolio
@@ -2790,63 +3413,46 @@ def fetch_linkedin_creative_demographics_portfolio():
       - include_entity_names: bool (default: true)
       - max_creatives_per_run: int (default: 10)
       - max_pivots_per_creative: int (default: 3)
-      - sleep_ms_between_calls: int (default: 300)
+      - sleep_ms_between_calls: int (default: 300). Minimum spacing between live LinkedIn calls.
+      - max_workers: int (default: 4, max 8). Concurrent (creative, pivot) fetches.
+      - creative_batch_size: int (default: 1, max 50). When > 1, uncached creatives are fetched
+          per pivot in batches with one statistics call (pivots=CREATIVE,<pivot>) and split
+          back into the same per-creative blobs.
 
     Returns:
       - For each (creative, pivot), whether it was fetched or came from cache,
         plus the storage paths for raw and enriched blobs (if created).
     """
-    data = request.json or {}
+    body, status = _fetch_linkedin_creative_demographics_portfolio_impl(
+        request.json or {}, g.start_date_s, g.end_date_s
+    )
+    return _json_response(body, status)
+
+
+def _fetch_linkedin_creative_demographics_portfolio_impl(
+    data: Dict[str, Any], start_date_s: str, end_date_s: str
+) -> Tuple[Any, int]:
+    """Body of fetch_linkedin_creative_demographics_portfolio, returning (body, status) so pipelines can call it in-process."""
     is_valid, error_msg = validate_request_data(data)
     if not is_valid:
-        return jsonify({"error": error_msg}), 400
+        return {"error": error_msg}, 400
 
-    # Date handling: same semantics as fetch_linkedin_ad_analytics_report
-    today = datetime.utcnow().date()
-    default_end = today
-    default_start = default_end - timedelta(days=7)
+    # Date range resolved by @resolve_dates on the route (same semantics as fetch_linkedin_ad_analytics_report).
+    start_d, end_d = date.fromisoformat(start_date_s), date.fromisoformat(end_date_s)
 
     account_urn = (data.get("account_urn") or os.environ.get("LINKEDIN_AD_ACCOUNT_URN") or "").strip()
 
-    relative_range_raw = (data.get("relative_range") or "").strip().upper()
-    start_date_s = (data.get("start_date") or "").strip()
-    end_date_s = (data.get("end_date") or "").strip()
-
-    if not start_date_s or not end_date_s:
-        if relative_range_raw:
-            if relative_range_raw == "LAST_DAY":
-                end = today - timedelta(days=1)
-                start = end
-            elif relative_range_raw == "LAST_7_DAYS":
-                end = today - timedelta(days=1)
-                start = end - timedelta(days=6)
-            elif relative_range_raw == "LAST_30_DAYS":
-                end = today - timedelta(days=1)
-                start = end - timedelta(days=29)
-            else:
-                return jsonify({"error": "relative_range must be one of: LAST_DAY, LAST_7_DAYS, LAST_30_DAYS"}), 400
-
-            if not start_date_s:
-                start_date_s = start.isoformat()
-            if not end_date_s:
-                end_date_s = end.isoformat()
-
-    if not start_date_s:
-        start_date_s = default_start.isoformat()
-    if not end_date_s:
-        end_date_s = default_end.isoformat()
-
     time_granularity = "ALL"
     pivots = data.get("pivots") or []
     if not isinstance(pivots, list) or not pivots:
-        return jsonify({"error": "pivots is required and must be a non-empty list"}), 400
+        return {"error": "pivots is required and must be a non-empty list"}, 400
     creative_ids = data.get("creative_ids") or []
     if not isinstance(creative_ids, list) or not creative_ids:
-        return jsonify({"error": "creative_ids is required and must be a non-empty list"}), 400
+        return {"error": "creative_ids is required and must be a non-empty list"}, 400
 
     fields = data.get("fields")
     if fields is not None and not isinstance(fields, list):
-        return jsonify({"error": "fields must be a list of field names"}), 400
+        return {"error": "fields must be a list of field names"}, 400
 
     store_raw = data.get("store_raw", True)
     force_refresh = bool(data.get("force_refresh", False))
@@ -2855,26 +3461,18 @@ def fetch_linkedin_creative_demographics_portfolio():
     max_creatives_per_run = int(data.get("max_creatives_per_run") or 10)
     max_pivots_per_creative = int(data.get("max_pivots_per_creative") or 3)
     sleep_ms_between_calls = int(data.get("sleep_ms_between_calls") or 300)
-
-    is_valid, error_msg = validate_date_range(start_date_s, end_date_s)
-    if not is_valid:
-        return jsonify({"error": error_msg}), 400
+    max_workers = min(max(int(data.get("max_workers") or 4), 1), 8)
+    creative_batch_size = min(max(int(data.get("creative_batch_size") or 1), 1), _LINKEDIN_CREATIVE_BATCH_MAX)
 
     if not account_urn:
-        return jsonify({"error": "account_urn is required (or set LINKEDIN_AD_ACCOUNT_URN)."}), 400
+        return {"error": "account_urn is required (or set LINKEDIN_AD_ACCOUNT_URN)."}, 400
 
-    account_urn = account_urn.strip()
     if account_urn.isdigit():
         account_urn = f"urn:li:sponsoredAccount:{account_urn}"
 
     try:
-        from bigas.resources.marketing.linkedin_ads_service import LinkedInAdsService
-        from bigas.resources.marketing.storage_service import StorageService
-
-        svc = LinkedInAdsService()
-        storage = StorageService()
-        start_d = date.fromisoformat(start_date_s)
-        end_d = date.fromisoformat(end_date_s)
+        svc = _get_linkedin_svc()
+        storage = _get_storage_service()
 
         cleaned_fields = None
         if fields:
@@ -2883,85 +3481,238 @@ def fetch_linkedin_creative_demographics_portfolio():
         linkedin_version = os.environ.get("LINKEDIN_VERSION") or "202601"
 
         # Request metrics so the summarizer has impressions/clicks/cost per segment (required for portfolio insights).
-        required_fields = {"dateRange", "pivotValues", "impressions", "clicks", "costInLocalCurrency"}
-        final_fields = sorted(set((cleaned_fields or [])) | required_fields) if (cleaned_fields is not None) else sorted(required_fields)
+        final_fields = (
+            sorted(_LINKEDIN_REQUIRED_FIELDS.union(cleaned_fields))
+            if cleaned_fields is not None
+            else list(_LINKEDIN_SORTED_REQUIRED_FIELDS)
+        )
 
         safe_account = account_urn.split(":")[-1]
-
-        results = []
+        safe_account_id = int(safe_account) if safe_account.isdigit() else None
 
         limited_creatives = creative_ids[:max_creatives_per_run]
-        limited_pivots = [str(p).strip().upper() for p in pivots if str(p).strip()][:max_pivots_per_creative]
+        limited_pivots = [u for p in pivots if (u := _norm(str(p)))][:max_pivots_per_creative]
+
+        # One listing of this account's blobs for the end date replaces a HEAD/GET per
+        # (creative, pivot) for existence checks; None means the listing failed.
+        existing = (
+            storage.list_existing(f"raw_ads/linkedin/{end_date_s}/ad_analytics_v2_{safe_account}_")
+            if (store_raw and not force_refresh)
+            else None
+        )
 
-        total_calls = len(limited_creatives) * len(limited_pivots)
-        call_index = 0
+        def _blob_exists(name: str) -> bool:
+            return name in existing if existing is not None else storage.blob_exists(name)
 
+        tasks = []
         for cid in limited_creatives:
             cid_str = str(cid).strip()
             if not cid_str:
                 continue
-            creative_urn = f"urn:li:sponsoredCreative:{cid_str}"
-
             for pivot_name in limited_pivots:
-                call_index += 1
+                tasks.append((cid_str, pivot_name))
+
+        # LinkedIn calls are network-bound: run them on a small pool, spaced out by a shared
+        # limiter so the account-wide call rate stays within the old sequential budget.
+        spacer = _CallSpacer(sleep_ms_between_calls / 1000.0)
+        # Blob writes start as soon as each fetch produces a document, so GCS uploads overlap
+        # the remaining LinkedIn calls; (blob_name, future) pairs are checked once all finish.
+        upload_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="bigas-li-demo-upload")
+        raw_uploads: List[Tuple[str, Future]] = []
+        enriched_uploads: List[Tuple[str, Future]] = []
+        # Shared across every (creative, pivot) enrichment so each creative and standardized
+        # URN is looked up once per run.
+        batch_creative_cache: Dict[str, Any] = {}
+        batch_urn_cache: Dict[str, Any] = {}
+
+        # Run-invariant part of the cache signature; each task overrides pivot and creative_urns
+        # in place, so key order (and therefore the hash) is unchanged.
+        base_signature: Dict[str, Any] = {
+            "platform": "linkedin",
+            "endpoint": "adAnalytics",
+            "finder": "analytics",
+            "account_urns": [account_urn],
+            "start_date": start_date_s,
+            "end_date": end_date_s,
+            "time_granularity": time_granularity,
+            "pivot": None,
+            "pivots": None,
+            "campaign_urns": None,
+            "campaign_group_urns": None,
+            "creative_urns": None,
+            "fields": final_fields,
+            "version": linkedin_version,
+            "include_entity_names": include_entity_names,
+        }
 
-                request_signature = {
-                    "platform": "linkedin",
-                    "endpoint": "adAnalytics",
-                    "finder": "analytics",
-                    "account_urns": [account_urn],
-                    "start_date": start_date_s,
-                    "end_date": end_date_s,
-                    "time_granularity": time_granularity,
-                    "pivot": pivot_name,
-                    "pivots": None,
-                    "campaign_urns": None,
-                    "campaign_group_urns": None,
-                    "creative_urns": [creative_urn],
-                    "fields": final_fields,
-                    "version": linkedin_version,
-                    "include_entity_names": include_entity_names,
-                }
-                signature_json = json.dumps(request_signature, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
-                request_hash = hashlib.sha256(signature_json.encode("utf-8")).hexdigest()
-                hash_prefix = request_hash[:12]
-                base_name = f"ad_analytics_{safe_account}_{pivot_name}_{cid_str}"
-                blob_name = f"raw_ads/linkedin/{end_date_s}/{base_name}_{hash_prefix}.json"
-                enriched_blob_name = f"raw_ads/linkedin/{end_date_s}/{base_name}_{hash_prefix}.enriched.json"
-
-                from_cache = False
-                elements_count = None
-
-                if store_raw and not force_refresh and storage.blob_exists(blob_name):
-                    cached = storage.get_json(blob_name) or {}
-                    cached_payload = cached.get("payload") if isinstance(cached, dict) else {}
-                    cached_response = cached_payload.get("response") if isinstance(cached_payload, dict) else {}
-                    elements = cached_response.get("elements", []) if isinstance(cached_response, dict) else []
-                    elements_count = len(elements) if isinstance(elements, list) else None
-                    from_cache = True
-                    logger.info(
-                        "LinkedIn portfolio: cache hit for creative=%s pivot=%s (elements=%s)",
-                        cid_str,
-                        pivot_name,
-                        elements_count,
+        def _task_names(cid_str: str, pivot_name: str) -> Tuple[Dict[str, Any], str, str, str]:
+            creative_urn = f"urn:li:sponsoredCreative:{cid_str}"
+            request_signature = {**base_signature, "pivot": pivot_name, "creative_urns": [creative_urn]}
+            # Fixed-order keys: hash without a key sort under the "v2" blob namespace.
+            request_hash = hashlib.blake2b(
+                _canonical_json_bytes(request_signature, sort_keys=False), digest_size=8
+            ).hexdigest()
+            base_name = f"ad_analytics_v2_{safe_account}_{pivot_name}_{cid_str}"
+            blob_name = f"raw_ads/linkedin/{end_date_s}/{base_name}_{request_hash}.json"
+            enriched_blob_name = f"raw_ads/linkedin/{end_date_s}/{base_name}_{request_hash}.enriched.json"
+            return request_signature, request_hash, blob_name, enriched_blob_name
+
+        # (creative id, pivot) -> analytics-shaped response split out of a batched statistics call.
+        prefetched: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+        def _fetch_batch(pivot_name: str, cids: List[str]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+            spacer.acquire()
+            try:
+                raw = svc.ad_analytics_statistics(
+                    start_date=start_d,
+                    end_date=end_d,
+                    time_granularity=time_granularity,
+                    pivots=["CREATIVE", pivot_name],
+                    account_urns=[account_urn],
+                    creative_urns=[f"urn:li:sponsoredCreative:{c}" for c in cids],
+                    fields=final_fields,
+                )
+            except Exception:
+                # Leave these (creative, pivot) pairs to the per-creative fetch below.
+                logger.warning(
+                    "LinkedIn portfolio: batched fetch failed for pivot=%s creatives=%s: %s",
+                    pivot_name,
+                    len(cids),
+                    traceback.format_exc(),
+                )
+                return {}
+            return _split_linkedin_creative_rows(raw, pivot_name, cids)
+
+        def _fetch_one(cid_str: str, pivot_name: str) -> Dict[str, Any]:
+            creative_urn = f"urn:li:sponsoredCreative:{cid_str}"
+            request_signature, request_hash, blob_name, enriched_blob_name = _task_names(cid_str, pivot_name)
+
+            from_cache = False
+            elements_count = None
+
+            cached = None
+            cached_meta: Optional[Dict[str, str]] = None
+            needs_enrichment = False
+            if store_raw and not force_refresh and (existing is None or blob_name in existing):
+                needs_enrichment = include_entity_names and not _blob_exists(enriched_blob_name)
+                if needs_enrichment:
+                    cached = storage.get_json_if_exists(blob_name)
+                else:
+                    # Nothing below needs the report body: a metadata-only read confirms the
+                    # blob and carries elements_count (absent on older blobs).
+                    cached_meta = storage.get_metadata(blob_name)
+            if cached_meta is not None:
+                count_s = str(cached_meta.get("elements_count", ""))
+                elements_count = int(count_s) if count_s.isdigit() else None
+                from_cache = True
+                logger.info(
+                    "LinkedIn portfolio: cache hit for creative=%s pivot=%s (elements=%s)",
+                    cid_str,
+                    pivot_name,
+                    elements_count,
+                )
+            elif cached is not None:
+                cached_payload = cached.get("payload") if isinstance(cached, dict) else {}
+                cached_response = cached_payload.get("response") if isinstance(cached_payload, dict) else {}
+                elements = cached_response.get("elements", []) if isinstance(cached_response, dict) else []
+                elements_count = len(elements) if isinstance(elements, list) else None
+                from_cache = True
+                logger.info(
+                    "LinkedIn portfolio: cache hit for creative=%s pivot=%s (elements=%s)",
+                    cid_str,
+                    pivot_name,
+                    elements_count,
+                )
+                # Ensure enriched blob exists when we return enriched_storage_path (summarizer needs it).
+                if needs_enrichment:
+                    try:
+                        enriched = _enrich_linkedin_adanalytics_response(
+                            cached_response,
+                            account_id=safe_account_id,
+                            svc=svc,
+                            context={"creative_urns": [creative_urn]},
+                            creative_cache=batch_creative_cache,
+                            urn_cache=batch_urn_cache,
+                        )
+                        enriched_uploads.append((enriched_blob_name, upload_pool.submit(
+                            storage.store_json,
+                            enriched_blob_name,
+                            {
+                                "metadata": {
+                                    "platform": "linkedin",
+                                    "report_date": end_date_s,
+                                    "report_type": "raw_ads_enriched",
+                                    "stored_at": datetime.utcnow().isoformat(),
+                                    "version": "1.0",
+                                    "request_hash": request_hash,
+                                },
+                                "payload": {
+                                    "request_hash": request_hash,
+                                    "source_blob": blob_name,
+                                    "enriched_response": enriched,
+                                },
+                            },
+                        )))
+                        logger.info(
+                            "LinkedIn portfolio: queued missing enriched blob for creative=%s pivot=%s",
+                            cid_str,
+                            pivot_name,
+                        )
+                    except Exception:
+                        logger.warning(
+                            "LinkedIn portfolio enrichment (on cache hit) failed for creative=%s pivot=%s: %s",
+                            cid_str,
+                            pivot_name,
+                            traceback.format_exc(),
+                        )
+            else:
+                raw = prefetched.get((cid_str, pivot_name))
+                if raw is None:
+                    spacer.acquire()
+                    raw = svc.ad_analytics(
+                        start_date=start_d,
+                        end_date=end_d,
+                        time_granularity=time_granularity,
+                        pivot=pivot_name,
+                        account_urns=[account_urn],
+                        campaign_urns=None,
+                        campaign_group_urns=None,
+                        creative_urns=[creative_urn],
+                        fields=final_fields,
                     )
-                    # Ensure enriched blob exists when we return enriched_storage_path (summarizer needs it).
-                    if include_entity_names and not storage.blob_exists(enriched_blob_name):
+                elements = raw.get("elements", []) if isinstance(raw, dict) else []
+                elements_count = len(elements) if isinstance(elements, list) else None
+
+                if store_raw:
+                    raw_uploads.append((blob_name, upload_pool.submit(
+                        storage.store_json,
+                        blob_name,
+                        storage.raw_ads_report_document(
+                            platform="linkedin",
+                            report_data={
+                                "request": request_signature,
+                                "response": raw,
+                            },
+                            report_date=end_date_s,
+                            metadata={"request_hash": request_hash},
+                        ),
+                        {"elements_count": str(elements_count)} if elements_count is not None else None,
+                    )))
+
+                    if include_entity_names:
                         try:
-                            safe_account_id = None
-                            try:
-                                safe_account_id = int(safe_account)
-                            except Exception:
-                                safe_account_id = None
                             enriched = _enrich_linkedin_adanalytics_response(
-                                cached_response,
+                                raw,
                                 account_id=safe_account_id,
                                 svc=svc,
                                 context={"creative_urns": [creative_urn]},
+                                creative_cache=batch_creative_cache,
+                                urn_cache=batch_urn_cache,
                             )
-                            storage.store_json(
-                                blob_name=enriched_blob_name,
-                                data={
+                            enriched_uploads.append((enriched_blob_name, upload_pool.submit(
+                                storage.store_json,
+                                enriched_blob_name,
+                                {
                                     "metadata": {
                                         "platform": "linkedin",
                                         "report_date": end_date_s,
@@ -2976,117 +3727,170 @@ def fetch_linkedin_creative_demographics_portfolio():
                                         "enriched_response": enriched,
                                     },
                                 },
-                            )
-                            logger.info(
-                                "LinkedIn portfolio: created missing enriched blob for creative=%s pivot=%s",
-                                cid_str,
-                                pivot_name,
-                            )
+                            )))
                         except Exception:
                             logger.warning(
-                                "LinkedIn portfolio enrichment (on cache hit) failed for creative=%s pivot=%s: %s",
+                                "LinkedIn portfolio enrichment failed for creative=%s pivot=%s: %s",
                                 cid_str,
                                 pivot_name,
                                 traceback.format_exc(),
                             )
-                else:
-                    raw = svc.ad_analytics(
-                        start_date=start_d,
-                        end_date=end_d,
-                        time_granularity=time_granularity,
-                        pivot=pivot_name,
-                        account_urns=[account_urn],
-                        campaign_urns=None,
-                        campaign_group_urns=None,
-                        creative_urns=[creative_urn],
-                        fields=final_fields,
-                    )
-                    elements = raw.get("elements", []) if isinstance(raw, dict) else []
-                    elements_count = len(elements) if isinstance(elements, list) else None
 
-                    if store_raw:
-                        storage.store_raw_ads_report_at_blob(
-                            platform="linkedin",
-                            blob_name=blob_name,
-                            report_data={
-                                "request": request_signature,
-                                "response": raw,
-                            },
-                            report_date=end_date_s,
-                            metadata={"request_hash": request_hash},
-                        )
+            return {
+                "creative_id": cid_str,
+                "pivot": pivot_name,
+                "request_hash": request_hash,
+                "from_cache": from_cache,
+                "elements_count": elements_count,
+                "storage_path": (blob_name if store_raw else None),
+                "enriched_storage_path": (
+                    enriched_blob_name if (store_raw and include_entity_names) else None
+                ),
+            }
 
-                        if include_entity_names:
-                            try:
-                                safe_account_id = None
-                                try:
-                                    safe_account_id = int(safe_account)
-                                except Exception:
-                                    safe_account_id = None
-
-                                enriched = _enrich_linkedin_adanalytics_response(
-                                    raw,
-                                    account_id=safe_account_id,
-                                    svc=svc,
-                                    context={"creative_urns": [creative_urn]},
-                                )
-                                storage.store_json(
-                                    blob_name=enriched_blob_name,
-                                    data={
-                                        "metadata": {
-                                            "platform": "linkedin",
-                                            "report_date": end_date_s,
-                                            "report_type": "raw_ads_enriched",
-                                            "stored_at": datetime.utcnow().isoformat(),
-                                            "version": "1.0",
-                                            "request_hash": request_hash,
-                                        },
-                                        "payload": {
-                                            "request_hash": request_hash,
-                                            "source_blob": blob_name,
-                                            "enriched_response": enriched,
-                                        },
-                                    },
-                                )
-                            except Exception:
-                                logger.warning(
-                                    "LinkedIn portfolio enrichment failed for creative=%s pivot=%s: %s",
-                                    cid_str,
-                                    pivot_name,
-                                    traceback.format_exc(),
-                                )
-
-                    # Gentle delay between LinkedIn calls
-                    if sleep_ms_between_calls > 0:
-                        time.sleep(sleep_ms_between_calls / 1000.0)
-
-                results.append(
-                    {
-                        "creative_id": cid_str,
-                        "pivot": pivot_name,
-                        "request_hash": request_hash,
-                        "from_cache": from_cache,
-                        "elements_count": elements_count,
-                        "storage_path": (blob_name if store_raw else None),
-                        "enriched_storage_path": (
-                            enriched_blob_name if (store_raw and include_entity_names) else None
-                        ),
-                    }
-                )
+        # Batch only pairs known to need a live fetch; when the blob listing failed, cache
+        # state is unknown and the per-creative path decides.
+        batches: List[Tuple[str, List[str]]] = []
+        if creative_batch_size > 1:
+            to_fetch: Dict[str, List[str]] = {}
+            for cid_str, pivot_name in tasks:
+                if store_raw and not force_refresh:
+                    if existing is None or _task_names(cid_str, pivot_name)[2] in existing:
+                        continue
+                to_fetch.setdefault(pivot_name, []).append(cid_str)
+            for pivot_name, cids in to_fetch.items():
+                if len(cids) < 2:
+                    continue
+                for i in range(0, len(cids), creative_batch_size):
+                    batches.append((pivot_name, cids[i:i + creative_batch_size]))
+
+        with upload_pool:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bigas-li-demo") as pool:
+                for split in pool.map(lambda b: _fetch_batch(*b), batches):
+                    prefetched.update(split)
+                futures = [pool.submit(_fetch_one, cid_str, pivot_name) for cid_str, pivot_name in tasks]
+                # Preserve the (creative, pivot) request order in the response.
+                results = [f.result() for f in futures]
+
+        # Raw blobs are the cache and must land; enriched blobs are best-effort.
+        for name, upload in raw_uploads:
+            exc = upload.exception()
+            if exc is not None:
+                raise exc
+        for name, upload in enriched_uploads:
+            exc = upload.exception()
+            if exc is not None:
+                logger.warning("LinkedIn portfolio: failed to store enriched blob %s: %s", name, exc)
 
-        return jsonify(
+        return (
             {
                 "status": "success",
                 "account_urn": account_urn,
                 "date_range": {"start_date": start_date_s, "end_date": end_date_s},
-                "total_calls": call_index,
+                "total_calls": len(tasks),
                 "results": results,
-            }
+            },
+            200,
         )
     except Exception:
-        logger.error("Error in fetch_linkedin_creative_demographics_portfolio: %s", traceback.format_exc())
-        sanitized_error = sanitize_error_message(str(traceback.format_exc()))
-        return jsonify({"error": sanitized_error}), 500
+        tb = traceback.format_exc()
+        logger.error("Error in fetch_linkedin_creative_demographics_portfolio: %s", tb)
+        sanitized_error = sanitize_error_message(tb[-_ERROR_TRACEBACK_MAX_CHARS:])
+        return {"error": sanitized_error}, 500
+
+
+# Standardized-data URN kind (urn:li:<kind>:<id>) -> LinkedInAdsService batch getter.
+_URN_BATCH_RESOLVERS = {
+    "geo": "get_geos",
+    "title": "get_titles",
+    "function": "get_functions",
+    "industry": "get_industries",
+    "seniority": "get_seniorities",
+}
+
+# Standardized-data URN kind -> LinkedInAdsService single-id getter.
+_URN_RESOLVERS = {
+    "geo": "get_geo",
+    "title": "get_title",
+    "function": "get_function",
+    "industry": "get_industry",
+    "seniority": "get_seniority",
+}
+
+# Resolved standardized URNs (titles, geos, ...) shared across requests: this reference data
+# rarely changes, and scheduled reports resolve the same URNs run after run. Only successful
+# lookups are kept so transient failures are retried on the next request.
+_STANDARDIZED_URN_CACHE = TTLCache(maxsize=4096, ttl=6 * 3600)
+
+
+def _prefetch_standardized_urns(elements: List[Any], svc: Any, urn_cache: Dict[str, Any]) -> None:
+    """
+    Resolve every standardized URN in elements' pivotValues with one batch call per kind,
+    filling urn_cache. Kinds whose batch call fails are left for per-URN lookups.
+    """
+    needed: Dict[str, Set[str]] = {}
+    for el in elements:
+        pivot_values = el.get("pivotValues") if isinstance(el, dict) else None
+        if not isinstance(pivot_values, list):
+            continue
+        for pv in pivot_values:
+            parts = str(pv).strip().split(":")
+            if len(parts) == 4 and parts[2] in _URN_BATCH_RESOLVERS and parts[0] == "urn" and parts[1] == "li":
+                urn = f"urn:li:{parts[2]}:{parts[3]}"
+                if urn in urn_cache:
+                    continue
+                known = _STANDARDIZED_URN_CACHE.get(urn)
+                if known is not None:
+                    urn_cache[urn] = known
+                else:
+                    needed.setdefault(parts[2], set()).add(parts[3])
+
+    for kind, ids in needed.items():
+        batch_get = getattr(svc, _URN_BATCH_RESOLVERS[kind], None)
+        if batch_get is None:
+            continue
+        try:
+            found = batch_get(sorted(ids))
+        except Exception as e:
+            logger.info("Batch %s lookup failed, falling back to per-URN lookups: %s", kind, e)
+            continue
+        for i in ids:
+            urn = f"urn:li:{kind}:{i}"
+            urn_cache[urn] = found.get(i)
+            if urn_cache[urn] is not None:
+                _STANDARDIZED_URN_CACHE.set(urn, urn_cache[urn])
+
+
+def _linkedin_ratio_columns(
+    impr_col: List[Optional[int]],
+    clicks_col: List[Optional[int]],
+    cost_col: List[Optional[float]],
+    total_impr: int,
+    total_clicks: int,
+    total_cost: float,
+) -> Tuple[List[Dict[str, float]], List[Dict[str, float]]]:
+    """
+    Per-row CTR/CPC and share-of-total ratios for LinkedIn adAnalytics rows, computed in
+    one pass over the metric columns. Missing metrics (None) leave the ratio out.
+    """
+    derived_col: List[Dict[str, float]] = []
+    shares_col: List[Dict[str, float]] = []
+    for impr, clicks, cost in zip(impr_col, clicks_col, cost_col):
+        derived: Dict[str, float] = {}
+        if impr is not None and impr > 0 and clicks is not None:
+            derived["ctr"] = clicks / impr
+        if clicks is not None and clicks > 0 and cost is not None:
+            derived["avg_cpc_local"] = cost / clicks
+        shares: Dict[str, float] = {}
+        if total_impr > 0 and impr is not None:
+            shares["impressions_share"] = impr / total_impr
+        if total_clicks > 0 and clicks is not None:
+            shares["clicks_share"] = clicks / total_clicks
+        if cost is not None and total_cost != 0:
+            shares["cost_share_local"] = cost / total_cost
+        derived_col.append(derived)
+        shares_col.append(shares)
+    return derived_col, shares_col
 
 
 def _enrich_linkedin_adanalytics_response(
@@ -3095,10 +3899,15 @@ def _enrich_linkedin_adanalytics_response(
     account_id: Optional[int],
     svc: Any,
     context: Optional[Dict[str, Any]] = None,
+    creative_cache: Optional[Dict[str, Any]] = None,
+    urn_cache: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
     Best-effort enrichment of adAnalytics response.
 
+    creative_cache / urn_cache may be shared across calls (e.g. every pivot of a portfolio
+    batch) so each creative or standardized URN is resolved once per batch.
+
     Adds:
     - Stable structure: {dateRange, pivotValues, metrics}
     - Best-effort URN resolution for common pivotValues:
@@ -3112,9 +3921,12 @@ def _enrich_linkedin_adanalytics_response(
     if not isinstance(elements, list):
         return {"elements": []}
 
-    # Local caches to keep enrichment fast.
-    creative_cache: Dict[str, Any] = {}
-    urn_cache: Dict[str, Any] = {}
+    # Caches to keep enrichment fast; per call unless the caller shares them.
+    if creative_cache is None:
+        creative_cache = {}
+    if urn_cache is None:
+        urn_cache = {}
+    _prefetch_standardized_urns(elements, svc, urn_cache)
 
     def _resolve_urn(u: str) -> Optional[Dict[str, Any]]:
         u = (u or "").strip()
@@ -3122,32 +3934,22 @@ def _enrich_linkedin_adanalytics_response(
             return None
         if u in urn_cache:
             return urn_cache[u]
+        parts = u.split(":", 3)
+        method = _URN_RESOLVERS.get(parts[2]) if len(parts) == 4 and parts[0] == "urn" and parts[1] == "li" else None
+        if method is None:
+            urn_cache[u] = None
+            return None
+        known = _STANDARDIZED_URN_CACHE.get(u)
+        if known is not None:
+            urn_cache[u] = known
+            return known
         try:
-            if u.startswith("urn:li:geo:"):
-                geo_id = u.split(":")[-1]
-                urn_cache[u] = svc.get_geo(geo_id)
-                return urn_cache[u]
-            if u.startswith("urn:li:title:"):
-                title_id = u.split(":")[-1]
-                urn_cache[u] = svc.get_title(title_id)
-                return urn_cache[u]
-            if u.startswith("urn:li:function:"):
-                fid = u.split(":")[-1]
-                urn_cache[u] = svc.get_function(fid)
-                return urn_cache[u]
-            if u.startswith("urn:li:industry:"):
-                iid = u.split(":")[-1]
-                urn_cache[u] = svc.get_industry(iid)
-                return urn_cache[u]
-            if u.startswith("urn:li:seniority:"):
-                sid = u.split(":")[-1]
-                urn_cache[u] = svc.get_seniority(sid)
-                return urn_cache[u]
+            urn_cache[u] = getattr(svc, method)(parts[3].rsplit(":", 1)[-1])
         except Exception:
             urn_cache[u] = None
-            return None
-        urn_cache[u] = None
-        return None
+        if urn_cache[u] is not None:
+            _STANDARDIZED_URN_CACHE.set(u, urn_cache[u])
+        return urn_cache[u]
 
     def _resolve_creative(creative_urn: str) -> Optional[Dict[str, Any]]:
         creative_urn = (creative_urn or "").strip()
@@ -3196,11 +3998,36 @@ def _enrich_linkedin_adanalytics_response(
         out["context"]["creative_urns"] = creative_urns_ctx
         out["context"]["creatives"] = resolved_creatives
 
+    def _to_decimal(v: Any) -> Optional[Decimal]:
+        if v is None:
+            return None
+        if isinstance(v, (int, float)):
+            try:
+                return Decimal(str(v))
+            except Exception:
+                return None
+        if isinstance(v, str):
+            s = v.strip()
+            if not s:
+                return None
+            try:
+                return Decimal(s)
+            except InvalidOperation:
+                return None
+        return None
+
+    # Per-row impressions/clicks/cost, collected during the main pass for totals and shares.
+    impr_col: List[Optional[int]] = []
+    clicks_col: List[Optional[int]] = []
+    cost_col: List[Optional[Decimal]] = []
+
     for el in elements:
         if not isinstance(el, dict):
             continue
 
-        pivot_values = el.get("pivotValues") if isinstance(el.get("pivotValues"), list) else []
+        pivot_values = el.get("pivotValues")
+        if not isinstance(pivot_values, list):
+            pivot_values = []
         resolved = []
         for pv in pivot_values:
             pv_s = str(pv)
@@ -3222,34 +4049,17 @@ def _enrich_linkedin_adanalytics_response(
                     # common shapes:
                     # - {"name":{"localized":{"en_US":"..."}}}
                     # - geo: {"defaultLocalizedName":{"value":"United States"}}
-                    name = None
-                    if isinstance(info.get("name"), dict):
-                        name = (((info.get("name") or {}).get("localized") or {}).get("en_US"))
-                    if not name and isinstance(info.get("defaultLocalizedName"), dict):
-                        name = (info.get("defaultLocalizedName") or {}).get("value")
+                    name_obj = info.get("name")
+                    name = (name_obj.get("localized") or {}).get("en_US") if isinstance(name_obj, dict) else None
+                    if not name:
+                        default_name = info.get("defaultLocalizedName")
+                        if isinstance(default_name, dict):
+                            name = default_name.get("value")
                     item["name"] = name
                     item["raw"] = info
 
             resolved.append(item)
 
-        def _to_decimal(v: Any) -> Optional[Decimal]:
-            if v is None:
-                return None
-            if isinstance(v, (int, float)):
-                try:
-                    return Decimal(str(v))
-                except Exception:
-                    return None
-            if isinstance(v, str):
-                s = v.strip()
-                if not s:
-                    return None
-                try:
-                    return Decimal(s)
-                except InvalidOperation:
-                    return None
-            return None
-
         metrics = {k: v for k, v in el.items() if k not in {"dateRange", "pivotValues"}}
         impressions = metrics.get("impressions")
         clicks = metrics.get("clicks")
@@ -3259,42 +4069,24 @@ def _enrich_linkedin_adanalytics_response(
         clicks_i = int(clicks) if isinstance(clicks, int) else None
         cost_d = _to_decimal(cost_local)
 
-        derived: Dict[str, Any] = {}
-        if impressions_i is not None and impressions_i > 0 and clicks_i is not None:
-            derived["ctr"] = float(Decimal(clicks_i) / Decimal(impressions_i))
-        if clicks_i is not None and clicks_i > 0 and cost_d is not None:
-            derived["avg_cpc_local"] = float(cost_d / Decimal(clicks_i))
-
+        # derived/shares are filled in by _linkedin_ratio_columns once all rows are collected.
         out["elements"].append(
             {
                 "dateRange": el.get("dateRange"),
                 "pivotValues": pivot_values,
                 "pivotValuesResolved": resolved,
                 "metrics": metrics,
-                "derived": derived,
             }
         )
+        impr_col.append(impressions_i)
+        clicks_col.append(clicks_i)
+        cost_col.append(cost_d)
 
     # Add report-level totals and per-row shares (for UI-like % columns).
-    total_impr = 0
-    total_clicks = 0
-    total_cost: Optional[Decimal] = None
-    for row in out["elements"]:
-        m = row.get("metrics") if isinstance(row, dict) else None
-        if not isinstance(m, dict):
-            continue
-        if isinstance(m.get("impressions"), int):
-            total_impr += int(m["impressions"])
-        if isinstance(m.get("clicks"), int):
-            total_clicks += int(m["clicks"])
-        c = m.get("costInLocalCurrency")
-        cd = None
-        try:
-            cd = Decimal(str(c)) if c is not None else None
-        except Exception:
-            cd = None
-        if cd is not None:
-            total_cost = (total_cost or Decimal("0")) + cd
+    total_impr = sum(v for v in impr_col if v is not None)
+    total_clicks = sum(v for v in clicks_col if v is not None)
+    present_costs = [v for v in cost_col if v is not None]
+    total_cost: Optional[Decimal] = sum(present_costs, Decimal("0")) if present_costs else None
 
     out["summary"] = {
         "rows": len(out["elements"]),
@@ -3305,22 +4097,15 @@ def _enrich_linkedin_adanalytics_response(
         },
     }
 
-    for row in out["elements"]:
-        m = row.get("metrics") if isinstance(row, dict) else None
-        if not isinstance(m, dict):
-            continue
-        shares: Dict[str, Any] = {}
-        if total_impr > 0 and isinstance(m.get("impressions"), int):
-            shares["impressions_share"] = float(Decimal(int(m["impressions"])) / Decimal(total_impr))
-        if total_clicks > 0 and isinstance(m.get("clicks"), int):
-            shares["clicks_share"] = float(Decimal(int(m["clicks"])) / Decimal(total_clicks))
-        if total_cost is not None:
-            try:
-                cd = Decimal(str(m.get("costInLocalCurrency"))) if m.get("costInLocalCurrency") is not None else None
-            except Exception:
-                cd = None
-            if cd is not None and total_cost != 0:
-                shares["cost_share_local"] = float(cd / total_cost)
+    # Ratios are returned as floats, so the numeric pass runs on float columns; Decimal is
+    # kept only for the exact total cost string above.
+    cost_f_col = [float(v) if v is not None else None for v in cost_col]
+    total_cost_f = float(total_cost) if total_cost is not None else 0.0
+    derived_col, shares_col = _linkedin_ratio_columns(
+        impr_col, clicks_col, cost_f_col, total_impr, total_clicks, total_cost_f
+    )
+    for row, derived, shares in zip(out["elements"], derived_col, shares_col):
+        row["derived"] = derived
         row["shares"] = shares
 
     return out
@@ -3340,36 +4125,52 @@ def summarize_linkedin_ad_analytics():
       - llm_model: optional OpenAI model name (default: gpt-4)
       - discord_webhook_env: optional env var name for Discord webhook.
           Defaults to DISCORD_WEBHOOK_URL_MARKETING, then DISCORD_WEBHOOK_URL.
+      - async: bool (default: false). Return a job_id immediately and run the LLM call and
+          Discord post in the background; poll get_job_status / get_job_result.
+      - timeout_seconds: int (default: 300, 10-900). Only used with async.
 
     Behaviour:
       - If the enriched report has no elements, a short "no data" message is posted to Discord.
       - Otherwise, the endpoint sends a compact version of the report to OpenAI and
         posts the resulting analysis to Discord.
     """
-    data = request.json or {}
+    body, status = _summarize_linkedin_ad_analytics_impl(request.json or {})
+    return jsonify(body), status
+
+
+def _summarize_linkedin_ad_analytics_impl(data: Dict[str, Any]) -> Tuple[Any, int]:
+    """Body of summarize_linkedin_ad_analytics, returning (body, status) so pipelines can call it in-process."""
     enriched_path = (data.get("enriched_storage_path") or "").strip()
     if not enriched_path:
-        return jsonify({"error": "enriched_storage_path is required"}), 400
+        return {"error": "enriched_storage_path is required"}, 400
 
     if not OPENAI_API_KEY:
-        return jsonify({"error": "OPENAI_API_KEY is not configured on the server"}), 500
+        return {"error": "OPENAI_API_KEY is not configured on the server"}, 500
+
+    # The LLM call can take tens of seconds; in async mode the request thread is released
+    # right away and the summary runs as a background job.
+    run_async = bool(data.get("async", False)) and not bool(data.get("_internal_async_worker", False))
+    if run_async:
+        # Reject bad payloads here, as async_dispatch does, rather than queuing a job that fails.
+        is_valid, error_msg = validate_request_data(data)
+        if not is_valid:
+            return {"error": error_msg}, 400
+        return _accept_async_job(data, _run_linkedin_ad_summary_job), 200
 
     # Resolve Discord webhook
     webhook_env = (data.get("discord_webhook_env") or "").strip() or "DISCORD_WEBHOOK_URL_MARKETING"
     webhook_url = os.environ.get(webhook_env) or os.environ.get("DISCORD_WEBHOOK_URL")
 
     try:
-        from bigas.resources.marketing.storage_service import StorageService
-
-        storage = StorageService()
-        obj = storage.get_json(enriched_path)
+        storage = _get_storage_service()
+        obj = storage.get_json_cached(enriched_path)
         if not isinstance(obj, dict):
-            return jsonify({"error": f"Enriched report at {enriched_path} is not a JSON object"}), 500
+            return {"error": f"Enriched report at {enriched_path} is not a JSON object"}, 500
 
         payload = obj.get("payload") or {}
         enriched = payload.get("enriched_response") or {}
         if not isinstance(enriched, dict):
-            return jsonify({"error": "enriched_response missing or invalid in enriched report"}), 500
+            return {"error": "enriched_response missing or invalid in enriched report"}, 500
 
         elements = enriched.get("elements") or []
         summary = enriched.get("summary") or {}
@@ -3384,13 +4185,14 @@ def summarize_linkedin_ad_analytics():
             )
             if webhook_url:
                 post_to_discord(webhook_url, no_data_message)
-            return jsonify(
+            return (
                 {
                     "status": "success",
                     "had_data": False,
                     "discord_posted": bool(webhook_url),
                     "enriched_storage_path": enriched_path,
-                }
+                },
+                200,
             )
 
         # Build a compact analytics payload for the LLM.
@@ -3400,34 +4202,7 @@ def summarize_linkedin_ad_analytics():
         #   - a compact sample of rows as examples (names + key metrics only)
         sample_limit = int(data.get("sample_limit") or 50)
 
-        compact_rows = []
-        for el in elements[:sample_limit]:
-            if not isinstance(el, dict):
-                continue
-            pivots_resolved = el.get("pivotValuesResolved") or []
-            seg_names = []
-            for pv in pivots_resolved:
-                if not isinstance(pv, dict):
-                    continue
-                name = pv.get("name") or pv.get("urn")
-                if name:
-                    seg_names.append(str(name))
-            metrics = el.get("metrics") or {}
-            derived = el.get("derived") or {}
-            compact_rows.append(
-                {
-                    "segments": seg_names,
-                    "metrics": {
-                        "impressions": metrics.get("impressions"),
-                        "clicks": metrics.get("clicks"),
-                        "costInLocalCurrency": metrics.get("costInLocalCurrency"),
-                    },
-                    "derived": {
-                        "ctr": derived.get("ctr"),
-                        "avg_cpc_local": derived.get("avg_cpc_local"),
-                    },
-                }
-            )
+        compact_rows = _compact_linkedin_rows(elements, sample_limit)
 
         analytics_payload = {
             "platform": "linkedin",
@@ -3442,47 +4217,56 @@ def summarize_linkedin_ad_analytics():
 
         prompt_cfg = AD_SUMMARY_PROMPTS.get(("linkedin", "ad_analytics"))
         if not prompt_cfg:
-            return jsonify({"error": "Prompt configuration missing for LinkedIn ad analytics"}), 500
+            return {"error": "Prompt configuration missing for LinkedIn ad analytics"}, 500
 
         system_prompt = prompt_cfg["system"]
-        user_prompt = prompt_cfg["user_template"].format(
+        user_prompt = prompt_cfg["render"](
             platform="linkedin",
-            payload=json.dumps(analytics_payload, indent=2),
+            payload=_dumps_llm_payload(analytics_payload),
         )
 
         llm, _ = get_llm_client(feature="marketing", explicit_model=model)
-        analysis_text = llm.complete(
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            max_tokens=900,
-            temperature=0.4,
-            timeout=40,
-        )
-
-        discord_message = (
-            "## 📊 LinkedIn Ads Performance Report\n\n"
-            f"{analysis_text}\n\n"
-            f"---\n_Source blob: `{enriched_path}`_"
-        )
-
-        if webhook_url:
-            post_long_to_discord(webhook_url, discord_message)
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
+        report_header = "## 📊 LinkedIn Ads Performance Report\n\n"
+        report_footer = f"\n\n---\n_Source blob: `{enriched_path}`_"
+
+        # Stream tokens straight into Discord when the provider supports it, so the
+        # first parts of the report are posted while the model is still generating.
+        complete_stream = getattr(llm, "complete_stream", None)
+        if webhook_url and complete_stream is not None:
+            stream_long_to_discord(
+                webhook_url,
+                complete_stream(messages=messages, max_tokens=900, temperature=0.4, timeout=40),
+                header=report_header,
+                footer=report_footer,
+            )
+        else:
+            analysis_text = llm.complete(
+                messages=messages,
+                max_tokens=900,
+                temperature=0.4,
+                timeout=40,
+            )
+            if webhook_url:
+                post_long_to_discord(webhook_url, f"{report_header}{analysis_text}{report_footer}")
 
-        return jsonify(
+        return (
             {
                 "status": "success",
                 "had_data": True,
                 "discord_posted": bool(webhook_url),
                 "enriched_storage_path": enriched_path,
                 "used_model": model,
-            }
+            },
+            200,
         )
     except Exception as e:
-        logger.error(f"Error in summarize_linkedin_ad_analytics: {traceback.format_exc()}")
+        logger.exception("Error in summarize_linkedin_ad_analytics")
         sanitized_error = sanitize_error_message(str(e))
-        return jsonify({"error": sanitized_error}), 500
+        return {"error": sanitized_error}, 500
 
 
 @marketing_bp.route('/mcp/tools/summarize_reddit_ad_analytics', methods=['POST'])
@@ -3510,10 +4294,8 @@ def summarize_reddit_ad_analytics():
     )
 
     try:
-        from bigas.resources.marketing.storage_service import StorageService
-
-        storage = StorageService()
-        obj = storage.get_json(enriched_path)
+        storage = _get_storage_service()
+        obj = storage.get_json_if_exists(enriched_path)
         if not obj or not isinstance(obj, dict):
             return jsonify({"error": f"Enriched report not found or invalid: {enriched_path}"}), 404
 
@@ -3623,15 +4405,7 @@ def summarize_reddit_ad_analytics():
             )
 
         sample_limit = int(data.get("sample_limit") or 50)
-        compact_rows = []
-        for el in elements[:sample_limit]:
-            if not isinstance(el, dict):
-                continue
-            compact_rows.append({
-                "segments": el.get("segments") or [],
-                "metrics": el.get("metrics") or {},
-                "derived": el.get("derived") or {},
-            })
+        compact_rows = _compact_reddit_rows(elements, sample_limit)
 
         analytics_payload = {
             "platform": "reddit",
@@ -3648,9 +4422,9 @@ def summarize_reddit_ad_analytics():
             return jsonify({"error": "Prompt configuration missing for Reddit ad analytics"}), 500
 
         system_prompt = prompt_cfg["system"]
-        user_prompt = prompt_cfg["user_template"].format(
+        user_prompt = prompt_cfg["render"](
             platform="reddit",
-            payload=json.dumps(analytics_payload, indent=2),
+            payload=_dumps_llm_payload(analytics_payload),
         )
 
         llm, _ = get_llm_client(feature="marketing", explicit_model=model)
@@ -3684,7 +4458,7 @@ def summarize_reddit_ad_analytics():
             }
         )
     except Exception as e:
-        logger.error(f"Error in summarize_reddit_ad_analytics: {traceback.format_exc()}")
+        logger.exception("Error in summarize_reddit_ad_analytics")
         sanitized_error = sanitize_error_message(str(e))
         return jsonify({"error": sanitized_error}), 500
 
@@ -3703,6 +4477,8 @@ def summarize_linkedin_creative_portfolio():
           * pivot: e.g. MEMBER_JOB_TITLE
           * enriched_storage_path: GCS path to enriched blob
       - llm_model: optional OpenAI model name (default: gpt-4.1-mini)
+      - per_creative: bool (default: false). Run one completion per creative, concurrently,
+          and join the results instead of a single aggregate completion.
 
     Behavior:
       - Aggregates per-creative totals and per-dimension top segments (Top 5 by CTR, with a
@@ -3712,40 +4488,66 @@ def summarize_linkedin_creative_portfolio():
       - Otherwise sends a compact portfolio payload to OpenAI and posts the structured
         analysis to Discord.
     """
-    data = request.json or {}
+    body, status = _summarize_linkedin_creative_portfolio_impl(request.json or {})
+    return jsonify(body), status
+
+
+def _summarize_linkedin_creative_portfolio_impl(data: Dict[str, Any]) -> Tuple[Any, int]:
+    """Body of summarize_linkedin_creative_portfolio, returning (body, status) so pipelines can call it in-process."""
     items = data.get("items") or []
     if not isinstance(items, list) or not items:
-        return jsonify({"error": "items is required and must be a non-empty list"}), 400
+        return {"error": "items is required and must be a non-empty list"}, 400
 
     if not OPENAI_API_KEY:
-        return jsonify({"error": "OPENAI_API_KEY is not configured on the server"}), 500
+        return {"error": "OPENAI_API_KEY is not configured on the server"}, 500
 
     webhook_url = os.environ.get("DISCORD_WEBHOOK_URL_MARKETING") or os.environ.get("DISCORD_WEBHOOK_URL")
 
     try:
-        from bigas.resources.marketing.storage_service import StorageService
-
-        storage = StorageService()
+        storage = _get_storage_service()
 
         # Aggregate: creatives -> dimensions -> segments
         # Structure: { creative_id: { 'name': ..., 'pivots': { pivot_name: { segment_name: metrics } } } }
         creatives: Dict[str, Dict[str, Any]] = {}
+        # Each pivot breaks down the same creative-level delivery, so a creative's totals are
+        # taken from the first pivot seen for it rather than summed across pivots.
+        totals_pivot_by_cid: Dict[str, str] = {}
 
         total_impr_all = 0
         total_clicks_all = 0
 
+        # Read every enriched blob up front on a small pool so the GCS round-trips overlap;
+        # a failed read only drops its own item, as before.
+        def _read_enriched(path: str) -> Tuple[bool, Dict[str, Any]]:
+            try:
+                return True, storage.get_json_cached(path) or {}
+            except Exception:
+                logger.warning("Portfolio summarizer: failed to read %s", path)
+                return False, {}
+
+        paths = list(dict.fromkeys(
+            p
+            for itm in items
+            if itm.get("creative_id") and _norm(itm.get("pivot"))
+            and (p := (itm.get("enriched_storage_path") or "").strip())
+        ))
+        enriched_by_path: Dict[str, Tuple[bool, Dict[str, Any]]] = {}
+        ctx_names_by_path: Dict[str, Dict[str, Any]] = {}
+        if paths:
+            with ThreadPoolExecutor(max_workers=min(8, len(paths)), thread_name_prefix="bigas-li-summary") as pool:
+                enriched_by_path = dict(zip(paths, pool.map(_read_enriched, paths)))
+
         for itm in items:
             creative_id_raw = itm.get("creative_id")
-            pivot = (itm.get("pivot") or "").strip().upper()
+            pivot = _norm(itm.get("pivot"))
             enriched_path = (itm.get("enriched_storage_path") or "").strip()
             if not creative_id_raw or not pivot or not enriched_path:
                 continue
 
             cid = str(creative_id_raw).strip()
-            try:
-                obj = storage.get_json(enriched_path) or {}
-            except Exception:
-                logger.warning("Portfolio summarizer: failed to read %s", enriched_path)
+            pivot = sys.intern(pivot)
+            ok, obj = enriched_by_path[enriched_path]
+            if not ok:
                 continue
 
             payload = obj.get("payload") or {}
@@ -3760,26 +4562,42 @@ def summarize_linkedin_creative_portfolio():
                 len(elements),
             )
 
-            creatives.setdefault(cid, {"id": cid, "name": None, "context": context, "pivots": {}})
+            creatives.setdefault(
+                cid,
+                {
+                    "id": cid,
+                    "name": None,
+                    "context": context,
+                    "pivots": {},
+                    "totals": {"impressions": 0, "clicks": 0, "costInLocalCurrency": 0.0},
+                },
+            )
+            creative_totals = (
+                creatives[cid]["totals"] if totals_pivot_by_cid.setdefault(cid, pivot) == pivot else None
+            )
 
-            # Try to get ad name from context.creatives if present
+            # Try to get ad name from context.creatives if present (first matching URN wins).
+            # The id -> name map is built once per enriched blob and shared by its items.
             if not creatives[cid].get("name"):
-                ctx_creatives = context.get("creatives") or []
-                for c in ctx_creatives:
-                    if not isinstance(c, dict):
-                        continue
-                    urn = c.get("urn") or ""
-                    if urn.endswith(f":{cid}"):
-                        creatives[cid]["name"] = c.get("name")
-                        break
+                ctx_name_by_id = ctx_names_by_path.get(enriched_path)
+                if ctx_name_by_id is None:
+                    ctx_name_by_id = {}
+                    for c in context.get("creatives") or []:
+                        if isinstance(c, dict) and ":" in (urn := c.get("urn") or ""):
+                            ctx_name_by_id.setdefault(urn.rsplit(":", 1)[1], c.get("name"))
+                    ctx_names_by_path[enriched_path] = ctx_name_by_id
+                creatives[cid]["name"] = ctx_name_by_id.get(cid)
 
             pivot_map = creatives[cid]["pivots"].setdefault(pivot, {})
 
             for el in elements:
                 if not isinstance(el, dict):
                     continue
-                metrics = el.get("metrics") or {}
-                derived = el.get("derived") or {}
+                # Rows without a metrics object contribute nothing; skip them before building
+                # the segment key.
+                metrics = el.get("metrics")
+                if not isinstance(metrics, dict):
+                    continue
                 piv_resolved = el.get("pivotValuesResolved") or []
 
                 # Segment key: join resolved names or URNs
@@ -3793,7 +4611,9 @@ def summarize_linkedin_creative_portfolio():
                 if not seg_parts:
                     continue
 
-                seg_key = " / ".join(seg_parts)
+                # Segment keys repeat across items and pivots; interning makes the
+                # repeated dict lookups below compare by identity.
+                seg_key = sys.intern(" / ".join(seg_parts))
                 impr = metrics.get("impressions") or 0
                 clicks = metrics.get("clicks") or 0
                 cost = metrics.get("costInLocalCurrency")
@@ -3807,17 +4627,21 @@ def summarize_linkedin_creative_portfolio():
                 except Exception:
                     clicks_i = 0
                 try:
-                    cost_d = Decimal(str(cost)) if cost is not None else Decimal("0")
-                except Exception:
-                    cost_d = Decimal("0")
+                    cost_f = float(cost) if cost is not None else 0.0
+                except (TypeError, ValueError):
+                    cost_f = 0.0
 
                 agg = pivot_map.setdefault(
                     seg_key,
-                    {"impressions": 0, "clicks": 0, "costInLocalCurrency": Decimal("0")},
+                    {"impressions": 0, "clicks": 0, "costInLocalCurrency": 0.0},
                 )
                 agg["impressions"] += impr_i
                 agg["clicks"] += clicks_i
-                agg["costInLocalCurrency"] += cost_d
+                agg["costInLocalCurrency"] += cost_f
+                if creative_totals is not None:
+                    creative_totals["impressions"] += impr_i
+                    creative_totals["clicks"] += clicks_i
+                    creative_totals["costInLocalCurrency"] += cost_f
 
                 total_impr_all += impr_i
                 total_clicks_all += clicks_i
@@ -3836,7 +4660,9 @@ def summarize_linkedin_creative_portfolio():
             first_el_sample: Dict[str, Any] = {}
             if first_path and creatives:
                 try:
-                    obj0 = storage.get_json(first_path) or {}
+                    # Reuse the blob already read for aggregation; only read it if the first
+                    # item was skipped before the prefetch.
+                    _, obj0 = enriched_by_path.get(first_path) or _read_enriched(first_path)
                     els = (obj0.get("payload") or {}).get("enriched_response") or {}
                     el_list = els.get("elements") or []
                     if el_list and isinstance(el_list[0], dict):
@@ -3860,12 +4686,13 @@ def summarize_linkedin_creative_portfolio():
             )
             if webhook_url:
                 post_to_discord(webhook_url, no_data_message)
-            return jsonify(
+            return (
                 {
                     "status": "success",
                     "had_data": False,
                     "discord_posted": bool(webhook_url),
-                }
+                },
+                200,
             )
 
         # Build compact per-ad summaries with Top 5 segments per pivot.
@@ -3876,43 +4703,40 @@ def summarize_linkedin_creative_portfolio():
         ads_payload = []
         for cid, info in creatives.items():
             pivots_payload = {}
-            totals_impr = 0
-            totals_clicks = 0
-            totals_cost = Decimal("0")
 
             for pivot_name, segs in info["pivots"].items():
                 rows = []
                 for seg, m in segs.items():
-                    impr = m.get("impressions") or 0
-                    clicks = m.get("clicks") or 0
-                    cost = m.get("costInLocalCurrency") or Decimal("0")
+                    impr = m["impressions"]
+                    clicks = m["clicks"]
+                    cost = m["costInLocalCurrency"]
                     if impr < min_impressions:
                         continue
-                    ctr = (Decimal(clicks) / Decimal(impr) * Decimal(100)) if impr else None
-                    avg_cpc = (cost / Decimal(clicks)) if clicks else None
                     rows.append(
                         {
                             "segment": seg,
                             "impressions": impr,
                             "clicks": clicks,
-                            "ctr_pct": float(ctr) if ctr is not None else None,
-                            "cost_local": float(cost),
-                            "avg_cpc_local": float(avg_cpc) if avg_cpc is not None else None,
+                            "ctr_pct": 100.0 * clicks / impr if impr else None,
+                            "cost_local": cost,
+                            "avg_cpc_local": cost / clicks if clicks else None,
                         }
                     )
-                    totals_impr += impr
-                    totals_clicks += clicks
-                    totals_cost += cost
 
-                # Sort by CTR descending, then impressions
-                rows.sort(
+                # Top segments by CTR descending, then impressions (same order as a full sort).
+                pivots_payload[pivot_name] = heapq.nlargest(
+                    top_k,
+                    rows,
                     key=lambda r: ((r["ctr_pct"] or 0.0), r["impressions"]),
-                    reverse=True,
                 )
-                pivots_payload[pivot_name] = rows[:top_k]
 
-            ctr_total = (Decimal(totals_clicks) / Decimal(totals_impr) * Decimal(100)) if totals_impr else None
-            avg_cpc_total = (totals_cost / Decimal(totals_clicks)) if totals_clicks else None
+            # Totals were accumulated during aggregation from a single pivot and include
+            # segments below min_impressions, which are only dropped from the top lists.
+            totals_impr = info["totals"]["impressions"]
+            totals_clicks = info["totals"]["clicks"]
+            totals_cost = info["totals"]["costInLocalCurrency"]
+            ctr_total = 100.0 * totals_clicks / totals_impr if totals_impr else None
+            avg_cpc_total = totals_cost / totals_clicks if totals_clicks else None
 
             ads_payload.append(
                 {
@@ -3921,9 +4745,9 @@ def summarize_linkedin_creative_portfolio():
                     "totals": {
                         "impressions": totals_impr,
                         "clicks": totals_clicks,
-                        "ctr_pct": float(ctr_total) if ctr_total is not None else None,
-                        "cost_local": float(totals_cost),
-                        "avg_cpc_local": float(avg_cpc_total) if avg_cpc_total is not None else None,
+                        "ctr_pct": ctr_total,
+                        "cost_local": totals_cost,
+                        "avg_cpc_local": avg_cpc_total,
                     },
                     "pivots": pivots_payload,
                 }
@@ -3935,51 +4759,82 @@ def summarize_linkedin_creative_portfolio():
         }
 
         model = (data.get("llm_model") or "gpt-4.1-mini").strip()
+        per_creative = bool(data.get("per_creative", False))
 
         prompt_cfg = AD_SUMMARY_PROMPTS.get(("linkedin", "creative_portfolio"))
         if not prompt_cfg:
-            return jsonify({"error": "Prompt configuration missing for LinkedIn creative portfolio"}), 500
+            return {"error": "Prompt configuration missing for LinkedIn creative portfolio"}, 500
 
         system_prompt = prompt_cfg["system"]
-        user_prompt = prompt_cfg["user_template"].format(
-            platform="linkedin",
-            payload=json.dumps(analytics_payload, indent=2),
-        )
-
         llm, _ = get_llm_client(feature="marketing", explicit_model=model)
-        analysis_text = llm.complete(
-            messages=[
+
+        def _messages_for(payload: Dict[str, Any]) -> List[Dict[str, str]]:
+            return [
                 {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            max_tokens=1100,
-            temperature=0.4,
-            timeout=40,
-        )
+                {"role": "user", "content": prompt_cfg["render"](
+                    platform="linkedin",
+                    payload=_dumps_llm_payload(payload),
+                )},
+            ]
 
-        discord_message = (
-            "## 📊 LinkedIn Creative Portfolio Report\n\n"
-            f"{analysis_text}\n\n"
-            "---\n"
+        def _complete_for(payload: Dict[str, Any], max_tokens: int) -> str:
+            return llm.complete(
+                messages=_messages_for(payload),
+                max_tokens=max_tokens,
+                temperature=0.4,
+                timeout=40,
+            )
+
+        report_header = "## 📊 LinkedIn Creative Portfolio Report\n\n"
+        report_footer = (
+            "\n\n---\n"
             "_This report is based on per-creative, per-dimension LinkedIn adAnalytics data._"
         )
+        complete_stream = getattr(llm, "complete_stream", None)
+
+        if per_creative and len(ads_payload) > 1:
+            # One completion per ad, issued concurrently so wall time tracks the slowest
+            # call rather than the sum of all of them.
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(ads_payload)), thread_name_prefix="bigas-li-portfolio-llm"
+            ) as pool:
+                analyses = list(pool.map(
+                    lambda ad: _complete_for({"platform": "linkedin", "ads": [ad]}, 600),
+                    ads_payload,
+                ))
+            analysis_text = "\n\n".join(a for a in analyses if a)
+            if webhook_url:
+                post_long_to_discord(webhook_url, f"{report_header}{analysis_text}{report_footer}")
+        elif webhook_url and complete_stream is not None:
+            # Post finished parts of the report while the model is still generating.
+            stream_long_to_discord(
+                webhook_url,
+                complete_stream(
+                    messages=_messages_for(analytics_payload), max_tokens=1100, temperature=0.4, timeout=40
+                ),
+                header=report_header,
+                footer=report_footer,
+            )
+        else:
+            analysis_text = _complete_for(analytics_payload, 1100)
+            if webhook_url:
+                post_long_to_discord(webhook_url, f"{report_header}{analysis_text}{report_footer}")
 
-        if webhook_url:
-            post_long_to_discord(webhook_url, discord_message)
-
-        return jsonify(
+        return (
             {
                 "status": "success",
                 "had_data": True,
                 "discord_posted": bool(webhook_url),
                 "used_model": model,
                 "ads_count": len(ads_payload),
-            }
+            },
+            200,
         )
     except Exception:
-        logger.error("Error in summarize_linkedin_creative_portfolio: %s", traceback.format_exc())
-        sanitized_error = sanitize_error_message(str(traceback.format_exc()))
-        return jsonify({"error": sanitized_error}), 500
+        tb = traceback.format_exc()
+        logger.error("Error in summarize_linkedin_creative_portfolio: %s", tb)
+        sanitized_error = sanitize_error_message(tb[-_ERROR_TRACEBACK_MAX_CHARS:])
+        return {"error": sanitized_error}, 500
 
 
 @marketing_bp.route('/mcp/tools/run_linkedin_portfolio_report_async', methods=['POST'])
@@ -3993,31 +4848,7 @@ def run_linkedin_portfolio_report_async():
     if not is_valid:
         return jsonify({"error": error_msg}), 400
 
-    timeout_seconds = int(data.get("timeout_seconds") or 300)
-    timeout_seconds = max(10, min(timeout_seconds, 900))
-
-    app_obj = current_app._get_current_object()
-    access_header = app_obj.config.get("BIGAS_ACCESS_HEADER", "X-Bigas-Access-Key")
-    request_key = (request.headers.get(access_header) or "").strip()
-    if request_key:
-        data["_internal_access_key"] = request_key
-    job_id = _create_async_job(data, timeout_seconds=timeout_seconds)
-
-    t = threading.Thread(
-        target=_run_linkedin_portfolio_job,
-        args=(app_obj, job_id, data),
-        daemon=True,
-    )
-    t.start()
-
-    return jsonify(
-        {
-            "status": "accepted",
-            "job_id": job_id,
-            "poll_after_seconds": 5,
-            "timeout_seconds": timeout_seconds,
-        }
-    )
+    return jsonify(_accept_async_job(data, _run_linkedin_portfolio_job))
 
 
 @marketing_bp.route('/mcp/tools/get_job_status', methods=['POST'])
@@ -4027,21 +4858,11 @@ def get_job_status():
     if not job_id:
         return jsonify({"error": "job_id is required"}), 400
 
-    job = _get_async_job(job_id)
-    if not job:
+    entry = _ASYNC_JOBS.get(job_id)
+    if entry is None:
         return jsonify({"error": "job not found"}), 404
 
-    return jsonify(
-        {
-            "job_id": job["job_id"],
-            "status": job["status"],
-            "progress_pct": job.get("progress_pct", 0),
-            "stage": job.get("stage", "unknown"),
-            "updated_at": job.get("updated_at"),
-            "error": job.get("error"),
-            "result_available": bool(job.get("result")) and job.get("status") == "succeeded",
-        }
-    )
+    return Response(entry.status_body, mimetype="application/json")
 
 
 @marketing_bp.route('/mcp/tools/get_job_result', methods=['POST'])
@@ -4055,8 +4876,9 @@ def get_job_result():
     if not job:
         return jsonify({"error": "job not found"}), 404
 
+    # Results can be whole portfolio reports; encode them with orjson like the report endpoints.
     if job["status"] != "succeeded":
-        return jsonify(
+        return _json_response(
             {
                 "job_id": job["job_id"],
                 "status": job["status"],
@@ -4065,7 +4887,7 @@ def get_job_result():
             }
         )
 
-    return jsonify(
+    return _json_response(
         {
             "job_id": job["job_id"],
             "status": "succeeded",
@@ -4074,7 +4896,49 @@ def get_job_result():
     )
 
 
+def _release_linkedin_prefetch(future: Future) -> None:
+    """
+    Cancel a CREATIVE-level prefetch the pipeline no longer needs; if it already started,
+    log its outcome when it finishes so failures are not silently dropped.
+    """
+    if future.cancel():
+        return
+
+    def _log_outcome(done: Future) -> None:
+        try:
+            body, status = done.result()
+        except Exception:
+            logger.warning("LinkedIn portfolio: CREATIVE prefetch failed", exc_info=True)
+            return
+        if status != 200 or (isinstance(body, dict) and body.get("error")):
+            logger.warning("LinkedIn portfolio: CREATIVE prefetch returned %s: %s", status, body)
+
+    future.add_done_callback(_log_outcome)
+
+
+def _linkedin_discovery_payload(data: Dict[str, Any], account_urn: str) -> Dict[str, Any]:
+    """list_linkedin_creatives_for_period payload for a portfolio run; unset optional fields are omitted."""
+    payload: Dict[str, Any] = {
+        "account_urn": account_urn,
+        "discovery_relative_range": data.get("discovery_relative_range") or "LAST_30_DAYS",
+    }
+    start_s = (data.get("discovery_start_date") or "").strip()
+    if start_s:
+        payload["discovery_start_date"] = start_s
+    end_s = (data.get("discovery_end_date") or "").strip()
+    if end_s:
+        payload["discovery_end_date"] = end_s
+    payload["min_impressions"] = int(data.get("min_impressions") or 1)
+    store_raw = data.get("store_raw", True)
+    if store_raw is not None:
+        payload["store_raw"] = store_raw
+    payload["force_refresh"] = bool(data.get("force_refresh", False))
+    return payload
+
+
 @marketing_bp.route('/mcp/tools/run_linkedin_portfolio_report', methods=['POST'])
+@async_dispatch(_run_linkedin_portfolio_job)
+@cache_portfolio_result("linkedin")
 def run_linkedin_portfolio_report():
     """
     Run the full LinkedIn portfolio pipeline in one request: discover creatives for a period,
@@ -4101,32 +4965,6 @@ def run_linkedin_portfolio_report():
     if not is_valid:
         return jsonify({"error": error_msg}), 400
 
-    # For MCP clients with hard per-call limits (e.g. 30s), return immediately and poll.
-    run_async = bool(data.get("async", False)) and not bool(data.get("_internal_async_worker", False))
-    timeout_seconds = int(data.get("timeout_seconds") or 300)
-    timeout_seconds = max(10, min(timeout_seconds, 900))
-    if run_async:
-        app_obj = current_app._get_current_object()
-        access_header = app_obj.config.get("BIGAS_ACCESS_HEADER", "X-Bigas-Access-Key")
-        request_key = (request.headers.get(access_header) or "").strip()
-        if request_key:
-            data["_internal_access_key"] = request_key
-        job_id = _create_async_job(data, timeout_seconds=timeout_seconds)
-        t = threading.Thread(
-            target=_run_linkedin_portfolio_job,
-            args=(app_obj, job_id, data),
-            daemon=True,
-        )
-        t.start()
-        return jsonify(
-            {
-                "status": "accepted",
-                "job_id": job_id,
-                "poll_after_seconds": 5,
-                "timeout_seconds": timeout_seconds,
-            }
-        )
-
     account_urn = (data.get("account_urn") or os.environ.get("LINKEDIN_AD_ACCOUNT_URN") or "").strip()
     if not account_urn:
         return jsonify({"error": "account_urn is required (or set LINKEDIN_AD_ACCOUNT_URN)."}), 400
@@ -4134,29 +4972,13 @@ def run_linkedin_portfolio_report():
         account_urn = f"urn:li:sponsoredAccount:{account_urn}"
 
     # 1) Discovery: list creatives for period (default LAST_30_DAYS)
-    discovery_payload = {
-        "account_urn": account_urn,
-        "discovery_relative_range": data.get("discovery_relative_range") or "LAST_30_DAYS",
-        "discovery_start_date": (data.get("discovery_start_date") or "").strip() or None,
-        "discovery_end_date": (data.get("discovery_end_date") or "").strip() or None,
-        "min_impressions": int(data.get("min_impressions") or 1),
-        "store_raw": data.get("store_raw", True),
-        "force_refresh": bool(data.get("force_refresh", False)),
-    }
-    discovery_payload = {k: v for k, v in discovery_payload.items() if v is not None}
+    discovery_payload = _linkedin_discovery_payload(data, account_urn)
+    creative_future: Optional[Future] = None
 
     try:
-        with current_app.test_request_context(
-            path="/mcp/tools/list_linkedin_creatives_for_period",
-            method="POST",
-            json=discovery_payload,
-        ):
-            disc_resp = list_linkedin_creatives_for_period()
-        if isinstance(disc_resp, tuple):
-            disc_resp, disc_status = disc_resp[0], disc_resp[1]
-        else:
-            disc_status = disc_resp.status_code if hasattr(disc_resp, "status_code") else 200
-        disc_body = disc_resp.get_json() if hasattr(disc_resp, "get_json") else {}
+        # Each step calls the endpoint body directly with a dict, skipping the synthetic
+        # request context and the JSON round-trip per step.
+        disc_body, disc_status = _list_linkedin_creatives_for_period_impl(discovery_payload)
         if disc_status != 200 or (isinstance(disc_body, dict) and disc_body.get("error")):
             return (
                 jsonify(disc_body if isinstance(disc_body, dict) else {"error": "Discovery failed"}),
@@ -4202,35 +5024,41 @@ def run_linkedin_portfolio_report():
             "start_date": start_date_s,
             "end_date": end_date_s,
             "creative_ids": limited_creative_ids,
+            "creative_batch_size": _LINKEDIN_CREATIVE_BATCH_MAX,
             "pivots": list(LINKEDIN_PORTFOLIO_REPORT_PIVOTS),
             "store_raw": data.get("store_raw", True),
             "force_refresh": bool(data.get("force_refresh", False)),
             "include_entity_names": bool(data.get("include_entity_names", True)),
         }
-        with current_app.test_request_context(
-            path="/mcp/tools/fetch_linkedin_creative_demographics_portfolio",
-            method="POST",
-            json=demographics_payload,
-        ):
-            demo_resp = fetch_linkedin_creative_demographics_portfolio()
-        if isinstance(demo_resp, tuple):
-            demo_resp, demo_status = demo_resp[0], demo_resp[1]
-        else:
-            demo_status = demo_resp.status_code if hasattr(demo_resp, "status_code") else 200
-        demo_body = demo_resp.get_json() if hasattr(demo_resp, "get_json") else {}
+        # The CREATIVE-level report is independent of the demographics fetch; start it now so
+        # both LinkedIn round-trips overlap. It honours force_refresh and is reused by both the
+        # portfolio response and the fallback.
+        creative_payload = {
+            "account_urn": account_urn,
+            "start_date": start_date_s,
+            "end_date": end_date_s,
+            "pivot": "CREATIVE",
+            "store_raw": data.get("store_raw", True),
+            "force_refresh": bool(data.get("force_refresh", False)),
+            "include_entity_names": bool(data.get("include_entity_names", True)),
+        }
+        creative_future = _LINKEDIN_PIPELINE_POOL.submit(
+            _fetch_linkedin_ad_analytics_report_impl, creative_payload, start_date_s, end_date_s
+        )
+
+        demo_body, demo_status = _fetch_linkedin_creative_demographics_portfolio_impl(
+            demographics_payload, start_date_s, end_date_s
+        )
         if demo_status != 200 or (isinstance(demo_body, dict) and demo_body.get("error")):
             return (
                 jsonify(demo_body if isinstance(demo_body, dict) else {"error": "Demographics fetch failed"}),
                 demo_status if demo_status >= 400 else 500,
             )
 
-        # Build items for portfolio summarizer: need creative_id, pivot, enriched_storage_path
+        # Items for the portfolio summarizer: it reads creative_id, pivot and enriched_storage_path
+        # and ignores the other result fields, so the result rows are passed through unprojected.
         results = demo_body.get("results") or []
-        portfolio_items = [
-            {"creative_id": r["creative_id"], "pivot": r["pivot"], "enriched_storage_path": r["enriched_storage_path"]}
-            for r in results
-            if r.get("enriched_storage_path")
-        ]
+        portfolio_items = [r for r in results if r.get("enriched_storage_path")]
 
         if portfolio_items:
             # 3a) Summarize with creative-portfolio summarizer (includes job title, function, country insights)
@@ -4238,41 +5066,14 @@ def run_linkedin_portfolio_report():
                 "items": portfolio_items,
                 "llm_model": (data.get("llm_model") or "gpt-4.1-mini").strip(),
             }
-            with current_app.test_request_context(
-                path="/mcp/tools/summarize_linkedin_creative_portfolio",
-                method="POST",
-                json=summarize_payload,
-            ):
-                sum_resp = summarize_linkedin_creative_portfolio()
-            if isinstance(sum_resp, tuple):
-                sum_resp, sum_status = sum_resp[0], sum_resp[1]
-            else:
-                sum_status = sum_resp.status_code if hasattr(sum_resp, "status_code") else 200
-            sum_body = sum_resp.get_json() if hasattr(sum_resp, "get_json") else {}
+            sum_body, sum_status = _summarize_linkedin_creative_portfolio_impl(summarize_payload)
             if sum_status != 200 or (isinstance(sum_body, dict) and sum_body.get("error")):
                 return (
                     jsonify(sum_body if isinstance(sum_body, dict) else {"error": "Portfolio summarize failed"}),
                     sum_status if sum_status >= 400 else 500,
                 )
             # Provide a single CREATIVE-level enriched path for cross-platform (fetch reuses cache when possible)
-            ad_analytics_payload = {
-                "account_urn": account_urn,
-                "start_date": start_date_s,
-                "end_date": end_date_s,
-                "pivot": "CREATIVE",
-                "store_raw": data.get("store_raw", True),
-                "force_refresh": False,
-                "include_entity_names": bool(data.get("include_entity_names", True)),
-            }
-            with current_app.test_request_context(
-                path="/mcp/tools/fetch_linkedin_ad_analytics_report",
-                method="POST",
-                json=ad_analytics_payload,
-            ):
-                fetch_resp = fetch_linkedin_ad_analytics_report()
-            if isinstance(fetch_resp, tuple):
-                fetch_resp = fetch_resp[0]
-            fetch_body = fetch_resp.get_json() if hasattr(fetch_resp, "get_json") else {}
+            fetch_body = creative_future.result()[0]
             enriched_path = (fetch_body.get("enriched_storage_path") or "").strip() if isinstance(fetch_body, dict) else None
             return jsonify(
                 {
@@ -4292,26 +5093,7 @@ def run_linkedin_portfolio_report():
             "run_linkedin_portfolio_report: no portfolio items with enriched_storage_path (results=%s); falling back to CREATIVE ad analytics",
             len(results),
         )
-        ad_analytics_payload = {
-            "account_urn": account_urn,
-            "start_date": start_date_s,
-            "end_date": end_date_s,
-            "pivot": "CREATIVE",
-            "store_raw": data.get("store_raw", True),
-            "force_refresh": bool(data.get("force_refresh", False)),
-            "include_entity_names": bool(data.get("include_entity_names", True)),
-        }
-        with current_app.test_request_context(
-            path="/mcp/tools/fetch_linkedin_ad_analytics_report",
-            method="POST",
-            json=ad_analytics_payload,
-        ):
-            fetch_resp = fetch_linkedin_ad_analytics_report()
-        if isinstance(fetch_resp, tuple):
-            fetch_resp, fetch_status = fetch_resp[0], fetch_resp[1]
-        else:
-            fetch_status = fetch_resp.status_code if hasattr(fetch_resp, "status_code") else 200
-        fetch_body = fetch_resp.get_json() if hasattr(fetch_resp, "get_json") else {}
+        fetch_body, fetch_status = creative_future.result()
         if fetch_status != 200 or (isinstance(fetch_body, dict) and fetch_body.get("error")):
             return (
                 jsonify(fetch_body if isinstance(fetch_body, dict) else {"error": "Ad analytics fetch failed"}),
@@ -4345,17 +5127,7 @@ def run_linkedin_portfolio_report():
             "llm_model": (data.get("llm_model") or "gpt-4.1-mini").strip(),
             "sample_limit": int(data.get("sample_limit") or 50),
         }
-        with current_app.test_request_context(
-            path="/mcp/tools/summarize_linkedin_ad_analytics",
-            method="POST",
-            json=summarize_payload,
-        ):
-            sum_resp = summarize_linkedin_ad_analytics()
-        if isinstance(sum_resp, tuple):
-            sum_resp, sum_status = sum_resp[0], sum_resp[1]
-        else:
-            sum_status = sum_resp.status_code if hasattr(sum_resp, "status_code") else 200
-        sum_body = sum_resp.get_json() if hasattr(sum_resp, "get_json") else {}
+        sum_body, sum_status = _summarize_linkedin_ad_analytics_impl(summarize_payload)
         if sum_status != 200 or (isinstance(sum_body, dict) and sum_body.get("error")):
             return (
                 jsonify(sum_body if isinstance(sum_body, dict) else {"error": "Summarize failed"}),
@@ -4375,9 +5147,14 @@ def run_linkedin_portfolio_report():
             }
         )
     except Exception:
-        logger.error("Error in run_linkedin_portfolio_report: %s", traceback.format_exc())
-        sanitized_error = sanitize_error_message(str(traceback.format_exc()))
+        tb = traceback.format_exc()
+        logger.error("Error in run_linkedin_portfolio_report: %s", tb)
+        sanitized_error = sanitize_error_message(tb[-_ERROR_TRACEBACK_MAX_CHARS:])
         return jsonify({"error": sanitized_error}), 500
+    finally:
+        # Early error returns leave the prefetch unconsumed; do not let it run (or fail) unseen.
+        if creative_future is not None:
+            _release_linkedin_prefetch(creative_future)
 
 
 @marketing_bp.route('/mcp/tools/run_google_ads_portfolio_report_async', methods=['POST'])
@@ -4387,34 +5164,12 @@ def run_google_ads_portfolio_report_async():
     if not is_valid:
         return jsonify({"error": error_msg}), 400
 
-    timeout_seconds = int(data.get("timeout_seconds") or 300)
-    timeout_seconds = max(10, min(timeout_seconds, 900))
-
-    app_obj = current_app._get_current_object()
-    access_header = app_obj.config.get("BIGAS_ACCESS_HEADER", "X-Bigas-Access-Key")
-    request_key = (request.headers.get(access_header) or "").strip()
-    if request_key:
-        data["_internal_access_key"] = request_key
-
-    job_id = _create_async_job(data, timeout_seconds=timeout_seconds)
-    t = threading.Thread(
-        target=_run_google_ads_portfolio_job,
-        args=(app_obj, job_id, data),
-        daemon=True,
-    )
-    t.start()
-
-    return jsonify(
-        {
-            "status": "accepted",
-            "job_id": job_id,
-            "poll_after_seconds": 5,
-            "timeout_seconds": timeout_seconds,
-        }
-    )
+    return jsonify(_accept_async_job(data, _run_google_ads_portfolio_job))
 
 
 @marketing_bp.route('/mcp/tools/run_google_ads_portfolio_report', methods=['POST'])
+@async_dispatch(_run_google_ads_portfolio_job)
+@cache_portfolio_result("google_ads")
 def run_google_ads_portfolio_report():
     """
     Run a Google Ads performance portfolio report.
@@ -4436,31 +5191,6 @@ def run_google_ads_portfolio_report():
     if not is_valid:
         return jsonify({"error": error_msg}), 400
 
-    run_async = bool(data.get("async", False)) and not bool(data.get("_internal_async_worker", False))
-    timeout_seconds = int(data.get("timeout_seconds") or 300)
-    timeout_seconds = max(10, min(timeout_seconds, 900))
-    if run_async:
-        app_obj = current_app._get_current_object()
-        access_header = app_obj.config.get("BIGAS_ACCESS_HEADER", "X-Bigas-Access-Key")
-        request_key = (request.headers.get(access_header) or "").strip()
-        if request_key:
-            data["_internal_access_key"] = request_key
-        job_id = _create_async_job(data, timeout_seconds=timeout_seconds)
-        t = threading.Thread(
-            target=_run_google_ads_portfolio_job,
-            args=(app_obj, job_id, data),
-            daemon=True,
-        )
-        t.start()
-        return jsonify(
-            {
-                "status": "accepted",
-                "job_id": job_id,
-                "poll_after_seconds": 5,
-                "timeout_seconds": timeout_seconds,
-            }
-        )
-
     start_date_s = (data.get("start_date") or "").strip() or None
     end_date_s = (data.get("end_date") or "").strip() or None
     customer_id = (data.get("customer_id") or os.environ.get("GOOGLE_ADS_CUSTOMER_ID") or "").strip()
@@ -4486,8 +5216,7 @@ def run_google_ads_portfolio_report():
     try:
         storage = None
         if store_raw or store_enriched:
-            from bigas.resources.marketing.storage_service import StorageService
-            storage = StorageService()
+            storage = _get_storage_service()
 
         result = run_google_ads_campaign_portfolio(
             start_date_s=start_date_s,
@@ -4514,8 +5243,9 @@ def run_google_ads_portfolio_report():
             payload["discord"] = discord_info
         return jsonify(payload)
     except Exception:
-        logger.error("Error in run_google_ads_portfolio_report: %s", traceback.format_exc())
-        sanitized_error = sanitize_error_message(str(traceback.format_exc()))
+        tb = traceback.format_exc()
+        logger.error("Error in run_google_ads_portfolio_report: %s", tb)
+        sanitized_error = sanitize_error_message(tb[-_ERROR_TRACEBACK_MAX_CHARS:])
         return jsonify({"error": sanitized_error}), 500
 
 
@@ -4526,34 +5256,12 @@ def run_meta_portfolio_report_async():
     if not is_valid:
         return jsonify({"error": error_msg}), 400
 
-    timeout_seconds = int(data.get("timeout_seconds") or 300)
-    timeout_seconds = max(10, min(timeout_seconds, 900))
-
-    app_obj = current_app._get_current_object()
-    access_header = app_obj.config.get("BIGAS_ACCESS_HEADER", "X-Bigas-Access-Key")
-    request_key = (request.headers.get(access_header) or "").strip()
-    if request_key:
-        data["_internal_access_key"] = request_key
-
-    job_id = _create_async_job(data, timeout_seconds=timeout_seconds)
-    t = threading.Thread(
-        target=_run_meta_portfolio_job,
-        args=(app_obj, job_id, data),
-        daemon=True,
-    )
-    t.start()
-
-    return jsonify(
-        {
-            "status": "accepted",
-            "job_id": job_id,
-            "poll_after_seconds": 5,
-            "timeout_seconds": timeout_seconds,
-        }
-    )
+    return jsonify(_accept_async_job(data, _run_meta_portfolio_job))
 
 
 @marketing_bp.route('/mcp/tools/run_meta_portfolio_report', methods=['POST'])
+@async_dispatch(_run_meta_portfolio_job)
+@cache_portfolio_result("meta")
 def run_meta_portfolio_report():
     """
     Run a Meta (Facebook/Instagram) Ads portfolio report.
@@ -4575,31 +5283,6 @@ def run_meta_portfolio_report():
     if not is_valid:
         return jsonify({"error": error_msg}), 400
 
-    run_async = bool(data.get("async", False)) and not bool(data.get("_internal_async_worker", False))
-    timeout_seconds = int(data.get("timeout_seconds") or 300)
-    timeout_seconds = max(10, min(timeout_seconds, 900))
-    if run_async:
-        app_obj = current_app._get_current_object()
-        access_header = app_obj.config.get("BIGAS_ACCESS_HEADER", "X-Bigas-Access-Key")
-        request_key = (request.headers.get(access_header) or "").strip()
-        if request_key:
-            data["_internal_access_key"] = request_key
-        job_id = _create_async_job(data, timeout_seconds=timeout_seconds)
-        t = threading.Thread(
-            target=_run_meta_portfolio_job,
-            args=(app_obj, job_id, data),
-            daemon=True,
-        )
-        t.start()
-        return jsonify(
-            {
-                "status": "accepted",
-                "job_id": job_id,
-                "poll_after_seconds": 5,
-                "timeout_seconds": timeout_seconds,
-            }
-        )
-
     start_date_s = (data.get("start_date") or "").strip() or None
     end_date_s = (data.get("end_date") or "").strip() or None
     account_id = (data.get("account_id") or os.environ.get("META_AD_ACCOUNT_ID") or "").strip()
@@ -4627,8 +5310,7 @@ def run_meta_portfolio_report():
     try:
         storage = None
         if store_raw or store_enriched:
-            from bigas.resources.marketing.storage_service import StorageService
-            storage = StorageService()
+            storage = _get_storage_service()
 
         result = run_meta_campaign_portfolio(
             start_date_s=start_date_s,
@@ -4655,8 +5337,9 @@ def run_meta_portfolio_report():
             payload["discord"] = discord_info
         return jsonify(payload)
     except Exception:
-        logger.error("Error in run_meta_portfolio_report: %s", traceback.format_exc())
-        sanitized_error = sanitize_error_message(str(traceback.format_exc()))
+        tb = traceback.format_exc()
+        logger.error("Error in run_meta_portfolio_report: %s", tb)
+        sanitized_error = sanitize_error_message(tb[-_ERROR_TRACEBACK_MAX_CHARS:])
         return jsonify({"error": sanitized_error}), 500
 
 
@@ -4738,34 +5421,11 @@ def run_reddit_portfolio_report_async():
     if not is_valid:
         return jsonify({"error": error_msg}), 400
 
-    timeout_seconds = int(data.get("timeout_seconds") or 300)
-    timeout_seconds = max(10, min(timeout_seconds, 900))
-
-    app_obj = current_app._get_current_object()
-    access_header = app_obj.config.get("BIGAS_ACCESS_HEADER", "X-Bigas-Access-Key")
-    request_key = (request.headers.get(access_header) or "").strip()
-    if request_key:
-        data["_internal_access_key"] = request_key
-
-    job_id = _create_async_job(data, timeout_seconds=timeout_seconds)
-    t = threading.Thread(
-        target=_run_reddit_portfolio_job,
-        args=(app_obj, job_id, data),
-        daemon=True,
-    )
-    t.start()
-
-    return jsonify(
-        {
-            "status": "accepted",
-            "job_id": job_id,
-            "poll_after_seconds": 5,
-            "timeout_seconds": timeout_seconds,
-        }
-    )
+    return jsonify(_accept_async_job(data, _run_reddit_portfolio_job))
 
 
 @marketing_bp.route('/mcp/tools/run_reddit_portfolio_report', methods=['POST'])
+@async_dispatch(_run_reddit_portfolio_job)
 def run_reddit_portfolio_report():
     """
     Full Reddit Ads portfolio report (like LinkedIn): fetch performance + audience data,
@@ -4782,31 +5442,6 @@ def run_reddit_portfolio_report():
       - post_to_discord: optional (default: true) — if false, do not post the full report to Discord (e.g. when called from cross-platform).
     """
     data = request.json or {}
-    run_async = bool(data.get("async", False)) and not bool(data.get("_internal_async_worker", False))
-    timeout_seconds = int(data.get("timeout_seconds") or 300)
-    timeout_seconds = max(10, min(timeout_seconds, 900))
-    if run_async:
-        app_obj = current_app._get_current_object()
-        access_header = app_obj.config.get("BIGAS_ACCESS_HEADER", "X-Bigas-Access-Key")
-        request_key = (request.headers.get(access_header) or "").strip()
-        if request_key:
-            data["_internal_access_key"] = request_key
-        job_id = _create_async_job(data, timeout_seconds=timeout_seconds)
-        t = threading.Thread(
-            target=_run_reddit_portfolio_job,
-            args=(app_obj, job_id, data),
-            daemon=True,
-        )
-        t.start()
-        return jsonify(
-            {
-                "status": "accepted",
-                "job_id": job_id,
-                "poll_after_seconds": 5,
-                "timeout_seconds": timeout_seconds,
-            }
-        )
-
     post_reddit_to_discord = bool(data.get("post_to_discord", True))
     account_id = (data.get("account_id") or os.environ.get("REDDIT_AD_ACCOUNT_ID") or "").strip()
     if not account_id:
@@ -4854,9 +5489,8 @@ def run_reddit_portfolio_report():
         raw_performance_response: Optional[Dict[str, Any]] = None
         if debug_audience and isinstance(fetch_body, dict) and fetch_body.get("storage_path"):
             try:
-                from bigas.resources.marketing.storage_service import StorageService
-                _storage = StorageService()
-                _raw_obj = _storage.get_json(fetch_body["storage_path"])
+                _storage = _get_storage_service()
+                _raw_obj = _storage.get_json_if_exists(fetch_body["storage_path"])
                 if isinstance(_raw_obj, dict):
                     raw_performance_response = _raw_obj.get("payload", {}).get("raw_response")
             except Exception as e:
@@ -4867,9 +5501,8 @@ def run_reddit_portfolio_report():
         performance_payload = None
         if enriched_path:
             try:
-                from bigas.resources.marketing.storage_service import StorageService
-                storage = StorageService()
-                obj = storage.get_json(enriched_path)
+                storage = _get_storage_service()
+                obj = storage.get_json_if_exists(enriched_path)
                 if obj and isinstance(obj, dict):
                     payload = obj.get("payload") or {}
                     enriched = payload.get("enriched_response") or {}
@@ -5030,9 +5663,9 @@ def run_reddit_portfolio_report():
         if not prompt_cfg:
             return jsonify({"error": "Prompt configuration missing for Reddit portfolio"}), 500
         system_prompt = prompt_cfg["system"]
-        user_prompt = prompt_cfg["user_template"].format(
+        user_prompt = prompt_cfg["render"](
             platform="reddit",
-            payload=json.dumps(combined, indent=2),
+            payload=_dumps_llm_payload(combined),
         )
 
         llm, _ = get_llm_client(feature="marketing", explicit_model=model)
@@ -5105,8 +5738,9 @@ def run_reddit_portfolio_report():
                 out["troubleshooting"]["raw_performance_response"] = raw_performance_response
         return jsonify(out)
     except Exception:
-        logger.error("Error in run_reddit_portfolio_report: %s", traceback.format_exc())
-        sanitized_error = sanitize_error_message(str(traceback.format_exc()))
+        tb = traceback.format_exc()
+        logger.error("Error in run_reddit_portfolio_report: %s", tb)
+        sanitized_error = sanitize_error_message(tb[-_ERROR_TRACEBACK_MAX_CHARS:])
         return jsonify({"error": sanitized_error}), 500
 
 
@@ -5120,20 +5754,11 @@ def run_cross_platform_marketing_analysis_async():
     timeout_seconds = int(data.get("timeout_seconds") or 900)
     timeout_seconds = max(60, min(timeout_seconds, 3600))
 
-    app_obj = current_app._get_current_object()
-    access_header = app_obj.config.get("BIGAS_ACCESS_HEADER", "X-Bigas-Access-Key")
-    request_key = (request.headers.get(access_header) or "").strip()
-    if request_key:
-        data["_internal_access_key"] = request_key
+    app_obj = _capture_access_key(data)
 
     job_id = _create_async_job(data, timeout_seconds=timeout_seconds)
 
-    t = threading.Thread(
-        target=_run_cross_platform_job,
-        args=(app_obj, job_id, data),
-        daemon=True,
-    )
-    t.start()
+    _ASYNC_JOB_POOL.submit(_run_cross_platform_job, app_obj, job_id, data)
 
     return jsonify(
         {
@@ -5167,7 +5792,7 @@ def run_cross_platform_marketing_analysis():
     run_cross_platform_marketing_analysis_async and poll get_job_status / get_job_result.
     """
     data = request.json or {}
-    relative_range = (data.get("relative_range") or "LAST_30_DAYS").strip().upper()
+    relative_range = _norm(data.get("relative_range") or "LAST_30_DAYS")
     if relative_range not in ("LAST_7_DAYS", "LAST_30_DAYS", "LAST_90_DAYS"):
         relative_range = "LAST_30_DAYS"
 
@@ -5203,8 +5828,7 @@ def run_cross_platform_marketing_analysis():
     try:
         import concurrent.futures
 
-        from bigas.resources.marketing.storage_service import StorageService
-        storage = StorageService()
+        storage = _get_storage_service()
 
         if not account_urn:
             return jsonify({"error": "account_urn is required (or set LINKEDIN_AD_ACCOUNT_URN)."}), 400
@@ -5386,8 +6010,7 @@ def run_cross_platform_marketing_analysis():
         linkedin_compact = _build_linkedin_compact_payload(storage, li_enriched_path, sample_limit) if li_enriched_path else None
         if linkedin_compact and account_urn:
             try:
-                from bigas.resources.marketing.linkedin_ads_service import LinkedInAdsService
-                svc = LinkedInAdsService()
+                svc = _get_linkedin_svc()
                 acc = svc.get_ad_account(account_urn)
                 api_currency = (acc.get("currency") or "").strip().upper()
                 if api_currency:
@@ -5458,9 +6081,9 @@ def run_cross_platform_marketing_analysis():
             return jsonify({"error": "Prompt configuration missing for cross-platform budget analysis"}), 500
 
         system_prompt = prompt_cfg["system"]
-        user_prompt = prompt_cfg["user_template"].format(
+        user_prompt = prompt_cfg["render"](
             date_range=date_range_str,
-            payload=json.dumps(combined, indent=2),
+            payload=_dumps_llm_payload(combined),
         )
 
         llm, _ = get_llm_client(feature="marketing", explicit_model=model)
@@ -5497,7 +6120,7 @@ def run_cross_platform_marketing_analysis():
             }
         )
     except Exception as e:
-        logger.error("Error in run_cross_platform_marketing_analysis: %s", traceback.format_exc())
+        logger.exception("Error in run_cross_platform_marketing_analysis")
         sanitized_error = sanitize_error_message(str(e))
         return jsonify({"error": sanitized_error}), 500
 
@@ -5982,7 +6605,7 @@ def get_stored_reports():
             "total_reports": len(reports)
         })
     except Exception as e:
-        logger.error(f"Error retrieving stored reports: {traceback.format_exc()}")
+        logger.exception("Error retrieving stored reports")
         return jsonify({"error": str(e)}), 500
 
 @marketing_bp.route('/mcp/tools/get_latest_report', methods=['GET'])
@@ -6004,7 +6627,7 @@ def get_latest_report():
             "summary": summary
         })
     except Exception as e:
-        logger.error(f"Error retrieving latest report: {traceback.format_exc()}")
+        logger.exception("Error retrieving latest report")
         return jsonify({"error": str(e)}), 500
 
 @marketing_bp.route('/mcp/tools/analyze_underperforming_pages', methods=['POST'])
@@ -6325,7 +6948,7 @@ def analyze_underperforming_pages():
         })
         
     except Exception as e:
-        logger.error(f"Error analyzing underperforming pages: {traceback.format_exc()}")
+        logger.exception("Error analyzing underperforming pages")
         return jsonify({"error": str(e)}), 500
 
 @marketing_bp.route('/mcp/tools/cleanup_old_reports', methods=['POST'])
@@ -6347,7 +6970,7 @@ def cleanup_old_reports():
             "message": f"Cleaned up {deleted_count} old reports, keeping reports from the last {keep_days} days"
         })
     except Exception as e:
-        logger.error(f"Error cleaning up old reports: {traceback.format_exc()}")
+        logger.exception("Error cleaning up old reports")
         return jsonify({"error": str(e)}), 500
 
 
@@ -6376,7 +6999,7 @@ def send_discord_message(message: str) -> bool:
 
 
 # Backwards-compatible re-exports (canonical implementation: bigas.discord_webhook).
-from bigas.discord_webhook import post_long_to_discord, post_to_discord  # noqa: E402
+from bigas.discord_webhook import post_long_to_discord, post_to_discord, stream_long_to_discord  # noqa: E402
 
 @marketing_bp.route('/openapi.json', methods=['GET'])
 def openapi_spec():
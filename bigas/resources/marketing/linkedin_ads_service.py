@@ -19,11 +19,14 @@ from __future__ import annotations
 import os
 import time
 import logging
+import threading
 from dataclasses import dataclass
 from datetime import date
 from typing import Any, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import quote
 
 logger = logging.getLogger(__name__)
@@ -33,6 +36,14 @@ LINKEDIN_OAUTH_TOKEN_URL = "https://www.linkedin.com/oauth/v2/accessToken"
 LINKEDIN_API_BASE = "https://api.linkedin.com/rest"
 DEFAULT_LINKEDIN_VERSION = "202601"
 
+# Connection pool size for the shared LinkedIn HTTP session. Report pipelines issue many small
+# GETs (creatives, demographic pivots, URN lookups) against the same host; reusing keep-alive
+# connections avoids a TLS handshake per call.
+LINKEDIN_HTTP_POOL_SIZE = int(os.environ.get("LINKEDIN_HTTP_POOL_SIZE", "10"))
+
+# Max ids per /v2 standardized-data batch GET (keeps the ids=List(...) URL well under limits).
+LINKEDIN_V2_BATCH_SIZE = 50
+
 
 class LinkedInAuthError(RuntimeError):
     pass
@@ -108,6 +119,36 @@ def _load_access_token_from_gcs() -> Optional[str]:
         )
         return None
 
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+
+def _get_http_session() -> requests.Session:
+    """Return the process-wide pooled session used for LinkedIn API calls."""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                # Transient 429/5xx on idempotent GETs are retried with backoff (honouring
+                # Retry-After); the last response is returned so callers still map it to
+                # LinkedInApiError. Token-mint POSTs are not retried.
+                retries = Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=LINKEDIN_HTTP_POOL_SIZE,
+                    pool_maxsize=LINKEDIN_HTTP_POOL_SIZE,
+                    max_retries=retries,
+                )
+                session.mount("https://", adapter)
+                _http_session = session
+    return _http_session
+
+
 class LinkedInAdsService:
     def __init__(
         self,
@@ -134,6 +175,7 @@ class LinkedInAdsService:
             refresh_token=refresh_token,
             linkedin_version=linkedin_version,
         )
+        self._http = _get_http_session()
 
     def _mint_access_token(self) -> str:
         """
@@ -170,7 +212,7 @@ class LinkedInAdsService:
             "client_id": self.config.client_id,
             "client_secret": self.config.client_secret,
         }
-        resp = requests.post(LINKEDIN_OAUTH_TOKEN_URL, data=data, timeout=30)
+        resp = self._http.post(LINKEDIN_OAUTH_TOKEN_URL, data=data, timeout=30)
         if resp.status_code >= 400:
             retry_after = resp.headers.get("Retry-After")
             logger.error(
@@ -211,7 +253,7 @@ class LinkedInAdsService:
 
     def get_title(self, title_id: str) -> Dict[str, Any]:
         url = f"https://api.linkedin.com/v2/titles/{title_id}"
-        resp = requests.get(url, headers=self._headers_v2(), timeout=30)
+        resp = self._http.get(url, headers=self._headers_v2(), timeout=30)
         if resp.status_code >= 400:
             raise LinkedInApiError(
                 "LinkedIn API error calling titles",
@@ -223,7 +265,7 @@ class LinkedInAdsService:
 
     def get_function(self, function_id: str) -> Dict[str, Any]:
         url = f"https://api.linkedin.com/v2/functions/{function_id}"
-        resp = requests.get(url, headers=self._headers_v2(), timeout=30)
+        resp = self._http.get(url, headers=self._headers_v2(), timeout=30)
         if resp.status_code >= 400:
             raise LinkedInApiError(
                 "LinkedIn API error calling functions",
@@ -235,7 +277,7 @@ class LinkedInAdsService:
 
     def get_industry(self, industry_id: str) -> Dict[str, Any]:
         url = f"https://api.linkedin.com/v2/industries/{industry_id}"
-        resp = requests.get(url, headers=self._headers_v2(), timeout=30)
+        resp = self._http.get(url, headers=self._headers_v2(), timeout=30)
         if resp.status_code >= 400:
             raise LinkedInApiError(
                 "LinkedIn API error calling industries",
@@ -247,7 +289,7 @@ class LinkedInAdsService:
 
     def get_seniority(self, seniority_id: str) -> Dict[str, Any]:
         url = f"https://api.linkedin.com/v2/seniorities/{seniority_id}"
-        resp = requests.get(url, headers=self._headers_v2(), timeout=30)
+        resp = self._http.get(url, headers=self._headers_v2(), timeout=30)
         if resp.status_code >= 400:
             raise LinkedInApiError(
                 "LinkedIn API error calling seniorities",
@@ -259,7 +301,7 @@ class LinkedInAdsService:
 
     def get_geo(self, geo_id: str) -> Dict[str, Any]:
         url = f"https://api.linkedin.com/v2/geo/{geo_id}"
-        resp = requests.get(url, headers=self._headers_v2(), timeout=30)
+        resp = self._http.get(url, headers=self._headers_v2(), timeout=30)
         if resp.status_code >= 400:
             raise LinkedInApiError(
                 "LinkedIn API error calling geo",
@@ -269,6 +311,45 @@ class LinkedInAdsService:
             )
         return resp.json()
 
+    def _batch_get_v2(self, resource: str, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Batch-get /v2 standardized-data entities via ids=List(...).
+
+        Returns {id: entity} for the ids LinkedIn resolved; unknown ids are omitted.
+        """
+        unique_ids = list(dict.fromkeys(str(i).strip() for i in ids if str(i).strip()))
+        out: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(unique_ids), LINKEDIN_V2_BATCH_SIZE):
+            chunk = unique_ids[start:start + LINKEDIN_V2_BATCH_SIZE]
+            url = f"https://api.linkedin.com/v2/{resource}?ids=List({','.join(quote(i, safe='') for i in chunk)})"
+            resp = self._http.get(url, headers=self._headers_v2(), timeout=30)
+            if resp.status_code >= 400:
+                raise LinkedInApiError(
+                    f"LinkedIn API error calling {resource}",
+                    status_code=resp.status_code,
+                    response_text=resp.text,
+                    operation=f"{resource} batch get",
+                )
+            results = (resp.json() or {}).get("results") or {}
+            if isinstance(results, dict):
+                out.update({str(k): v for k, v in results.items() if isinstance(v, dict)})
+        return out
+
+    def get_titles(self, title_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        return self._batch_get_v2("titles", title_ids)
+
+    def get_functions(self, function_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        return self._batch_get_v2("functions", function_ids)
+
+    def get_industries(self, industry_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        return self._batch_get_v2("industries", industry_ids)
+
+    def get_seniorities(self, seniority_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        return self._batch_get_v2("seniorities", seniority_ids)
+
+    def get_geos(self, geo_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        return self._batch_get_v2("geo", geo_ids)
+
     def get_creative(self, *, ad_account_id: int, creative_urn: str) -> Dict[str, Any]:
         """
         Resolve a sponsored creative URN to creative metadata (including 'name') using the versioned Creatives API.
@@ -278,7 +359,7 @@ class LinkedInAdsService:
         """
         encoded = quote(creative_urn, safe="")
         url = f"{LINKEDIN_API_BASE}/adAccounts/{ad_account_id}/creatives/{encoded}"
-        resp = requests.get(url, headers=self._headers(), timeout=30)
+        resp = self._http.get(url, headers=self._headers(), timeout=30)
         if resp.status_code >= 400:
             raise LinkedInApiError(
                 "LinkedIn API error calling creatives",
@@ -298,7 +379,7 @@ class LinkedInAdsService:
         if not aid or not aid.isdigit():
             raise ValueError("account_id must be numeric or urn:li:sponsoredAccount:{id}")
         url = f"https://api.linkedin.com/v2/adAccountsV2/{aid}"
-        resp = requests.get(url, headers=self._headers_v2(), timeout=30)
+        resp = self._http.get(url, headers=self._headers_v2(), timeout=30)
         if resp.status_code >= 400:
             logger.warning("LinkedIn adAccountsV2 get failed: status=%s body=%s", resp.status_code, (resp.text or "")[:500])
             raise LinkedInApiError(
@@ -315,7 +396,7 @@ class LinkedInAdsService:
         """
         params = {"q": "search", "start": start, "count": count}
         url = f"{LINKEDIN_API_BASE}/adAccounts"
-        resp = requests.get(url, headers=self._headers(), params=params, timeout=30)
+        resp = self._http.get(url, headers=self._headers(), params=params, timeout=30)
         if resp.status_code >= 400:
             logger.error("LinkedIn adAccounts failed: status=%s body=%s", resp.status_code, (resp.text or "")[:2000])
             raise LinkedInApiError(
@@ -379,7 +460,7 @@ class LinkedInAdsService:
             query += "&fields=" + ",".join(fields)
 
         url = f"{LINKEDIN_API_BASE}/adAnalytics?{query}"
-        resp = requests.get(url, headers=self._headers(), timeout=60)
+        resp = self._http.get(url, headers=self._headers(), timeout=60)
         if resp.status_code >= 400:
             logger.error("LinkedIn adAnalytics failed: status=%s body=%s", resp.status_code, (resp.text or "")[:2000])
             raise LinkedInApiError("LinkedIn API error calling adAnalytics", resp.status_code, resp.text)
@@ -434,7 +515,7 @@ class LinkedInAdsService:
             query += "&fields=" + ",".join(fields)
 
         url = f"{LINKEDIN_API_BASE}/adAnalytics?{query}"
-        resp = requests.get(url, headers=self._headers(), timeout=60)
+        resp = self._http.get(url, headers=self._headers(), timeout=60)
         if resp.status_code >= 400:
             logger.error("LinkedIn adAnalytics (statistics) failed: status=%s body=%s", resp.status_code, (resp.text or "")[:2000])
             raise LinkedInApiError("LinkedIn API error calling adAnalytics statistics", resp.status_code, resp.text)
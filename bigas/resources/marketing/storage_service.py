@@ -11,12 +11,43 @@ import os
 import json
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set
 from google.cloud import storage
+from google.api_core.exceptions import NotModified
 from google.cloud.exceptions import NotFound
 
+from bigas.resources.marketing.ttl_cache import TTLCache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
+# Recently downloaded small blobs keyed by (bucket, blob) -> (etag, bytes). Re-reads send
+# If-None-Match so unchanged content is revalidated without downloading the body again.
+_ETAG_CACHE_MAX_BYTES = 1024 * 1024
+_etag_cache = TTLCache(maxsize=64, ttl=3600)
+
+# Parsed JSON for recently read blobs keyed by (bucket, blob); lets back-to-back tool calls
+# over the same reports skip GCS entirely. Writes through store_json invalidate the entry.
+_json_cache = TTLCache(maxsize=512, ttl=300)
+
+
+def _dumps_json_bytes(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _loads_json_bytes(content: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, using orjson when it is installed. Raises ValueError if invalid."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
 class StorageService:
     """Service for managing analytics report storage using Google Cloud Storage."""
     
@@ -81,7 +112,7 @@ class StorageService:
         # Upload to Google Cloud Storage
         blob = self.bucket.blob(blob_name)
         blob.upload_from_string(
-            json.dumps(full_data, indent=2),
+            _dumps_json_bytes(full_data),
             content_type='application/json'
         )
         
@@ -139,83 +170,11 @@ class StorageService:
         blob_name = f"raw_ads/{platform}/{report_date}/{safe_filename}"
 
         blob = self.bucket.blob(blob_name)
-        blob.upload_from_string(json.dumps(full_data, indent=2), content_type="application/json")
+        blob.upload_from_string(_dumps_json_bytes(full_data), content_type="application/json")
 
         logger.info(f"Stored raw ads report for {platform} ({report_date}) at {blob_name}")
         return blob_name
 
-    def blob_exists(self, blob_name: str) -> bool:
-        """Check whether a blob exists in the bucket."""
-        if not blob_name or not blob_name.strip():
-            return False
-        try:
-            return self.bucket.blob(blob_name).exists()
-        except Exception:
-            return False
-
-    def store_raw_ads_report_at_blob(
-        self,
-        platform: str,
-        blob_name: str,
-        report_data: Dict[str, Any],
-        report_date: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None,
-    ) -> str:
-        """
-        Store raw ads payload at an explicit blob name, using the same {metadata,payload} wrapper
-        as store_raw_ads_report.
-        """
-        if report_date is None:
-            report_date = datetime.now().strftime("%Y-%m-%d")
-
-        platform = (platform or "").strip().lower()
-        if not platform:
-            raise ValueError("platform is required for storing raw ads reports")
-        if not blob_name or not blob_name.strip():
-            raise ValueError("blob_name is required")
-
-        metadata_obj = {
-            "report_date": report_date,
-            "stored_at": datetime.now().isoformat(),
-            "report_type": "raw_ads",
-            "platform": platform,
-            "version": "1.0",
-        }
-        if metadata:
-            metadata_obj.update(metadata)
-
-        full_data = {
-            "metadata": metadata_obj,
-            "payload": report_data,
-        }
-
-        return self.store_json(blob_name=blob_name, data=full_data)
-
-    def store_json(self, blob_name: str, data: Dict[str, Any]) -> str:
-        """
-        Store arbitrary JSON data at the given blob name.
-        """
-        if not blob_name or not blob_name.strip():
-            raise ValueError("blob_name is required")
-        blob = self.bucket.blob(blob_name)
-        blob.upload_from_string(json.dumps(data, indent=2), content_type="application/json")
-        logger.info(f"Stored JSON at {blob_name}")
-        return blob_name
-
-    def get_json(self, blob_name: str) -> Optional[Dict[str, Any]]:
-        """
-        Load JSON from a blob. Returns None if not found or invalid.
-        """
-        try:
-            blob = self.bucket.blob(blob_name)
-            if not blob.exists():
-                return None
-            content = blob.download_as_text()
-            return json.loads(content) if content else None
-        except Exception as e:
-            logger.warning(f"Failed to load JSON from {blob_name}: {e}")
-            return None
-    
     def get_latest_weekly_report(self) -> Optional[Dict[str, Any]]:
         """
         Retrieve the most recent weekly analytics report.
@@ -296,13 +255,24 @@ class StorageService:
         Store raw ads payload at an explicit blob name, using the same {metadata, payload} wrapper
         as store_raw_ads_report.
         """
+        if not blob_name or not blob_name.strip():
+            raise ValueError("blob_name is required")
+        full_data = self.raw_ads_report_document(platform, report_data, report_date, metadata)
+        return self.store_json(blob_name=blob_name, data=full_data)
+
+    def raw_ads_report_document(
+        self,
+        platform: str,
+        report_data: Dict[str, Any],
+        report_date: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Build the {metadata, payload} document stored for a raw ads report."""
         if report_date is None:
             report_date = datetime.now().strftime("%Y-%m-%d")
         platform = (platform or "").strip().lower()
         if not platform:
             raise ValueError("platform is required for storing raw ads reports")
-        if not blob_name or not blob_name.strip():
-            raise ValueError("blob_name is required")
         metadata_obj = {
             "report_date": report_date,
             "stored_at": datetime.now().isoformat(),
@@ -312,17 +282,25 @@ class StorageService:
         }
         if metadata:
             metadata_obj.update(metadata)
-        full_data = {"metadata": metadata_obj, "payload": report_data}
-        return self.store_json(blob_name=blob_name, data=full_data)
+        return {"metadata": metadata_obj, "payload": report_data}
 
-    def store_json(self, blob_name: str, data: Dict[str, Any]) -> str:
-        """Store arbitrary JSON data at the given blob name."""
+    def store_json(
+        self, blob_name: str, data: Dict[str, Any], blob_metadata: Optional[Dict[str, str]] = None
+    ) -> str:
+        """
+        Store arbitrary JSON data at the given blob name.
+
+        blob_metadata is written as custom object metadata, readable later via get_metadata
+        without downloading the JSON body.
+        """
         if not blob_name or not blob_name.strip():
             raise ValueError("blob_name is required")
         blob = self.bucket.blob(blob_name)
-        blob.upload_from_string(
-            json.dumps(data, indent=2), content_type="application/json"
-        )
+        if blob_metadata:
+            blob.metadata = blob_metadata
+        blob.upload_from_string(_dumps_json_bytes(data), content_type="application/json")
+        _etag_cache.pop((self.bucket_name, blob_name), None)
+        _json_cache.pop((self.bucket_name, blob_name), None)
         logger.info(f"Stored JSON at {blob_name}")
         return blob_name
 
@@ -338,6 +316,100 @@ class StorageService:
             logger.warning(f"Failed to load JSON from {blob_name}: {e}")
             return None
 
+    def get_json_cached(self, blob_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Like get_json_if_exists, but serves blobs read within the last few minutes from
+        process memory.
+
+        The returned dict is shared between callers and must be treated as read-only.
+        """
+        key = (self.bucket_name, blob_name)
+        obj = _json_cache.get(key)
+        if obj is None:
+            obj = self.get_json_if_exists(blob_name)
+            if obj is not None:
+                _json_cache.set(key, obj)
+        return obj
+
+    def get_bytes_if_exists(self, blob_name: str) -> Optional[bytes]:
+        """
+        Download a blob's raw bytes with a single GCS request. Returns None if not found.
+
+        Small blobs are remembered with their ETag; later reads are conditional and reuse
+        the remembered bytes when GCS answers 304 Not Modified.
+        """
+        if not blob_name or not blob_name.strip():
+            return None
+        key = (self.bucket_name, blob_name)
+        cached = _etag_cache.get(key)
+        blob = self.bucket.blob(blob_name)
+        try:
+            if cached is not None:
+                content = blob.download_as_bytes(if_etag_not_match=cached[0])
+            else:
+                content = blob.download_as_bytes()
+        except NotModified:
+            return cached[1]
+        except NotFound:
+            _etag_cache.pop(key, None)
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to download {blob_name}: {e}")
+            return None
+        if blob.etag and len(content) <= _ETAG_CACHE_MAX_BYTES:
+            _etag_cache.set(key, (blob.etag, content))
+        else:
+            _etag_cache.pop(key, None)
+        return content
+
+    def get_json_if_exists(self, blob_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Load JSON from a blob with a single GCS request. Returns None if not found or invalid.
+
+        Unlike get_json, this skips the separate exists() call and treats NotFound as a miss,
+        which halves the round-trips on cache lookups.
+        """
+        content = self.get_bytes_if_exists(blob_name)
+        if not content:
+            return None
+        try:
+            return _loads_json_bytes(content)
+        except ValueError as e:
+            logger.warning(f"Invalid JSON in {blob_name}: {e}")
+            return None
+
+    def get_metadata(self, blob_name: str) -> Optional[Dict[str, str]]:
+        """
+        Return a blob's custom metadata ({} if it has none) with a metadata-only request,
+        or None if the blob does not exist.
+        """
+        if not blob_name or not blob_name.strip():
+            return None
+        try:
+            blob = self.bucket.get_blob(blob_name)
+        except Exception as e:
+            logger.warning(f"Failed to read metadata for {blob_name}: {e}")
+            return None
+        if blob is None:
+            return None
+        return dict(blob.metadata or {})
+
+    def list_existing(self, prefix: str) -> Optional[Set[str]]:
+        """
+        Return the names of all blobs under prefix using one (paginated) listing request.
+
+        Lets callers replace many per-blob existence checks with set membership.
+        Returns None if the listing fails, so callers can fall back to per-blob checks.
+        """
+        try:
+            return {
+                blob.name
+                for blob in self.bucket.list_blobs(prefix=prefix, fields="items(name),nextPageToken")
+            }
+        except Exception as e:
+            logger.warning(f"Failed to list blobs under {prefix}: {e}")
+            return None
+
     def list_available_reports(self) -> List[Dict[str, str]]:
         """
         List all available weekly reports with their dates and metadata.
@@ -647,6 +647,19 @@ def validate_ga4_metrics_dimensions(metrics: List[str], dimensions: List[str]) -
     
     return True, ""
 
+# (literal marker, compiled pattern, replacement). The marker is a substring every match
+# contains, so patterns whose marker is absent are skipped without running the regex.
+_SANITIZE_PATTERNS = (
+    # Potential API keys
+    ("sk-", re.compile(r'sk-[a-zA-Z0-9]{20,}'), '[API_KEY_HIDDEN]'),
+    ("AIza", re.compile(r'AIza[a-zA-Z0-9_-]{35}'), '[API_KEY_HIDDEN]'),
+    # Potential URLs with tokens
+    ("/api/webhooks/", re.compile(r'https://[^\s]+/api/webhooks/[^\s]+'), '[WEBHOOK_URL_HIDDEN]'),
+    # Potential file paths that might contain sensitive info
+    ("/home/", re.compile(r'/home/[^/]+/[^/]+'), '[PATH_HIDDEN]'),
+    ("/Users/", re.compile(r'/Users/[^/]+/[^/]+'), '[PATH_HIDDEN]'),
+)
+
 def sanitize_error_message(error: str) -> str:
     """
     Remove sensitive information from error messages.
@@ -657,16 +670,9 @@ def sanitize_error_message(error: str) -> str:
     Returns:
         Sanitized error message
     """
-    # Remove potential API keys
-    error = re.sub(r'sk-[a-zA-Z0-9]{20,}', '[API_KEY_HIDDEN]', error)
-    error = re.sub(r'AIza[a-zA-Z0-9_-]{35}', '[API_KEY_HIDDEN]', error)
-    
-    # Remove potential URLs with tokens
-    error = re.sub(r'https://[^\s]+/api/webhooks/[^\s]+', '[WEBHOOK_URL_HIDDEN]', error)
-    
-    # Remove potential file paths that might contain sensitive info
-    error = re.sub(r'/home/[^/]+/[^/]+', '[PATH_HIDDEN]', error)
-    error = re.sub(r'/Users/[^/]+/[^/]+', '[PATH_HIDDEN]', error)
+    for marker, pattern, replacement in _SANITIZE_PATTERNS:
+        if marker in error:
+            error = pattern.sub(replacement, error)
     
     return error
 
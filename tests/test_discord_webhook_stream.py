@@ -0,0 +1,48 @@
+"""Tests for multi-part Discord webhook posting."""
+
+from __future__ import annotations
+
+from bigas import discord_webhook
+
+
+def test_stream_posts_parts_before_the_stream_ends(monkeypatch):
+    posted = []
+    monkeypatch.setattr(discord_webhook, "post_to_discord", lambda url, msg: posted.append(msg) or True)
+    monkeypatch.setattr(discord_webhook.time, "sleep", lambda _s: None)
+
+    def chunks():
+        yield "line one\n"
+        yield "x" * 20 + "\n"
+        assert len(posted) == 1  # first part went out while still streaming
+        yield "tail"
+
+    text = discord_webhook.stream_long_to_discord(
+        "https://discord.test/hook", chunks(), header="# H\n", footer="\n--", chunk_size=25
+    )
+
+    assert text == "line one\n" + "x" * 20 + "\ntail"
+    assert posted == ["# H\nline one", "x" * 20, "tail\n--"]
+
+
+def test_stream_without_webhook_only_collects_text(monkeypatch):
+    monkeypatch.setattr(discord_webhook, "post_to_discord", lambda *_a: (_ for _ in ()).throw(AssertionError))
+
+    assert discord_webhook.stream_long_to_discord(None, iter(["a", "b"])) == "ab"
+
+
+class _Resp:
+    def __init__(self, headers):
+        self.status_code = 204
+        self.headers = headers
+        self.text = ""
+
+
+def test_posts_wait_only_when_the_rate_limit_bucket_is_empty(monkeypatch):
+    headers = iter([{"X-RateLimit-Remaining": "1"}, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "0.8"}])
+    sleeps = []
+    monkeypatch.setattr(discord_webhook._session, "post", lambda *a, **k: _Resp(next(headers)))
+    monkeypatch.setattr(discord_webhook.time, "sleep", sleeps.append)
+
+    discord_webhook.post_long_to_discord("https://discord.test/hook", "a" * 10 + "\n" + "b" * 10, chunk_size=12)
+
+    assert sleeps == [0.8]
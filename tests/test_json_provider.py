@@ -0,0 +1,40 @@
+"""Tests for the orjson-backed Flask JSON provider."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+
+from flask import Flask, jsonify, request
+
+from bigas.json_provider import OrjsonProvider
+
+
+def _app():
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    app.json.sort_keys = False
+    app.json.compact = True
+
+    @app.route("/echo", methods=["POST"])
+    def echo():
+        return jsonify({"got": request.get_json(), "when": date(2025, 1, 2), "cost": Decimal("1.50"), 3: "x"})
+
+    return app
+
+
+def test_responses_match_the_default_provider_encoding():
+    app = _app()
+    resp = app.test_client().post("/echo", json={"b": 1, "a": [1.5, None]})
+
+    assert resp.get_data() == (
+        b'{"got":{"b":1,"a":[1.5,null]},"when":"Thu, 02 Jan 2025 00:00:00 GMT","cost":"1.50","3":"x"}\n'
+    )
+
+
+def test_dumps_with_stdlib_options_falls_back():
+    app = _app()
+    with app.app_context():
+        assert app.json.dumps({"t": datetime(2025, 1, 2, 3, 4, 5)}, indent=2) == (
+            '{\n  "t": "Thu, 02 Jan 2025 03:04:05 GMT"\n}'
+        )
@@ -0,0 +1,86 @@
+"""Tests for the process-local cache in front of fetch_linkedin_ad_analytics_report."""
+
+from __future__ import annotations
+
+from flask import Flask
+
+from bigas.resources.marketing import endpoints
+from bigas.resources.marketing.endpoints import marketing_bp
+from bigas.resources.marketing.ttl_cache import TTLCache
+
+
+class _FakeStorage:
+    def store_raw_ads_report_at_blob(self, platform, blob_name, report_data, report_date=None, metadata=None):
+        return blob_name
+
+    def blob_exists(self, blob_name):
+        return False
+
+    def get_json_if_exists(self, blob_name):
+        return None
+
+
+class _FakeSvc:
+    def __init__(self):
+        self.calls = 0
+
+    def ad_analytics(self, **kwargs):
+        self.calls += 1
+        return {"elements": [{"impressions": 10}]}
+
+
+def test_cache_hit_keeps_enriched_storage_path(monkeypatch):
+    svc = _FakeSvc()
+    previews = []
+    monkeypatch.setattr(endpoints, "_PAYLOAD_CACHE", TTLCache(maxsize=8, ttl=60))
+    monkeypatch.setattr(endpoints, "_get_storage_service", lambda: _FakeStorage())
+    monkeypatch.setattr(endpoints, "_get_linkedin_svc", lambda: svc)
+    monkeypatch.setattr(endpoints, "_store_linkedin_enriched", lambda *args, **kwargs: True)
+    monkeypatch.setattr(endpoints, "_store_cache_preview", lambda storage, blob, preview: previews.append(preview))
+
+    app = Flask(__name__)
+    app.register_blueprint(marketing_bp)
+    client = app.test_client()
+    payload = {
+        "account_urn": "123",
+        "start_date": "2025-01-01",
+        "end_date": "2025-01-30",
+        "pivot": "CREATIVE",
+        "include_entity_names": True,
+    }
+
+    first = client.post("/mcp/tools/fetch_linkedin_ad_analytics_report", json=payload).get_json()
+    second = client.post("/mcp/tools/fetch_linkedin_ad_analytics_report", json=payload).get_json()
+
+    assert svc.calls == 1
+    assert second["from_cache"] is True
+    assert first["enriched_storage_path"]
+    assert second["enriched_storage_path"] == first["enriched_storage_path"]
+    endpoints._STORAGE_POOL.submit(lambda: None).result()
+    assert previews and "enriched_storage_path" not in previews[0]
+
+
+def test_stored_preview_is_a_dict_in_process_and_verbatim_over_http(monkeypatch):
+    stored = b'{"status":"success","from_cache":true,"elements_count":1}'
+
+    class _PreviewStorage(_FakeStorage):
+        def get_bytes_if_exists(self, blob_name):
+            return stored if blob_name.endswith(".preview.json") else None
+
+    monkeypatch.setattr(endpoints, "_PAYLOAD_CACHE", TTLCache(maxsize=8, ttl=60))
+    monkeypatch.setattr(endpoints, "_get_storage_service", lambda: _PreviewStorage())
+    monkeypatch.setattr(endpoints, "_preview_blob_name", lambda blob_name: f"{blob_name}.preview.json")
+    payload = {"account_urn": "123", "pivot": "CREATIVE"}
+
+    body, status = endpoints._fetch_linkedin_ad_analytics_report_impl(payload, "2025-01-01", "2025-01-30")
+    assert status == 200 and isinstance(body, dict)
+    assert body["elements_count"] == 1
+
+    monkeypatch.setattr(endpoints, "_PAYLOAD_CACHE", TTLCache(maxsize=8, ttl=60))
+    app = Flask(__name__)
+    app.register_blueprint(marketing_bp)
+    resp = app.test_client().post(
+        "/mcp/tools/fetch_linkedin_ad_analytics_report",
+        json={**payload, "start_date": "2025-01-01", "end_date": "2025-01-30"},
+    )
+    assert resp.get_data() == stored
@@ -0,0 +1,62 @@
+"""Tests for LinkedIn adAnalytics enrichment."""
+
+from __future__ import annotations
+
+from bigas.resources.marketing import endpoints
+from bigas.resources.marketing.endpoints import _enrich_linkedin_adanalytics_response
+from bigas.resources.marketing.ttl_cache import TTLCache
+
+
+class _FakeSvc:
+    def __init__(self):
+        self.batch_calls = []
+
+    def get_titles(self, ids):
+        self.batch_calls.append(list(ids))
+        return {i: {"name": {"localized": {"en_US": f"Title {i}"}}} for i in ids}
+
+
+def _raw():
+    return {
+        "elements": [
+            {"pivotValues": ["urn:li:title:1"], "impressions": 30, "clicks": 3, "costInLocalCurrency": "6.00"},
+            {"pivotValues": ["urn:li:title:2"], "impressions": 10, "clicks": 1, "costInLocalCurrency": "2.00"},
+        ]
+    }
+
+
+def test_totals_shares_and_names(monkeypatch):
+    monkeypatch.setattr(endpoints, "_STANDARDIZED_URN_CACHE", TTLCache(maxsize=8, ttl=60))
+    out = _enrich_linkedin_adanalytics_response(_raw(), account_id=None, svc=_FakeSvc())
+
+    assert out["summary"]["totals"] == {"impressions": 40, "clicks": 4, "costInLocalCurrency": "8.00"}
+    first = out["elements"][0]
+    assert first["pivotValuesResolved"][0]["name"] == "Title 1"
+    assert first["derived"] == {"ctr": 0.1, "avg_cpc_local": 2.0}
+    assert first["shares"] == {"impressions_share": 0.75, "clicks_share": 0.75, "cost_share_local": 0.75}
+
+
+def test_standardized_urns_are_reused_across_requests(monkeypatch):
+    monkeypatch.setattr(endpoints, "_STANDARDIZED_URN_CACHE", TTLCache(maxsize=8, ttl=60))
+    svc = _FakeSvc()
+
+    _enrich_linkedin_adanalytics_response(_raw(), account_id=None, svc=svc)
+    out = _enrich_linkedin_adanalytics_response(_raw(), account_id=None, svc=svc)
+
+    assert svc.batch_calls == [["1", "2"]]
+    assert out["elements"][1]["pivotValuesResolved"][0]["name"] == "Title 2"
+
+
+def test_compact_rows_keep_names_and_key_metrics(monkeypatch):
+    monkeypatch.setattr(endpoints, "_STANDARDIZED_URN_CACHE", TTLCache(maxsize=8, ttl=60))
+    out = _enrich_linkedin_adanalytics_response(_raw(), account_id=None, svc=_FakeSvc())
+
+    rows = endpoints._compact_linkedin_rows(out["elements"] + ["junk"], sample_limit=1)
+
+    assert rows == [
+        {
+            "segments": ["Title 1"],
+            "metrics": {"impressions": 30, "clicks": 3, "costInLocalCurrency": "6.00"},
+            "derived": {"ctr": 0.1, "avg_cpc_local": 2.0},
+        }
+    ]
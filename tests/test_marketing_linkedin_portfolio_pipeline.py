@@ -0,0 +1,353 @@
+"""Tests for the in-process LinkedIn portfolio report pipeline."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+
+import pytest
+from flask import Flask
+
+from bigas.resources.marketing import endpoints
+from bigas.resources.marketing.endpoints import marketing_bp
+from bigas.resources.marketing.ttl_cache import TTLCache
+
+
+def _app():
+    app = Flask(__name__)
+    app.register_blueprint(marketing_bp)
+    return app
+
+
+@pytest.fixture(autouse=True)
+def _fresh_result_cache(monkeypatch):
+    monkeypatch.setattr(endpoints, "_PORTFOLIO_RESULT_CACHE", TTLCache(maxsize=8, ttl=60))
+
+
+def test_pipeline_passes_dicts_between_steps(monkeypatch):
+    monkeypatch.delenv("DISCORD_WEBHOOK_URL_MARKETING", raising=False)
+    monkeypatch.delenv("DISCORD_WEBHOOK_URL", raising=False)
+    calls = []
+
+    def discovery(data):
+        calls.append(("discovery", data["account_urn"]))
+        return {
+            "creatives": [{"creative_id": "7"}],
+            "date_range": {"start_date": "2025-01-01", "end_date": "2025-01-30"},
+        }, 200
+
+    def demographics(data, start_date_s, end_date_s):
+        calls.append(("demographics", data["creative_ids"], start_date_s, end_date_s))
+        return {"results": [{"creative_id": "7", "pivot": "MEMBER_JOB_TITLE", "enriched_storage_path": "e.json"}]}, 200
+
+    def summarize(data):
+        calls.append(("summarize", data["items"][0]["enriched_storage_path"]))
+        return {"had_data": True, "discord_posted": False, "used_model": "gpt-4.1-mini"}, 200
+
+    def ad_analytics(data, start_date_s, end_date_s):
+        calls.append(("ad_analytics", data["pivot"]))
+        return {"enriched_storage_path": "creative.enriched.json"}, 200
+
+    monkeypatch.setattr(endpoints, "_list_linkedin_creatives_for_period_impl", discovery)
+    monkeypatch.setattr(endpoints, "_fetch_linkedin_creative_demographics_portfolio_impl", demographics)
+    monkeypatch.setattr(endpoints, "_summarize_linkedin_creative_portfolio_impl", summarize)
+    monkeypatch.setattr(endpoints, "_fetch_linkedin_ad_analytics_report_impl", ad_analytics)
+
+    app = _app()
+    resp = app.test_client().post("/mcp/tools/run_linkedin_portfolio_report", json={"account_urn": "123"})
+
+    body = resp.get_json()
+    assert resp.status_code == 200
+    assert body["report_type"] == "portfolio"
+    assert body["enriched_storage_path"] == "creative.enriched.json"
+    # The CREATIVE-level fetch runs alongside demographics, so it has no fixed position.
+    assert ("ad_analytics", "CREATIVE") in calls
+    assert [c for c in calls if c[0] != "ad_analytics"] == [
+        ("discovery", "urn:li:sponsoredAccount:123"),
+        ("demographics", ["7"], "2025-01-01", "2025-01-30"),
+        ("summarize", "e.json"),
+    ]
+
+
+def test_fallback_reuses_the_in_flight_creative_fetch(monkeypatch):
+    monkeypatch.delenv("DISCORD_WEBHOOK_URL_MARKETING", raising=False)
+    monkeypatch.delenv("DISCORD_WEBHOOK_URL", raising=False)
+    fetches = []
+    monkeypatch.setattr(
+        endpoints,
+        "_list_linkedin_creatives_for_period_impl",
+        lambda data: ({"creatives": [{"creative_id": "7"}], "date_range": {"start_date": "2025-01-01", "end_date": "2025-01-30"}}, 200),
+    )
+    monkeypatch.setattr(
+        endpoints, "_fetch_linkedin_creative_demographics_portfolio_impl", lambda data, s, e: ({"results": []}, 200)
+    )
+    monkeypatch.setattr(
+        endpoints,
+        "_fetch_linkedin_ad_analytics_report_impl",
+        lambda data, s, e: fetches.append(data["force_refresh"]) or ({"enriched_storage_path": "c.json"}, 200),
+    )
+    monkeypatch.setattr(
+        endpoints, "_summarize_linkedin_ad_analytics_impl", lambda data: ({"had_data": True}, 200)
+    )
+
+    app = _app()
+    client = app.test_client()
+    resp = client.post("/mcp/tools/run_linkedin_portfolio_report", json={"account_urn": "123"})
+    refreshed = client.post("/mcp/tools/run_linkedin_portfolio_report", json={"account_urn": "123", "force_refresh": True})
+
+    assert resp.get_json()["report_type"] == "ad_analytics"
+    assert refreshed.get_json()["report_type"] == "ad_analytics"
+    # force_refresh is applied to the prefetch itself rather than triggering a second fetch.
+    assert fetches == [False, True]
+
+
+def test_unused_prefetch_failure_is_logged(caplog):
+    failed = Future()
+    failed.set_exception(RuntimeError("linkedin down"))
+
+    endpoints._release_linkedin_prefetch(failed)
+
+    assert "CREATIVE prefetch failed" in caplog.text
+
+
+def test_step_errors_are_returned_with_their_status(monkeypatch):
+    monkeypatch.setattr(
+        endpoints, "_list_linkedin_creatives_for_period_impl", lambda data: ({"error": "bad range"}, 400)
+    )
+
+    app = _app()
+    resp = app.test_client().post("/mcp/tools/run_linkedin_portfolio_report", json={"account_urn": "123"})
+
+    assert resp.status_code == 400
+    assert resp.get_json() == {"error": "bad range"}
+
+
+def test_batched_statistics_rows_split_back_per_creative():
+    raw = {
+        "elements": [
+            {"pivotValues": ["urn:li:sponsoredCreative:1", "urn:li:title:9"], "impressions": 5},
+            {"pivotValues": ["urn:li:sponsoredCreative:2", "urn:li:title:9"], "impressions": 7},
+            {"pivotValues": ["urn:li:sponsoredCreative:99", "urn:li:title:9"], "impressions": 1},
+        ]
+    }
+
+    split = endpoints._split_linkedin_creative_rows(raw, "MEMBER_JOB_TITLE", ["1", "2", "3"])
+
+    assert split[("1", "MEMBER_JOB_TITLE")] == {"elements": [{"pivotValues": ["urn:li:title:9"], "impressions": 5}]}
+    assert split[("2", "MEMBER_JOB_TITLE")]["elements"][0]["impressions"] == 7
+    assert split[("3", "MEMBER_JOB_TITLE")] == {"elements": []}
+    assert len(split) == 3
+
+
+def test_repeat_run_is_served_from_the_result_cache(monkeypatch):
+    discoveries = []
+    monkeypatch.setattr(
+        endpoints,
+        "_list_linkedin_creatives_for_period_impl",
+        lambda data: discoveries.append(data) or ({"creatives": [], "date_range": {"end_date": "2025-01-30"}}, 200),
+    )
+    monkeypatch.delenv("DISCORD_WEBHOOK_URL_MARKETING", raising=False)
+    monkeypatch.delenv("DISCORD_WEBHOOK_URL", raising=False)
+    app = _app()
+    client = app.test_client()
+
+    first = client.post("/mcp/tools/run_linkedin_portfolio_report", json={"account_urn": "123"})
+    second = client.post("/mcp/tools/run_linkedin_portfolio_report", json={"account_urn": "123", "timeout_seconds": 60})
+    refreshed = client.post("/mcp/tools/run_linkedin_portfolio_report", json={"account_urn": "123", "force_refresh": True})
+
+    assert first.get_json()["message"] == "no_creatives"
+    assert second.get_json() == {**first.get_json(), "from_cache": True}
+    assert "from_cache" not in refreshed.get_json()
+    assert len(discoveries) == 2
+
+
+def test_cache_hit_does_not_claim_a_discord_post(monkeypatch):
+    posts = []
+    monkeypatch.setattr(
+        endpoints,
+        "_list_linkedin_creatives_for_period_impl",
+        lambda data: ({"creatives": [], "date_range": {"end_date": "2025-01-30"}}, 200),
+    )
+    monkeypatch.setattr(endpoints, "post_to_discord", lambda url, msg: posts.append(msg))
+    monkeypatch.setenv("DISCORD_WEBHOOK_URL_MARKETING", "https://discord.invalid/hook")
+    app = _app()
+    client = app.test_client()
+
+    first = client.post("/mcp/tools/run_linkedin_portfolio_report", json={"account_urn": "123"}).get_json()
+    hit = client.post("/mcp/tools/run_linkedin_portfolio_report", json={"account_urn": "123"}).get_json()
+    assert first["discord_posted"] is True
+    assert hit["from_cache"] is True and hit["discord_posted"] is False
+    assert len(posts) == 1
+
+    for _ in range(2):
+        reposted = client.post(
+            "/mcp/tools/run_linkedin_portfolio_report", json={"account_urn": "123", "post_to_discord": True}
+        ).get_json()
+        assert "from_cache" not in reposted and reposted["discord_posted"] is True
+    assert len(posts) == 3
+
+
+def test_async_request_is_queued_without_running_the_pipeline(monkeypatch):
+    submitted = []
+
+    class _Pool:
+        def submit(self, fn, *args):
+            submitted.append((fn, args))
+
+    monkeypatch.setattr(endpoints, "_ASYNC_JOB_POOL", _Pool())
+    monkeypatch.setattr(
+        endpoints,
+        "_list_linkedin_creatives_for_period_impl",
+        lambda data: pytest.fail("sync pipeline ran for an async request"),
+    )
+    app = _app()
+    resp = app.test_client().post(
+        "/mcp/tools/run_linkedin_portfolio_report",
+        json={"account_urn": "123", "async": True, "timeout_seconds": 5000},
+    )
+
+    body = resp.get_json()
+    assert body["status"] == "accepted" and body["timeout_seconds"] == 900
+    assert [fn for fn, _ in submitted] == [endpoints._run_linkedin_portfolio_job]
+    assert submitted[0][1][1] == body["job_id"]
+
+
+def test_job_status_body_tracks_job_updates():
+    job_id = endpoints._create_async_job({"account_urn": "123"}, timeout_seconds=60)
+    app = _app()
+    client = app.test_client()
+
+    queued = client.post("/mcp/tools/get_job_status", json={"job_id": job_id}).get_json()
+    endpoints._update_async_job(job_id, status="succeeded", stage="done", progress_pct=100, result={"ok": True})
+    done = client.post("/mcp/tools/get_job_status", json={"job_id": job_id}).get_json()
+
+    assert (queued["status"], queued["result_available"]) == ("queued", False)
+    assert (done["status"], done["progress_pct"], done["result_available"]) == ("succeeded", 100, True)
+    assert client.post("/mcp/tools/get_job_status", json={"job_id": "job_missing"}).status_code == 404
+
+
+def test_discovery_payload_omits_unset_fields():
+    payload = endpoints._linkedin_discovery_payload(
+        {"discovery_start_date": " 2025-01-01 ", "discovery_end_date": "", "store_raw": None}, "urn:li:sponsoredAccount:1"
+    )
+
+    assert payload == {
+        "account_urn": "urn:li:sponsoredAccount:1",
+        "discovery_relative_range": "LAST_30_DAYS",
+        "discovery_start_date": "2025-01-01",
+        "min_impressions": 1,
+        "force_refresh": False,
+    }
+
+
+def test_creative_totals_are_not_summed_across_pivots(monkeypatch):
+    def enriched(rows, context=None):
+        return {
+            "payload": {
+                "enriched_response": {
+                    "context": context or {},
+                    "elements": [
+                        {"pivotValuesResolved": [{"name": seg}], "metrics": {"impressions": impr, "clicks": clicks}}
+                        for seg, impr, clicks in rows
+                    ]
+                }
+            }
+        }
+
+    blobs = {
+        "title.json": enriched([("Engineer", 60, 6), ("Manager", 40, 2)]),
+        "country.json": enriched(
+            [("Sweden", 100, 8)],
+            {"creatives": [{"urn": "urn:li:sponsoredCreative:7", "name": "Ad A"}, {"urn": "urn:li:sponsoredCreative:7", "name": "Dup"}]},
+        ),
+    }
+
+    class _Storage:
+        def get_json_cached(self, path):
+            return blobs[path]
+
+    class _LLM:
+        def complete(self, **kwargs):
+            return "analysis"
+
+    payloads = []
+    monkeypatch.setattr(endpoints, "OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(endpoints, "_get_storage_service", lambda: _Storage())
+    monkeypatch.setattr(endpoints, "get_llm_client", lambda **kwargs: (_LLM(), None))
+    monkeypatch.setattr(endpoints, "_dumps_llm_payload", lambda payload: payloads.append(payload) or "{}")
+    monkeypatch.delenv("DISCORD_WEBHOOK_URL_MARKETING", raising=False)
+    monkeypatch.delenv("DISCORD_WEBHOOK_URL", raising=False)
+
+    body, status = endpoints._summarize_linkedin_creative_portfolio_impl(
+        {
+            "items": [
+                {"creative_id": "7", "pivot": "MEMBER_JOB_TITLE", "enriched_storage_path": "title.json"},
+                {"creative_id": "7", "pivot": "MEMBER_COUNTRY_V2", "enriched_storage_path": "country.json"},
+            ]
+        }
+    )
+
+    assert status == 200 and body["ads_count"] == 1
+    totals = payloads[0]["ads"][0]["totals"]
+    assert (totals["impressions"], totals["clicks"]) == (100, 8)
+    assert set(payloads[0]["ads"][0]["pivots"]) == {"MEMBER_JOB_TITLE", "MEMBER_COUNTRY_V2"}
+    assert payloads[0]["ads"][0]["name"] == "Ad A"
+
+
+def test_access_key_header_is_read_from_each_apps_config(monkeypatch):
+    submitted = []
+
+    class _Pool:
+        def submit(self, fn, app_obj, job_id, data):
+            submitted.append(data.get("_internal_access_key"))
+
+    monkeypatch.setattr(endpoints, "_ASYNC_JOB_POOL", _Pool())
+    for header in ("X-First-Key", "X-Second-Key"):
+        app = _app()
+        app.config["BIGAS_ACCESS_HEADER"] = header
+        app.test_client().post(
+            "/mcp/tools/run_linkedin_portfolio_report_async",
+            json={"account_urn": "123"},
+            headers={header: f"key-for-{header}"},
+        )
+
+    assert submitted == ["key-for-X-First-Key", "key-for-X-Second-Key"]
+
+
+def test_invalid_async_summary_request_is_rejected_before_queuing(monkeypatch):
+    submitted = []
+
+    class _Pool:
+        def submit(self, fn, *args):
+            submitted.append(fn)
+
+    monkeypatch.setattr(endpoints, "_ASYNC_JOB_POOL", _Pool())
+    monkeypatch.setattr(endpoints, "OPENAI_API_KEY", "sk-test")
+
+    body, status = endpoints._summarize_linkedin_ad_analytics_impl(
+        {"enriched_storage_path": "e.json", "async": True, "padding": "x" * 20000}
+    )
+
+    assert status == 400 and "too large" in body["error"]
+    assert submitted == []
+
+
+def test_async_job_pool_uses_daemon_threads_and_caps_concurrency():
+    pool = endpoints._DaemonJobPool(max_workers=1, thread_name_prefix="test-job")
+    release = threading.Event()
+    started = []
+    done = threading.Semaphore(0)
+
+    def job(n):
+        started.append((n, threading.current_thread().daemon))
+        release.wait(5)
+        done.release()
+
+    pool.submit(job, 1)
+    pool.submit(job, 2)
+    assert not release.wait(0.2)
+    assert started == [(1, True)]
+
+    release.set()
+    assert done.acquire(timeout=5) and done.acquire(timeout=5)
+    assert sorted(started) == [(1, True), (2, True)]
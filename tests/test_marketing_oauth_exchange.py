@@ -0,0 +1,63 @@
+"""Tests for the marketing OAuth code-exchange helpers."""
+
+from __future__ import annotations
+
+import json
+
+from flask import Flask
+
+from bigas.resources.marketing import endpoints
+from bigas.resources.marketing.endpoints import marketing_bp
+
+
+class _FakeResp:
+    def __init__(self, status_code: int, payload: dict):
+        self.status_code = status_code
+        self.content = json.dumps(payload).encode()
+        self.text = self.content.decode()
+        self.headers = {}
+
+
+def _app():
+    app = Flask(__name__)
+    app.register_blueprint(marketing_bp)
+    return app
+
+
+def test_exchange_retry_with_same_code_is_served_from_cache(monkeypatch):
+    monkeypatch.setenv("LINKEDIN_CLIENT_ID", "cid")
+    monkeypatch.setenv("LINKEDIN_CLIENT_SECRET", "secret")
+    monkeypatch.setattr(endpoints, "_exchange_cache", {})
+    calls = []
+
+    def fake_post(*args, **kwargs):
+        calls.append(kwargs)
+        return _FakeResp(200, {"refresh_token": "r", "expires_in": 0})
+
+    monkeypatch.setattr(endpoints.requests, "post", fake_post)
+    client = _app().test_client()
+
+    first = client.post("/mcp/tools/linkedin_exchange_code", json={"code": "abc"})
+    second = client.post("/mcp/tools/linkedin_exchange_code", json={"code": "abc"})
+
+    assert first.status_code == 200
+    assert second.get_json() == first.get_json()
+    assert len(calls) == 1
+
+
+def test_exchange_redirect_uri_uses_first_forwarded_hop(monkeypatch):
+    monkeypatch.setenv("REDDIT_CLIENT_ID", "cid")
+    monkeypatch.setenv("REDDIT_CLIENT_SECRET", "secret")
+    monkeypatch.setattr(endpoints, "_exchange_cache", {})
+    monkeypatch.setattr(
+        endpoints.requests,
+        "post",
+        lambda *a, **k: _FakeResp(200, {"refresh_token": "r"}),
+    )
+    app = _app()
+    resp = app.test_client().post(
+        "/mcp/tools/reddit_exchange_code",
+        json={"code": "xyz"},
+        headers={"X-Forwarded-Proto": "https, http", "X-Forwarded-Host": "example.com"},
+    )
+    assert resp.get_json()["redirect_uri_used"] == "https://example.com/reddit/callback"
@@ -0,0 +1,67 @@
+"""Tests for the resolve_dates decorator used by the ads report handlers."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from flask import Flask, g, jsonify
+
+from bigas.resources.marketing.endpoints import (
+    _DISCOVERY_RELATIVE_RANGES,
+    _resolve_relative_range,
+    resolve_dates,
+)
+
+
+def _app(strict: bool = True):
+    app = Flask(__name__)
+
+    @app.route("/report", methods=["POST"])
+    @resolve_dates(("LAST_7_DAYS", "LAST_30_DAYS"), strict=strict)
+    def report():
+        assert isinstance(g.start_d, date) and isinstance(g.end_d, date)
+        return jsonify({"start": g.start_date_s, "end": g.end_date_s})
+
+    return app
+
+
+def test_relative_range_resolves_to_window_ending_yesterday():
+    app = _app()
+    resp = app.test_client().post("/report", json={"relative_range": "last_7_days"})
+
+    yesterday = datetime.utcnow().date() - timedelta(days=1)
+    assert resp.status_code == 200
+    assert resp.get_json() == {
+        "start": (yesterday - timedelta(days=6)).isoformat(),
+        "end": yesterday.isoformat(),
+    }
+
+
+def test_unknown_range_is_rejected_only_in_strict_mode():
+    app = _app()
+    strict = app.test_client().post("/report", json={"relative_range": "LAST_DAY"})
+    assert strict.status_code == 400
+    assert "LAST_7_DAYS" in strict.get_json()["error"]
+
+    lenient_app = _app(strict=False)
+    lenient = lenient_app.test_client().post("/report", json={"relative_range": "LAST_DAY"})
+    assert lenient.status_code == 200
+
+
+def test_inverted_explicit_range_is_rejected():
+    app = _app()
+    resp = app.test_client().post(
+        "/report", json={"start_date": "2025-02-01", "end_date": "2025-01-01"}
+    )
+    assert resp.status_code == 400
+
+
+def test_discovery_ranges_resolve_and_name_their_parameter():
+    today = date(2025, 6, 1)
+    assert _resolve_relative_range("LAST_90_DAYS", today, _DISCOVERY_RELATIVE_RANGES) == (
+        date(2025, 3, 3),
+        date(2025, 5, 31),
+    )
+    with pytest.raises(ValueError, match="^discovery_relative_range must be one of"):
+        _resolve_relative_range("LAST_DAY", today, _DISCOVERY_RELATIVE_RANGES, "discovery_relative_range")
@@ -0,0 +1,77 @@
+"""Tests for StorageService's ETag-revalidated blob reads."""
+
+from __future__ import annotations
+
+import pytest
+from google.api_core.exceptions import NotModified
+
+from bigas.resources.marketing import storage_service
+from bigas.resources.marketing.storage_service import StorageService
+from bigas.resources.marketing.ttl_cache import TTLCache
+
+
+class _FakeBlob:
+    def __init__(self, store: dict, name: str):
+        self._store = store
+        self.name = name
+        self.etag = None
+
+    def download_as_bytes(self, if_etag_not_match=None):
+        etag, content = self._store[self.name]
+        self._store.setdefault("_downloads", []).append(if_etag_not_match)
+        if if_etag_not_match == etag:
+            raise NotModified("not modified")
+        self.etag = etag
+        return content
+
+    def upload_from_string(self, data, content_type=None):
+        self._store[self.name] = ("etag-new", data)
+
+
+class _FakeBucket:
+    def __init__(self, store: dict):
+        self._store = store
+
+    def blob(self, name: str) -> _FakeBlob:
+        return _FakeBlob(self._store, name)
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    monkeypatch.setattr(storage_service, "_etag_cache", TTLCache(maxsize=8, ttl=60))
+    monkeypatch.setattr(storage_service, "_json_cache", TTLCache(maxsize=8, ttl=60))
+    store = {"a.preview.json": ("etag-1", b'{"n": 1}')}
+    svc = StorageService.__new__(StorageService)
+    svc.bucket_name = "test-bucket"
+    svc.bucket = _FakeBucket(store)
+    return svc, store
+
+
+def test_unchanged_blob_is_revalidated_instead_of_redownloaded(storage):
+    svc, store = storage
+
+    assert svc.get_bytes_if_exists("a.preview.json") == b'{"n": 1}'
+    assert svc.get_bytes_if_exists("a.preview.json") == b'{"n": 1}'
+    assert store["_downloads"] == [None, "etag-1"]
+
+
+def test_changed_blob_is_downloaded_again(storage):
+    svc, store = storage
+
+    svc.get_bytes_if_exists("a.preview.json")
+    store["a.preview.json"] = ("etag-2", b'{"n": 2}')
+
+    assert svc.get_json_if_exists("a.preview.json") == {"n": 2}
+
+
+def test_get_json_cached_reads_once_until_the_blob_is_rewritten(storage, monkeypatch):
+    svc, _ = storage
+    reads = []
+    monkeypatch.setattr(svc, "get_json_if_exists", lambda name: reads.append(name) or {"n": len(reads)})
+
+    assert svc.get_json_cached("a.json") == {"n": 1}
+    assert svc.get_json_cached("a.json") == {"n": 1}
+    assert reads == ["a.json"]
+
+    svc.store_json("a.json", {"n": 0})
+    assert svc.get_json_cached("a.json") == {"n": 2}
@@ -0,0 +1,37 @@
+"""Tests for the process-local TTL cache used by the marketing endpoints."""
+
+from __future__ import annotations
+
+from bigas.resources.marketing import ttl_cache
+from bigas.resources.marketing.ttl_cache import TTLCache
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    now[0] += 11
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # touch "a" so "b" is the LRU entry
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_per_entry_ttl_and_pop():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1, ttl=0)
+    assert cache.get("a", "missing") == "missing"
+    cache.set("b", 2)
+    assert cache.pop("b") == 2
+    assert cache.get("b") is None